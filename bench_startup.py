@@ -0,0 +1,64 @@
+"""
+시작 시간 벤치마크 — 경로별 import 비용 비교
+사용: python bench_startup.py [-n 반복횟수]
+
+  interpreter : 파이썬 자체 기동 (기준선)
+  core        : import nexus.core        (스크립트 / 도구)
+  cli         : import nexus.cli         (python main.py batch)
+  gui         : import main              (PyQt6 위젯 전체 로드)
+
+각 경로를 새 프로세스로 n회 실행해 중앙값을 보여줍니다.
+"""
+
+import sys
+import time
+import argparse
+import statistics
+import subprocess
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent
+
+TARGETS = {
+    "interpreter": "pass",
+    "core":        "import nexus.core",
+    "cli":         "import nexus.cli",
+    "gui":         "import main",
+}
+
+
+def measure(code: str, runs: int) -> list[float] | str:
+    """새 프로세스에서 code 실행 시간(ms) 목록. 실패하면 오류 마지막 줄."""
+    times = []
+    for _ in range(runs):
+        t0 = time.perf_counter()
+        proc = subprocess.run(
+            [sys.executable, "-c", code], cwd=ROOT, capture_output=True, text=True
+        )
+        times.append((time.perf_counter() - t0) * 1000)
+        if proc.returncode != 0:
+            lines = proc.stderr.strip().splitlines()
+            return lines[-1] if lines else f"exit {proc.returncode}"
+    return times
+
+
+def main():
+    parser = argparse.ArgumentParser(description="NEXUS 시작 시간 벤치마크")
+    parser.add_argument("-n", "--runs", type=int, default=10, help="경로별 반복 횟수 (기본 10)")
+    args = parser.parse_args()
+
+    print(f"{'경로':<12} {'중앙값':>10} {'최소':>10} {'기준선 제외':>12}")
+    base = None
+    for name, code in TARGETS.items():
+        result = measure(code, args.runs)
+        if isinstance(result, str):
+            print(f"{name:<12} 실패: {result}")
+            continue
+        med = statistics.median(result)
+        if base is None:
+            base = med
+        print(f"{name:<12} {med:>8.1f}ms {min(result):>8.1f}ms {med - base:>10.1f}ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -4,29 +4,84 @@ NEXUS — NLE 통합 관제 플랫폼
 """
 
 import sys
-import re
-import json
-import uuid
-import shutil
-import subprocess
+import time
+import threading
 import platform
 from datetime import datetime
 from pathlib import Path
+from typing import Callable
 
-APP_NAME    = "NEXUS"
-APP_TAGLINE = "NLE 통합 관제 플랫폼"
-APP_VERSION = "1.1.0"
-RECENT_LIMIT = 10  # 최근 프로젝트 표시 최대 개수
+_T0 = time.perf_counter()
+
+
+class StartupTrace:
+    """
+    --profile-startup: 시작 단계별 소요 시간 기록 → 첫 화면이 그려지면 한 번에 출력.
+    목표: 첫 프레임까지 300ms 이내.
+    """
+
+    def __init__(self, enabled: bool):
+        self.enabled  = enabled
+        self._last    = _T0
+        self._marks: list[tuple[str, float, float]] = []   # (단계, 단계 ms, 누적 ms)
+        self._reported = False
+
+    def mark(self, phase: str):
+        if not self.enabled or self._reported:
+            return
+        now = time.perf_counter()
+        self._marks.append((phase, (now - self._last) * 1000, (now - _T0) * 1000))
+        self._last = now
+
+    def note(self, label: str, ms: float):
+        """첫 프레임 이후 작업 (지연 생성 페이지 등) — 바로 출력"""
+        if self.enabled:
+            print(f"[startup] {label:<24} {ms:8.1f}ms")
+
+    def report(self):
+        if not self.enabled or self._reported:
+            return
+        self._reported = True
+        for phase, ms, total in self._marks:
+            print(f"[startup] {phase:<24} {ms:8.1f}ms   (누적 {total:7.1f}ms)")
+        total = self._marks[-1][2] if self._marks else 0.0
+        verdict = "OK" if total < 300 else "초과"
+        print(f"[startup] 첫 프레임까지 {total:.1f}ms  — 목표 300ms {verdict}")
+
+
+startup_trace = StartupTrace("--profile-startup" in sys.argv)
+
+# GUI 모듈(PyQt6)을 불러오기 전에 분기 — 디스플레이 / PyQt6 없는 환경에서도 CLI 동작
+# (옵션이 아닌 첫 인자는 모두 CLI 명령으로 — 오타도 GUI 대신 사용법 출력)
+if __name__ == "__main__" and sys.argv[1:2] and not sys.argv[1].startswith("-"):
+    from nexus.cli import cli_main
+    sys.exit(cli_main(sys.argv[1:]))
 
 from PyQt6.QtWidgets import (
     QApplication, QMainWindow, QWidget, QHBoxLayout, QVBoxLayout,
     QLabel, QPushButton, QFrame, QStackedWidget, QLineEdit,
     QComboBox, QFileDialog, QScrollArea, QTreeWidget, QTreeWidgetItem,
     QMessageBox, QSizePolicy, QSpacerItem, QGridLayout, QCheckBox,
-    QDialog, QTextEdit, QDialogButtonBox
+    QDialog, QTextEdit, QDialogButtonBox, QListView, QAbstractItemView,
+    QStyledItemDelegate, QMenu
+)
+from PyQt6.QtCore import (
+    Qt, QSize, QRect, QRectF, QEvent, QModelIndex, QAbstractListModel,
+    QObject, QRunnable, QThreadPool, QFileSystemWatcher, QTimer, QPoint, pyqtSignal
+)
+from PyQt6.QtGui import QFont, QFontMetrics, QColor, QPalette, QIcon, QCursor, QPainter, QPen
+startup_trace.mark("import PyQt6")
+
+from nexus.core import (
+    APP_NAME, APP_TAGLINE, APP_VERSION, FOLDER_PRESETS, FolderTree, folder_tree,
+    ProjectManager, launch_app, open_folder,
+    create_premiere_project, create_ae_project,
+    setup_resolve_bins, setup_resolve_with_launch, resolve_import_drp,
+    get_project_versions, create_smart_snapshot, restore_version, detect_project_nles,
+    measure_project_usage, format_size, USAGE_ROOT_FILES,
+    InotifyWatcher, ProjectCrawler,
 )
-from PyQt6.QtCore import Qt, QSize, QThread, pyqtSignal
-from PyQt6.QtGui import QFont, QColor, QPalette, QIcon, QCursor
+startup_trace.mark("import nexus.core")
 
 # ─────────────────────────────────────────────
 # 색상 팔레트
@@ -55,830 +110,73 @@ COLORS = {
     "danger":    "#ff4d4d",
 }
 
-# ─────────────────────────────────────────────
-# 폴더 프리셋 (프로젝트 타입별)
-# ─────────────────────────────────────────────
-FOLDER_PRESETS = {
-    "광고": [
-        "01_FOOTAGE/RAW",
-        "01_FOOTAGE/SELECTS",
-        "02_AUDIO/MUSIC",
-        "02_AUDIO/SFX",
-        "02_AUDIO/VO",
-        "03_GRAPHICS/AE_Projects",
-        "03_GRAPHICS/Motion",
-        "04_EDIT/Sequences",
-        "04_EDIT/Exports",
-        "05_DELIVERY/Master",
-        "05_DELIVERY/Social",
-        "06_DOCS/Brief",
-        "06_DOCS/Scripts",
-    ],
-    "다큐": [
-        "01_FOOTAGE/Camera_A",
-        "01_FOOTAGE/Camera_B",
-        "01_FOOTAGE/Archive",
-        "01_FOOTAGE/SELECTS",
-        "02_AUDIO/Interview",
-        "02_AUDIO/Ambient",
-        "02_AUDIO/Music",
-        "03_GRAPHICS/Titles",
-        "04_EDIT/Sequences",
-        "04_EDIT/Exports",
-        "05_DELIVERY/Master",
-        "05_DELIVERY/Online",
-        "06_DOCS/Research",
-        "06_DOCS/Scripts",
-    ],
-    "MV": [
-        "01_FOOTAGE/RAW",
-        "01_FOOTAGE/SELECTS",
-        "02_AUDIO/Reference",
-        "02_AUDIO/Stems",
-        "03_GRAPHICS/AE_Projects",
-        "03_GRAPHICS/VFX",
-        "04_EDIT/Sequences",
-        "04_EDIT/Exports",
-        "05_DELIVERY/Master",
-        "05_DELIVERY/YouTube",
-        "05_DELIVERY/Instagram",
-        "06_DOCS/Concept",
-        "06_DOCS/Lyrics",
-    ],
-    "단편": [
-        "01_FOOTAGE/RAW",
-        "01_FOOTAGE/SELECTS",
-        "02_AUDIO/Production",
-        "02_AUDIO/Music",
-        "02_AUDIO/SFX",
-        "02_AUDIO/Dialogue",
-        "03_GRAPHICS/Titles",
-        "04_EDIT/Sequences",
-        "04_EDIT/Exports",
-        "05_DELIVERY/DCP",
-        "05_DELIVERY/Online",
-        "06_DOCS/Script",
-        "06_DOCS/Schedule",
-    ],
-    "이벤트": [
-        "01_FOOTAGE/Main_Stage",
-        "01_FOOTAGE/Behind",
-        "01_FOOTAGE/SELECTS",
-        "02_AUDIO/Sync",
-        "02_AUDIO/Music",
-        "03_GRAPHICS/Intro",
-        "03_GRAPHICS/Lower_Thirds",
-        "04_EDIT/Sequences",
-        "04_EDIT/Exports",
-        "05_DELIVERY/Highlight",
-        "05_DELIVERY/Full",
-        "06_DOCS/Runsheet",
-    ],
-    "유튜브": [
-        "01_FOOTAGE/RAW",
-        "01_FOOTAGE/SELECTS",
-        "02_AUDIO/BGM",
-        "02_AUDIO/SFX",
-        "02_AUDIO/VO",
-        "03_GRAPHICS/Thumbnail",
-        "03_GRAPHICS/Intro_Outro",
-        "04_EDIT/Sequences",
-        "04_EDIT/Exports",
-        "05_DELIVERY/YouTube",
-        "05_DELIVERY/Shorts",
-        "06_DOCS/Script",
-    ],
-}
 
 # ─────────────────────────────────────────────
-# Resolve 기술 스펙 매핑 테이블
+# 백그라운드 작업 (QThreadPool)
 # ─────────────────────────────────────────────
-_RESOLVE_RESOLUTION_MAP: dict[str, tuple[str, str]] = {
-    "4K UHD (3840×2160)":   ("3840", "2160"),
-    "2K DCI (2048×1080)":   ("2048", "1080"),
-    "FHD (1920×1080)":      ("1920", "1080"),
-    "HD (1280×720)":        ("1280", "720"),
-    "Vertical (1080×1920)": ("1080", "1920"),
-}
-
-# (colorScienceMode, colorSpaceTimeline)
-_RESOLVE_COLORSPACE_MAP: dict[str, tuple[str, str]] = {
-    "DaVinci Wide Gamut":  ("davinciYRGBColorManagedv2", "DaVinci WG/Intermediate"),
-    "Rec. 709":            ("davinciYRGB",               "Rec.709 Gamma 2.4"),
-    "Rec. 2020":           ("davinciYRGB",               "Rec.2020"),
-    "S-Gamut3.Cine":       ("davinciYRGB",               "S-Gamut3.Cine/S-Log3"),
-    "ARRI Wide Gamut 4":   ("davinciYRGB",               "ARRI LogC4/LogC4"),
-    "P3-D65":              ("davinciYRGB",               "P3-D65/ST.2084"),
-}
-
-_RESOLVE_SAMPLERATE_MAP: dict[str, str] = {
-    "48 kHz":   "48000",
-    "44.1 kHz": "44100",
-    "96 kHz":   "96000",
-}
+class JobSignals(QObject):
+    progress = pyqtSignal(str, str)         # (작업 키, 진행 상태 텍스트)
+    finished = pyqtSignal(str, bool, str)   # (작업 키, 성공여부, 메시지)
 
 
-# ─────────────────────────────────────────────
-# ProjectManager
-# ─────────────────────────────────────────────
-class ProjectManager:
-    """프로젝트 데이터 관리 (저장/불러오기/CRUD)"""
-
-    DATA_DIR: Path = (
-        Path.home() / "Library" / "Application Support" / "VideoProjectSetup"
-        if platform.system() == "Darwin"
-        else Path.home() / "AppData" / "Roaming" / "VideoProjectSetup"
-        if platform.system() == "Windows"
-        else Path.home() / ".config" / "VideoProjectSetup"
-    )
-
-    def __init__(self):
-        self.DATA_DIR.mkdir(parents=True, exist_ok=True)
-        self._file = self.DATA_DIR / "projects.json"
-        self._settings_file = self.DATA_DIR / "settings.json"
-        self.projects: list[dict] = []
-        self.settings: dict = {}
-        self.load()
-
-    def load(self):
-        if self._file.exists():
-            try:
-                self.projects = json.loads(self._file.read_text(encoding="utf-8"))
-            except Exception:
-                self.projects = []
-        if self._settings_file.exists():
-            try:
-                self.settings = json.loads(self._settings_file.read_text(encoding="utf-8"))
-            except Exception:
-                self.settings = {}
-
-    def save(self):
-        self._file.write_text(
-            json.dumps(self.projects, ensure_ascii=False, indent=2),
-            encoding="utf-8"
-        )
-
-    def save_settings(self):
-        self._settings_file.write_text(
-            json.dumps(self.settings, ensure_ascii=False, indent=2),
-            encoding="utf-8"
-        )
-
-    def add(self, project: dict) -> dict:
-        project["id"] = str(uuid.uuid4())
-        project["created_at"] = datetime.now().isoformat()
-        project["last_opened"] = project["created_at"]
-        self.projects.insert(0, project)
-        self.save()
-        return project
-
-    def delete(self, project_id: str):
-        self.projects = [p for p in self.projects if p.get("id") != project_id]
-        self.save()
-
-    def update_last_opened(self, project_id: str):
-        for p in self.projects:
-            if p.get("id") == project_id:
-                p["last_opened"] = datetime.now().isoformat()
-                break
-        self.save()
-
-    def create_folders(self, project: dict) -> bool:
-        """프리셋(또는 커스텀) 폴더 생성 + project.json 저장"""
-        try:
-            base = Path(project["location"]) / project["name"]
-            folders = (
-                project.get("folders")
-                or FOLDER_PRESETS.get(project.get("type", "유튜브"), FOLDER_PRESETS["유튜브"])
-            )
-            for folder in folders:
-                (base / folder).mkdir(parents=True, exist_ok=True)
-            # 메타데이터 저장
-            meta = {k: v for k, v in project.items() if k != "id"}
-            (base / "project.json").write_text(
-                json.dumps(meta, ensure_ascii=False, indent=2),
-                encoding="utf-8"
-            )
-            return True
-        except Exception as e:
-            print(f"[ERROR] create_folders: {e}")
-            return False
-
-    def get_default_location(self) -> str:
-        return self.settings.get("default_location", str(Path.home() / "Movies"))
-
-    def set_default_location(self, path: str):
-        self.settings["default_location"] = path
-        self.save_settings()
-
-    def get_custom_preset(self, project_type: str) -> list[str] | None:
-        """커스텀 폴더 프리셋 반환. 설정 없으면 None."""
-        return self.settings.get("custom_presets", {}).get(project_type)
-
-    def set_custom_preset(self, project_type: str, folders: list[str] | None):
-        """커스텀 폴더 프리셋 저장. folders=None이면 기본값으로 복원."""
-        if "custom_presets" not in self.settings:
-            self.settings["custom_presets"] = {}
-        if folders is None:
-            self.settings["custom_presets"].pop(project_type, None)
-        else:
-            self.settings["custom_presets"][project_type] = folders
-        self.save_settings()
-
-    def get_nle_override(self, app_key: str) -> str:
-        """사용자가 수동으로 지정한 NLE 경로 반환"""
-        return self.settings.get(f"nle_{app_key}", "")
-
-    def set_nle_override(self, app_key: str, path: str):
-        self.settings[f"nle_{app_key}"] = path
-        self.save_settings()
-
-    def validate_project(self, project: dict) -> tuple[bool, str]:
-        """프로젝트 생성 전 유효성 검사. (bool, 오류메시지) 반환"""
-        name = project.get("name", "").strip()
-        location = project.get("location", "").strip()
-
-        if not name:
-            return False, "프로젝트 이름을 입력해주세요."
-
-        # Windows 금지 문자 체크
-        forbidden = set(r'\/:*?"<>|')
-        bad_chars = [c for c in name if c in forbidden]
-        if bad_chars:
-            return False, f"프로젝트 이름에 사용할 수 없는 문자가 포함되어 있습니다: {'  '.join(bad_chars)}"
-
-        if not location:
-            return False, "저장 위치를 선택해주세요."
-        if not Path(location).exists():
-            return False, f"저장 위치가 존재하지 않습니다:\n{location}"
-
-        return True, ""
-
-
-# ─────────────────────────────────────────────
-# NLE 앱 감지
-# ─────────────────────────────────────────────
-def find_app(app_name: str, override_path: str = "") -> str | None:
-    """설치된 NLE 앱 경로 반환 (없으면 None). 수동 지정 경로 우선."""
-    if override_path and Path(override_path).exists():
-        return override_path
-
-    os_name = platform.system()
-    # 가장 최신 버전부터 탐색 (2026→2022)
-    years = list(range(2026, 2021, -1))
-
-    paths: dict[str, dict[str, list[str]]] = {
-        "Resolve": {
-            "Darwin": [
-                "/Applications/DaVinci Resolve/DaVinci Resolve.app",
-            ],
-            "Windows": [
-                r"C:\Program Files\Blackmagic Design\DaVinci Resolve\Resolve.exe",
-            ],
-        },
-        "Premiere": {
-            "Darwin": [
-                f"/Applications/Adobe Premiere Pro {y}/Adobe Premiere Pro {y}.app"
-                for y in years
-            ],
-            "Windows": [
-                rf"C:\Program Files\Adobe\Adobe Premiere Pro {y}\Adobe Premiere Pro.exe"
-                for y in years
-            ],
-        },
-        "AE": {
-            "Darwin": [
-                f"/Applications/Adobe After Effects {y}/Adobe After Effects {y}.app"
-                for y in years
-            ],
-            "Windows": [
-                rf"C:\Program Files\Adobe\Adobe After Effects {y}\AfterFX.exe"
-                for y in years
-            ],
-        },
-    }
-
-    for path_str in paths.get(app_name, {}).get(os_name, []):
-        if Path(path_str).exists():
-            return path_str
-    return None
-
-
-def launch_app(app_name: str, app_path: str | None = None, manager: "ProjectManager | None" = None) -> bool:
-    """NLE 앱 실행"""
-    override = manager.get_nle_override(app_name) if manager else ""
-    path = app_path or find_app(app_name, override)
-    if not path:
-        return False
-    try:
-        if platform.system() == "Darwin":
-            subprocess.Popen(["open", path])
-        else:
-            subprocess.Popen([path])
-        return True
-    except Exception as e:
-        print(f"[ERROR] launch_app: {e}")
-        return False
-
-
-def open_folder(folder_path: str):
-    """파일 탐색기로 폴더 열기"""
-    try:
-        if platform.system() == "Darwin":
-            subprocess.Popen(["open", folder_path])
-        elif platform.system() == "Windows":
-            subprocess.Popen(["explorer", folder_path])
-        else:
-            subprocess.Popen(["xdg-open", folder_path])
-    except Exception as e:
-        print(f"[ERROR] open_folder: {e}")
-
-
-# ─────────────────────────────────────────────
-# NLE 프로젝트 / 빈 자동 생성
-# ─────────────────────────────────────────────
-
-def _jsx_bins_premiere(folders: list[str], project_name: str, prproj_path: str) -> str:
-    """Premiere Pro ExtendScript: 새 프로젝트 생성 + 빈 트리 구성"""
-    safe_path = prproj_path.replace("\\", "/")
-    lines = [
-        "// VPS Auto-generated — Adobe Premiere Pro Setup",
-        f'// Project: {project_name}',
-        "",
-        f'app.newProject("{safe_path}");',
-        "var root = app.project.rootItem;",
-        "",
-    ]
-    var_map: dict[str, str] = {}
-    counter = [0]
-
-    for path in folders:
-        parts = path.split("/")
-        cumulative = ""
-        parent_var = "root"
-        for part in parts:
-            cumulative = f"{cumulative}/{part}" if cumulative else part
-            if cumulative not in var_map:
-                counter[0] += 1
-                vname = f"b{counter[0]}"
-                var_map[cumulative] = vname
-                safe = part.replace('"', '\\"')
-                lines.append(f'var {vname} = {parent_var}.createBin("{safe}");')
-            parent_var = var_map[cumulative]
-
-    lines += [
-        "",
-        "app.project.save();",
-        f'$.writeln("VPS: {project_name} 생성 완료");',
-    ]
-    return "\n".join(lines)
-
-
-def _jsx_bins_ae(folders: list[str], project_name: str, aep_path: str) -> str:
-    """After Effects ExtendScript: 새 프로젝트 생성 + 폴더 트리 구성"""
-    safe_path = aep_path.replace("\\", "/")
-    lines = [
-        "// VPS Auto-generated — Adobe After Effects Setup",
-        f'// Project: {project_name}',
-        "",
-        "app.newProject();",
-        "",
-        "function mkFolder(name) { return app.project.items.addFolder(name); }",
-        "",
-    ]
-    var_map: dict[str, str] = {}
-    counter = [0]
-
-    for path in folders:
-        parts = path.split("/")
-        cumulative = ""
-        for i, part in enumerate(parts):
-            cumulative = f"{cumulative}/{part}" if cumulative else part
-            if cumulative not in var_map:
-                counter[0] += 1
-                vname = f"f{counter[0]}"
-                var_map[cumulative] = vname
-                safe = part.replace('"', '\\"')
-                lines.append(f'var {vname} = mkFolder("{safe}");')
-                if i > 0:
-                    parent_key = "/".join(parts[:i])
-                    parent_var = var_map.get(parent_key, "")
-                    if parent_var:
-                        lines.append(f"{vname}.parentFolder = {parent_var};")
-
-    lines += [
-        "",
-        f'var saveFile = new File("{safe_path}");',
-        "app.project.save(saveFile);",
-        f'alert("VPS: {project_name}.aep 생성 완료!");',
-    ]
-    return "\n".join(lines)
-
-
-def create_premiere_project(project: dict, base_path: Path) -> tuple[bool, str]:
-    """
-    Premiere Pro 프로젝트 자동 생성.
-    JSX 스크립트를 생성하고 실행 중인 Premiere에 osascript로 전달 (macOS).
-    """
-    name = project["name"]
-    prproj_path = base_path / f"{name}.prproj"
-    jsx_path = base_path / f"_setup_premiere.jsx"
-
-    folders = project.get("folders") or FOLDER_PRESETS.get(project.get("type", "유튜브"), [])
-    jsx_path.write_text(
-        _jsx_bins_premiere(folders, name, str(prproj_path)),
-        encoding="utf-8"
-    )
-
-    if platform.system() == "Darwin":
-        premiere_path = find_app("Premiere")
-        if premiere_path:
-            app_stem = Path(premiere_path).stem
-            osa = f'tell application "{app_stem}" to do script "{str(jsx_path)}"'
-            result = subprocess.run(
-                ["osascript", "-e", osa],
-                capture_output=True, text=True, timeout=10
-            )
-            if result.returncode == 0:
-                return True, f"Premiere 빈 구성 완료 → {prproj_path.name}"
-
-    # Windows 또는 osascript 실패 → 수동 안내
-    return True, (
-        f"JSX 스크립트 생성됨: {jsx_path.name}\n"
-        "Premiere 실행 후 File > Scripts > Browse 로 직접 실행하세요."
-    )
-
-
-def create_ae_project(project: dict, base_path: Path) -> tuple[bool, str]:
+class Job(QRunnable):
     """
-    After Effects 프로젝트 자동 생성.
-    JSX 생성 후 afterfx 바이너리를 -r flag로 실행.
+    QThreadPool에서 실행되는 작업 1개.
+    fn(progress) → (성공여부, 메시지). progress(text)는 어느 스레드에서 불러도 됩니다 (시그널로 전달).
     """
-    name = project["name"]
-    aep_path = base_path / f"{name}.aep"
-    jsx_path = base_path / f"_setup_ae.jsx"
-
-    folders = project.get("folders") or FOLDER_PRESETS.get(project.get("type", "유튜브"), [])
-    jsx_path.write_text(
-        _jsx_bins_ae(folders, name, str(aep_path)),
-        encoding="utf-8"
-    )
-
-    ae_app = find_app("AE")
-    ae_bin: str | None = None
-    if ae_app:
-        if platform.system() == "Darwin":
-            candidates = list(Path(ae_app).glob("Contents/MacOS/After Effects*"))
-            if candidates:
-                ae_bin = str(candidates[0])
-        else:
-            ae_bin = ae_app  # Windows: .exe 직접
-
-    if ae_bin and Path(ae_bin).exists():
-        subprocess.Popen([ae_bin, "-r", str(jsx_path)])
-        return True, f"AE 실행 중 — 스크립트로 {name}.aep 자동 생성됩니다"
-
-    return True, (
-        f"JSX 스크립트 생성됨: {jsx_path.name}\n"
-        "AE 실행 후 File > Scripts > Run Script File 로 직접 실행하세요."
-    )
-
-
-def setup_resolve_bins(project: dict, base_path: Path | None = None) -> tuple[bool, str]:
-    """
-    DaVinci Resolve Python Scripting API로 프로젝트 + 빈 트리 생성.
-    base_path 지정 시 .drp 아카이브를 해당 폴더에 내보냄 (Resolve 미실행 시 import 가능).
-    Resolve가 실행 중이어야 합니다.
-    """
-    if platform.system() == "Darwin":
-        modules_path = (
-            "/Library/Application Support/Blackmagic Design"
-            "/DaVinci Resolve/Developer/Scripting/Modules"
-        )
-    elif platform.system() == "Windows":
-        modules_path = (
-            r"C:\ProgramData\Blackmagic Design\DaVinci Resolve"
-            r"\Support\Developer\Scripting\Modules"
-        )
-    else:
-        return False, "지원하지 않는 OS입니다"
-
-    if not Path(modules_path).exists():
-        return False, f"Resolve Scripting Modules 없음:\n{modules_path}"
-
-    if modules_path not in sys.path:
-        sys.path.insert(0, modules_path)
-
-    try:
-        import DaVinciResolveScript as dvr_script  # type: ignore
-    except ImportError as e:
-        return False, f"DaVinciResolveScript 임포트 실패: {e}"
 
-    try:
-        resolve = dvr_script.scriptapp("Resolve")
-    except Exception as e:
-        return False, f"Resolve 연결 오류: {e}"
-
-    if not resolve:
-        return False, "Resolve가 실행 중이지 않거나 응답이 없습니다\n(Resolve를 먼저 실행해주세요)"
-
-    pm = resolve.GetProjectManager()
-    if not pm:
-        return False, "ProjectManager를 가져올 수 없습니다"
-
-    name = project["name"]
-    new_proj = pm.CreateProject(name)
-    if not new_proj:
-        return False, f"프로젝트 '{name}' 생성 실패\n(이름 중복 또는 권한 문제)"
-
-    media_pool = new_proj.GetMediaPool()
-    root_folder = media_pool.GetRootFolder()
-    folders = project.get("folders") or FOLDER_PRESETS.get(project.get("type", "유튜브"), [])
-    _resolve_bin_tree(media_pool, root_folder, folders)
-
-    # 기술 스펙 전체 적용 (해상도 / FPS / 색상 공간 / 샘플 레이트)
-    _apply_resolve_settings(new_proj, project.get("spec", {}))
+    def __init__(self, key: str, fn: Callable[[Callable[[str], None]], tuple[bool, str]]):
+        super().__init__()
+        self.key     = key
+        self.fn      = fn
+        self.signals = JobSignals()
 
-    # .drp 아카이브 내보내기 (로컬 import용)
-    drp_exported = False
-    if base_path:
-        drp_path = base_path / f"{name}.drp"
-        try:
-            drp_exported = pm.ExportProject(name, str(drp_path), False)
-        except Exception:
-            pass
-
-    msg = f"Resolve 프로젝트 '{name}' + 빈 구조 생성 완료"
-    if drp_exported:
-        msg += f"\n📦 {name}.drp 저장됨 (나중에 File > Import Project로 불러올 수 있습니다)"
-    return True, msg
-
-
-def _apply_resolve_settings(proj_obj, spec: dict):
-    """Resolve 프로젝트에 기술 스펙(해상도/FPS/색상공간/샘플레이트) 적용"""
-    # 해상도
-    res_str = spec.get("resolution", "")
-    if res_str in _RESOLVE_RESOLUTION_MAP:
-        w, h = _RESOLVE_RESOLUTION_MAP[res_str]
-        try:
-            proj_obj.SetSetting("timelineResolutionWidth", w)
-            proj_obj.SetSetting("timelineResolutionHeight", h)
-        except Exception:
-            pass
-
-    # FPS (23.976, 29.97 등 소수점 포함 문자열 그대로 전달)
-    fps_str = spec.get("fps", "")
-    if fps_str:
-        try:
-            proj_obj.SetSetting("timelineFrameRate", fps_str)
-        except Exception:
-            pass
-
-    # 색상 공간
-    cs_str = spec.get("colorspace", "")
-    if cs_str in _RESOLVE_COLORSPACE_MAP:
-        science_mode, timeline_cs = _RESOLVE_COLORSPACE_MAP[cs_str]
-        try:
-            proj_obj.SetSetting("colorScienceMode", science_mode)
-            proj_obj.SetSetting("colorSpaceTimeline", timeline_cs)
-        except Exception:
-            pass
-
-    # 오디오 샘플 레이트
-    sr_str = spec.get("samplerate", "")
-    if sr_str in _RESOLVE_SAMPLERATE_MAP:
+    def run(self):
         try:
-            proj_obj.SetSetting("timelineAudioSampleRate", _RESOLVE_SAMPLERATE_MAP[sr_str])
-        except Exception:
-            pass
-
-
-def _resolve_bin_tree(media_pool, parent_folder, folder_paths: list[str]):
-    """폴더 경로 리스트로 Resolve 빈 트리 생성"""
-    created: dict[str, object] = {}
-    for path in folder_paths:
-        parts = path.split("/")
-        cur = parent_folder
-        cumulative = ""
-        for part in parts:
-            cumulative = f"{cumulative}/{part}" if cumulative else part
-            if cumulative not in created:
-                new_bin = media_pool.AddSubFolder(cur, part)
-                created[cumulative] = new_bin
-            cur = created[cumulative]
-
-
-# ─────────────────────────────────────────────
-# 버전 스냅샷 관리
-# ─────────────────────────────────────────────
-
-def get_project_versions(folder: Path, name: str) -> list[dict]:
-    """
-    프로젝트 폴더에서 버전 파일 탐색.
-    패턴: ProjectName_V001.drp, ProjectName_V002.drp ...
-    최신 버전 순으로 정렬해서 반환.
-    """
-    pattern = re.compile(rf'^{re.escape(name)}_V(\d+)\.drp$', re.IGNORECASE)
-    versions = []
-    for drp in folder.glob("*.drp"):
-        m = pattern.match(drp.name)
-        if m:
-            stat = drp.stat()
-            versions.append({
-                "version":  int(m.group(1)),
-                "path":     drp,
-                "size_mb":  stat.st_size / (1024 * 1024),
-                "modified": datetime.fromtimestamp(stat.st_mtime),
-                "label":    f"V{int(m.group(1)):03d}",
-            })
-    return sorted(versions, key=lambda v: v["version"], reverse=True)
-
-
-def create_smart_snapshot(project: dict) -> tuple[bool, str]:
-    """
-    스마트 스냅샷: 실행 중인 Resolve에서 현재 프로젝트 상태를 API로 내보낸 후 버전 파일로 저장.
-    Resolve가 실행 중이지 않거나 해당 프로젝트가 열려있지 않으면 기존 .drp 파일 복사로 폴백.
-    """
-    folder = Path(project.get("location", "")) / project.get("name", "")
-    name   = project.get("name", "")
-    drp    = folder / f"{name}.drp"
-
-    existing = get_project_versions(folder, name)
-    next_v   = (max(v["version"] for v in existing) + 1) if existing else 1
-    target   = folder / f"{name}_V{next_v:03d}.drp"
-
-    # 1단계: Resolve API로 현재 상태 직접 내보내기 시도
-    export_note = ""
-    exported = False
-    try:
-        if platform.system() == "Darwin":
-            mpath = ("/Library/Application Support/Blackmagic Design"
-                     "/DaVinci Resolve/Developer/Scripting/Modules")
-        elif platform.system() == "Windows":
-            mpath = (r"C:\ProgramData\Blackmagic Design\DaVinci Resolve"
-                     r"\Support\Developer\Scripting\Modules")
-        else:
-            mpath = ""
-        if mpath and Path(mpath).exists():
-            if mpath not in sys.path:
-                sys.path.insert(0, mpath)
-            import DaVinciResolveScript as dvr_script  # type: ignore
-            resolve = dvr_script.scriptapp("Resolve")
-            if resolve:
-                pm = resolve.GetProjectManager()
-                if pm:
-                    cur = pm.GetCurrentProject()
-                    if cur and cur.GetName() == name:
-                        # 현재 열린 프로젝트와 이름이 일치 → API로 직접 내보내기
-                        ok = pm.ExportProject(name, str(target), False)
-                        if ok:
-                            exported = True
-                            export_note = "  [Resolve 현재 작업 상태]"
-                    elif cur:
-                        export_note = f"\n⚠ Resolve에 '{cur.GetName()}' 프로젝트가 열려 있어 파일 복사로 대체했습니다."
-    except Exception:
-        pass
-
-    # 2단계: Resolve 내보내기 실패 → 기존 .drp 파일 복사 폴백
-    if not exported:
-        if not drp.exists():
-            return False, (
-                f"{name}.drp 파일을 찾을 수 없습니다.\n"
-                "Resolve에서 해당 프로젝트를 열고 스냅샷을 생성해주세요."
-            )
-        shutil.copy2(drp, target)
-
-    size_mb = target.stat().st_size / (1024 * 1024)
-    return True, f"스냅샷 저장됨: {target.name}  ({size_mb:.1f} MB){export_note}"
-
-
-# 하위 호환 별칭 (restore_version 내부에서 호출)
-def create_version_snapshot(project: dict) -> tuple[bool, str]:
-    return create_smart_snapshot(project)
+            ok, msg = self.fn(lambda text: self.signals.progress.emit(self.key, text))
+        except Exception as e:
+            ok, msg = False, f"오류: {e}"
+        self.signals.finished.emit(self.key, ok, msg)
 
 
-def restore_version(version_path: Path, project: dict) -> tuple[bool, str]:
-    """
-    선택한 버전의 .drp를 현재 ProjectName.drp로 복원 (덮어쓰기).
-    복원 전 현재 상태를 자동 백업.
-    """
-    folder = Path(project.get("location", "")) / project.get("name", "")
-    name   = project.get("name", "")
-    drp    = folder / f"{name}.drp"
-
-    # 복원 전 현재 상태 백업
-    if drp.exists():
-        backup_ok, backup_msg = create_version_snapshot(project)
-        if not backup_ok:
-            return False, f"복원 전 백업 실패: {backup_msg}"
-
-    shutil.copy2(version_path, drp)
-    return True, (
-        f"{version_path.name} → {name}.drp 복원 완료\n"
-        "Resolve에서 File > Import Project로 복원된 파일을 불러오세요."
-    )
-
-
-def detect_project_nles(project: dict) -> set[str]:
-    """프로젝트 폴더의 파일 존재 여부로 NLE 사용 여부 탐지"""
-    folder = Path(project.get("location", "")) / project.get("name", "")
-    name   = project.get("name", "")
-    nles: set[str] = set()
-    if not folder.exists():
-        return nles
-    if (folder / f"{name}.drp").exists() or any(folder.glob(f"{name}_V*.drp")):
-        nles.add("Resolve")
-    if any(folder.glob(f"{name}*.prproj")):
-        nles.add("Premiere")
-    if any(folder.glob(f"{name}*.aep")):
-        nles.add("AE")
-    return nles
-
-
-def _resolve_import_drp(drp_path: str) -> tuple[bool, str]:
-    """실행 중인 Resolve에 .drp 파일을 API로 import"""
-    if platform.system() == "Darwin":
-        modules_path = (
-            "/Library/Application Support/Blackmagic Design"
-            "/DaVinci Resolve/Developer/Scripting/Modules"
-        )
-    elif platform.system() == "Windows":
-        modules_path = (
-            r"C:\ProgramData\Blackmagic Design\DaVinci Resolve"
-            r"\Support\Developer\Scripting\Modules"
-        )
-    else:
-        return False, "지원하지 않는 OS"
-
-    if not Path(modules_path).exists():
-        return False, "Resolve Scripting Modules 없음"
-    if modules_path not in sys.path:
-        sys.path.insert(0, modules_path)
-    try:
-        import DaVinciResolveScript as dvr_script  # type: ignore
-        resolve = dvr_script.scriptapp("Resolve")
-    except Exception:
-        resolve = None
-
-    if not resolve:
-        return False, "Resolve가 실행 중이지 않습니다"
-
-    pm = resolve.GetProjectManager()
-    if not pm:
-        return False, "ProjectManager를 가져올 수 없습니다"
-
-    ok = pm.ImportProject(drp_path)
-    if ok:
-        name = Path(drp_path).stem
-        pm.LoadProject(name)
-        return True, f"'{name}' 프로젝트가 Resolve에 import 되었습니다"
-    return False, f"Import 실패: {drp_path}"
-
-
-class ResolveSetupWorker(QThread):
+class UiThreadCall(QObject):
     """
-    Resolve가 꺼져있을 때:
-      1. Resolve 자동 실행
-      2. API 연결될 때까지 최대 90초 대기
-      3. 연결 성공 → 프로젝트 + 빈 생성 + .drp 내보내기
+    작업 스레드 → UI 스레드 동기 호출. UI 스레드에서 만들어 두고 작업 스레드에서 call().
+    ProjectManager처럼 UI 스레드가 함께 쓰는 객체를 작업 스레드에서 바꿀 때 사용합니다.
     """
-    status_changed = pyqtSignal(str)   # 진행 상태 텍스트
-    finished = pyqtSignal(bool, str)   # (성공여부, 메시지)
-
-    _RETRY_INTERVAL = 3   # 재시도 간격 (초)
-    _MAX_RETRIES    = 30  # 최대 재시도 횟수 (90초)
-
-    def __init__(self, project: dict, base_path: Path):
-        super().__init__()
-        self.project   = project
-        self.base_path = base_path
-
-    def run(self):
-        import time
+    _requested = pyqtSignal(object)
 
-        self.status_changed.emit("DaVinci Resolve 실행 중...")
-        launch_app("Resolve")
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._requested.connect(self._run)   # 다른 스레드에서 emit → 큐 연결 (UI 스레드에서 실행)
 
-        for attempt in range(self._MAX_RETRIES):
-            time.sleep(self._RETRY_INTERVAL)
-            elapsed = (attempt + 1) * self._RETRY_INTERVAL
-            self.status_changed.emit(
-                f"Resolve 연결 대기 중... {elapsed}초"
-            )
-            ok, msg = setup_resolve_bins(self.project, self.base_path)
-            if ok:
-                self.finished.emit(True, msg)
-                return
-            # "실행 중이지 않" / "응답이 없" 이외의 오류는 재시도 불필요
-            if "실행 중이지 않" not in msg and "응답이 없" not in msg:
-                self.finished.emit(False, msg)
+    @staticmethod
+    def _run(task: dict):
+        with task["lock"]:
+            if task["abandoned"]:
                 return
-
-        self.finished.emit(
-            False,
-            "Resolve 시작 대기 시간 초과 (90초)\n"
-            "Resolve를 직접 실행 후 '최근 프로젝트' 탭에서 [Resolve 연결] 버튼을 눌러주세요."
-        )
+            try:
+                task["result"] = (True, task["fn"](*task["args"]))
+            except Exception as e:
+                print(f"[ERROR] UiThreadCall: {e}")
+            finally:
+                task["done"].set()
+
+    def call(self, fn: Callable, *args, abort: Callable[[], bool] = lambda: False) -> tuple[bool, object]:
+        """
+        (실행됐는지, 반환값). UI 스레드가 처리할 때까지 기다리되 abort()가 참이 되면 포기
+        (종료 중에는 이벤트 루프가 돌지 않으므로 무한 대기 방지). 포기한 호출은 나중에도 실행되지 않음.
+        """
+        task = {"fn": fn, "args": args, "done": threading.Event(), "lock": threading.Lock(),
+                "abandoned": False, "result": (False, None)}
+        self._requested.emit(task)
+        while not task["done"].wait(0.1):
+            if abort():
+                with task["lock"]:
+                    if not task["done"].is_set():
+                        task["abandoned"] = True
+                break
+        return task["result"]
 
 
 # ─────────────────────────────────────────────
@@ -1097,6 +395,66 @@ class FolderTreeEditDialog(QDialog):
         return [ln.strip() for ln in lines if ln.strip()]
 
 
+class NLEJobDialog(QDialog):
+    """NLE 프로젝트 생성 결과 — 비모달. 작업이 끝날 때마다 해당 줄만 갱신됩니다."""
+
+    def __init__(self, project_name: str, jobs: list[Job], parent=None):
+        super().__init__(parent)
+        self.setWindowTitle("NLE 프로젝트 생성 결과")
+        self.setModal(False)
+        self.setAttribute(Qt.WidgetAttribute.WA_DeleteOnClose)
+        self.setMinimumWidth(460)
+        self.setStyleSheet(f"""
+            QDialog {{
+                background: {COLORS['surface']};
+            }}
+            QLabel {{
+                background: transparent;
+            }}
+        """)
+        self._rows: dict[str, QLabel] = {}
+        self._remaining = len(jobs)
+
+        layout = QVBoxLayout(self)
+        layout.setContentsMargins(24, 20, 24, 20)
+        layout.setSpacing(12)
+
+        self._title = QLabel(f"{project_name}  ·  NLE 프로젝트 생성 중...")
+        self._title.setStyleSheet(
+            f"color: {COLORS['text']}; font-size: 16px; font-weight: 700;"
+        )
+        layout.addWidget(self._title)
+
+        for job in jobs:
+            row = QLabel(f"⏳ {job.key}: 대기 중...")
+            row.setWordWrap(True)
+            row.setStyleSheet(f"color: {COLORS['text2']}; font-size: 13px;")
+            layout.addWidget(row)
+            self._rows[job.key] = row
+            job.signals.progress.connect(self._on_progress)
+            job.signals.finished.connect(self._on_finished)
+
+        btn_row = QHBoxLayout()
+        btn_row.addStretch()
+        close_btn = make_ghost_button("닫기", small=True)
+        close_btn.clicked.connect(self.close)
+        btn_row.addWidget(close_btn)
+        layout.addLayout(btn_row)
+
+    def _on_progress(self, key: str, text: str):
+        self._rows[key].setText(f"⏳ {key}: {text}")
+
+    def _on_finished(self, key: str, ok: bool, msg: str):
+        row = self._rows[key]
+        row.setText(f"{'✓' if ok else '✗'} {key}: {msg}")
+        row.setStyleSheet(
+            f"color: {COLORS['text'] if ok else COLORS['danger']}; font-size: 13px;"
+        )
+        self._remaining -= 1
+        if self._remaining == 0:
+            self._title.setText(self._title.text().replace("생성 중...", "생성 완료"))
+
+
 # ─────────────────────────────────────────────
 # NewProjectPage
 # ─────────────────────────────────────────────
@@ -1105,10 +463,23 @@ class NewProjectPage(QWidget):
 
     PROJECT_TYPES = ["광고", "다큐", "MV", "단편", "이벤트", "유튜브"]
 
+    _NLE_DEFS = [
+        ("Resolve",  "DaVinci Resolve", COLORS["resolve"]),
+        ("Premiere", "Premiere Pro",    COLORS["premiere"]),
+        ("AE",       "After Effects",   COLORS["ae"]),
+    ]
+    _LAUNCH_NAMES = {"Resolve": "DaVinci Resolve", "Premiere": "Adobe Premiere", "AE": "After Effects"}
+
     def __init__(self, manager: ProjectManager):
         super().__init__()
         self.manager = manager
         self._selected_type = "유튜브"
+        self._preview_key: tuple[FolderTree, bool] | None = None   # 미리보기에 그려진 (트리, 커스텀 여부)
+        self._preview_root: QTreeWidgetItem | None = None
+        self._preview_meta: QTreeWidgetItem | None = None
+        self._text   = QColor(COLORS["text"])
+        self._accent = QColor(COLORS["accent"])
+        self._muted  = QColor(COLORS["muted"])
         self._setup_ui()
 
     def _setup_ui(self):
@@ -1273,6 +644,7 @@ class NewProjectPage(QWidget):
         self.tree.setMinimumHeight(200)
         self.tree.setMaximumWidth(300)
         self._refresh_tree()
+        self.inp_name.textChanged.connect(self._relabel_tree_root)
         tree_layout.addWidget(self.tree)
         spec_preview_row.addWidget(tree_widget)
 
@@ -1280,63 +652,13 @@ class NewProjectPage(QWidget):
 
         # ── NLE 프로젝트 자동 생성 ──
         layout.addWidget(section_label("NLE 프로젝트 자동 생성"))
-        self._detected_apps = self._detect_apps()
-
         nle_row = QHBoxLayout()
         nle_row.setSpacing(8)
         self._nle_checks: dict[str, QCheckBox] = {}
 
-        nle_defs = [
-            ("Resolve",  "DaVinci Resolve", COLORS["resolve"]),
-            ("Premiere", "Premiere Pro",    COLORS["premiere"]),
-            ("AE",       "After Effects",   COLORS["ae"]),
-        ]
-        for key, display, color in nle_defs:
-            detected = bool(self._detected_apps.get(key))
+        for key, display, color in self._NLE_DEFS:
             cb = QCheckBox(display)
-            cb.setEnabled(detected)
             cb.setCursor(QCursor(Qt.CursorShape.PointingHandCursor))
-            if detected:
-                cb.setStyleSheet(f"""
-                    QCheckBox {{
-                        color: {color};
-                        font-size: 13px;
-                        font-weight: 600;
-                        spacing: 6px;
-                        padding: 7px 14px;
-                        background: {color}18;
-                        border: 1px solid {color}44;
-                        border-radius: 6px;
-                    }}
-                    QCheckBox::indicator {{
-                        width: 15px; height: 15px;
-                        border-radius: 3px;
-                        border: 1.5px solid {color};
-                        background: transparent;
-                    }}
-                    QCheckBox::indicator:checked {{
-                        background: {color};
-                        border-color: {color};
-                    }}
-                """)
-            else:
-                cb.setStyleSheet(f"""
-                    QCheckBox {{
-                        color: {COLORS['muted']};
-                        font-size: 13px;
-                        spacing: 6px;
-                        padding: 7px 14px;
-                        background: {COLORS['surface2']};
-                        border: 1px solid {COLORS['border']};
-                        border-radius: 6px;
-                    }}
-                    QCheckBox::indicator {{
-                        width: 15px; height: 15px;
-                        border-radius: 3px;
-                        border: 1.5px solid {COLORS['border']};
-                        background: transparent;
-                    }}
-                """)
             self._nle_checks[key] = cb
             nle_row.addWidget(cb)
         nle_row.addStretch()
@@ -1351,12 +673,10 @@ class NewProjectPage(QWidget):
 
         # ── 실행 옵션 ──
         layout.addWidget(section_label("생성 후 실행"))
-        app_items = ["실행 안 함"] + [
-            {"Resolve": "DaVinci Resolve", "Premiere": "Adobe Premiere", "AE": "After Effects"}[k]
-            for k, v in self._detected_apps.items() if v
-        ]
-        self.cb_launch = make_combo(app_items)
+        self.cb_launch = make_combo(["실행 안 함"])
         layout.addWidget(self.cb_launch)
+        # 앱 감지는 백그라운드 — 끝나면 on_apps_detected에서 다시 반영
+        self.on_apps_detected()
 
         # ── 생성 버튼 ──
         layout.addSpacing(20)
@@ -1423,30 +743,50 @@ class NewProjectPage(QWidget):
             self._style_type_btn(btn, True)
 
     def _refresh_tree(self):
-        self.tree.clear()
-        project_name = self.inp_name.text() or "PROJECT_NAME"
+        """
+        미리보기 트리 갱신. 프리셋이 그대로면 루트 이름만 바꾸고,
+        바뀌었으면 기존 항목은 이름으로 재사용하고 달라진 가지만 새로 만듭니다.
+        """
         custom = self.manager.get_custom_preset(self._selected_type)
         is_custom = custom is not None
-        folders = custom if is_custom else FOLDER_PRESETS.get(self._selected_type, [])
-        root_label = f"📁 {project_name}" + ("  *" if is_custom else "")
-        root = QTreeWidgetItem(self.tree, [root_label])
-        root.setForeground(0, QColor(COLORS["accent"] if is_custom else COLORS["text"]))
-        # 트리 빌드
-        nodes: dict[str, QTreeWidgetItem] = {}
-        for path in folders:
-            parts = path.split("/")
-            parent = root
-            cumulative = ""
-            for part in parts:
-                cumulative = f"{cumulative}/{part}" if cumulative else part
-                if cumulative not in nodes:
-                    item = QTreeWidgetItem(parent, [f"📂 {part}"])
-                    item.setForeground(0, QColor(COLORS["muted"]))
-                    nodes[cumulative] = item
-                parent = nodes[cumulative]
-        meta_item = QTreeWidgetItem(root, ["📄 project.json"])
-        meta_item.setForeground(0, QColor(COLORS["muted"]))
-        self.tree.expandAll()
+        tree = folder_tree(custom if is_custom else FOLDER_PRESETS.get(self._selected_type, []))
+        if self._preview_key != (tree, is_custom):
+            self.tree.setUpdatesEnabled(False)
+            try:
+                if self._preview_root is None:
+                    self._preview_root = QTreeWidgetItem(self.tree, [""])
+                    self._preview_meta = QTreeWidgetItem(["📄 project.json"])
+                    self._preview_meta.setForeground(0, self._muted)
+                root = self._preview_root
+                root.setForeground(0, self._accent if is_custom else self._text)
+                self._sync_preview_children(root, tree, tree.roots)
+                root.addChild(self._preview_meta)
+                self.tree.expandAll()
+            finally:
+                self.tree.setUpdatesEnabled(True)
+            self._preview_key = (tree, is_custom)
+        self._relabel_tree_root()
+
+    def _sync_preview_children(self, parent: QTreeWidgetItem, tree: FolderTree, wanted: tuple[int, ...]):
+        """parent의 자식을 tree 노드 목록(wanted) 순서에 맞춤 — 같은 이름의 항목은 하위째 재사용"""
+        old = {item.data(0, Qt.ItemDataRole.UserRole): item for item in parent.takeChildren()}
+        items: list[QTreeWidgetItem] = []
+        for i in wanted:
+            name = tree.names[i]
+            item = old.get(name)
+            if item is None:
+                item = QTreeWidgetItem([f"📂 {name}"])
+                item.setData(0, Qt.ItemDataRole.UserRole, name)
+                item.setForeground(0, self._muted)
+            self._sync_preview_children(item, tree, tree.children[i])
+            items.append(item)
+        parent.addChildren(items)
+
+    def _relabel_tree_root(self, *_):
+        """프로젝트 이름 입력 시 — 루트 항목 텍스트만 변경"""
+        project_name = self.inp_name.text() or "PROJECT_NAME"
+        is_custom = self._preview_key[1]
+        self._preview_root.setText(0, f"📁 {project_name}" + ("  *" if is_custom else ""))
 
     def _browse_location(self):
         path = QFileDialog.getExistingDirectory(
@@ -1464,13 +804,68 @@ class NewProjectPage(QWidget):
             self.manager.set_custom_preset(self._selected_type, result)
             self._refresh_tree()
 
-    def _detect_apps(self) -> dict[str, str | None]:
-        """내부 키(Resolve/Premiere/AE) → 설치 경로 or None"""
-        return {
-            "Resolve":  find_app("Resolve",  self.manager.get_nle_override("Resolve")),
-            "Premiere": find_app("Premiere", self.manager.get_nle_override("Premiere")),
-            "AE":       find_app("AE",       self.manager.get_nle_override("AE")),
-        }
+    def on_apps_detected(self):
+        """NLE 체크박스 / 실행 목록을 AppDetector 결과에 맞춤 (탐색 중이면 모두 비활성)"""
+        for key, _, color in self._NLE_DEFS:
+            cb = self._nle_checks[key]
+            detected = bool(self.manager.apps.peek(key))
+            cb.setEnabled(detected)
+            if not detected:
+                cb.setChecked(False)
+            self._style_nle_check(cb, color if detected else None)
+
+        current = self.cb_launch.currentText()
+        self.cb_launch.clear()
+        self.cb_launch.addItems(["실행 안 함"] + [
+            self._LAUNCH_NAMES[key] for key, _, _ in self._NLE_DEFS
+            if self.manager.apps.peek(key)
+        ])
+        self.cb_launch.setCurrentText(current)
+
+    @staticmethod
+    def _style_nle_check(cb: QCheckBox, color: str | None):
+        """color=None → 미감지(회색)"""
+        if color:
+            cb.setStyleSheet(f"""
+                QCheckBox {{
+                    color: {color};
+                    font-size: 13px;
+                    font-weight: 600;
+                    spacing: 6px;
+                    padding: 7px 14px;
+                    background: {color}18;
+                    border: 1px solid {color}44;
+                    border-radius: 6px;
+                }}
+                QCheckBox::indicator {{
+                    width: 15px; height: 15px;
+                    border-radius: 3px;
+                    border: 1.5px solid {color};
+                    background: transparent;
+                }}
+                QCheckBox::indicator:checked {{
+                    background: {color};
+                    border-color: {color};
+                }}
+            """)
+        else:
+            cb.setStyleSheet(f"""
+                QCheckBox {{
+                    color: {COLORS['muted']};
+                    font-size: 13px;
+                    spacing: 6px;
+                    padding: 7px 14px;
+                    background: {COLORS['surface2']};
+                    border: 1px solid {COLORS['border']};
+                    border-radius: 6px;
+                }}
+                QCheckBox::indicator {{
+                    width: 15px; height: 15px;
+                    border-radius: 3px;
+                    border: 1.5px solid {COLORS['border']};
+                    background: transparent;
+                }}
+            """)
 
     def _create_project(self):
         name = self.inp_name.text().strip()
@@ -1517,8 +912,8 @@ class NewProjectPage(QWidget):
         # 폴더 생성
         self.btn_create.setEnabled(False)
         self.btn_create.setText("생성 중...")
-        ok = self.manager.create_folders(project)
-        if not ok:
+        scaffold = self.manager.create_folders(project)
+        if not scaffold["ok"]:
             QMessageBox.critical(self, "오류", "폴더 생성에 실패했습니다.\n저장 위치 권한을 확인해주세요.")
             self.btn_create.setEnabled(True)
             self.btn_create.setText("  프로젝트 생성")
@@ -1529,35 +924,25 @@ class NewProjectPage(QWidget):
         project["id"] = saved["id"]
         base_path = Path(location) / name
 
-        # ── NLE 프로젝트 / 빈 자동 생성 ──
-        nle_results: list[str] = []
-
+        # ── NLE 프로젝트 / 빈 자동 생성 (백그라운드 병렬) ──
+        manager = self.manager
+        jobs: list[Job] = []
         if self._nle_checks.get("Resolve", QCheckBox()).isChecked():
-            self.btn_create.setText("Resolve 연결 중...")
-            QApplication.processEvents()
-            ok, msg = setup_resolve_bins(project, base_path)
-
-            if not ok and ("실행 중이지 않" in msg or "응답이 없" in msg):
-                # Resolve가 꺼져있음 → Worker로 자동 실행 + 대기
-                self._launch_resolve_worker(project, base_path)
-                nle_results.append(
-                    "⏳ Resolve: 앱을 실행하고 백그라운드에서 연결 중...\n"
-                    "   완료되면 알림이 표시됩니다."
-                )
-            else:
-                nle_results.append(f"{'✓' if ok else '✗'} Resolve: {msg}")
-
+            jobs.append(Job("Resolve", lambda progress: setup_resolve_with_launch(
+                project, base_path, progress, manager)))
         if self._nle_checks.get("Premiere", QCheckBox()).isChecked():
-            self.btn_create.setText("Premiere 프로젝트 생성 중...")
-            QApplication.processEvents()
-            ok, msg = create_premiere_project(project, base_path)
-            nle_results.append(f"{'✓' if ok else '✗'} Premiere: {msg}")
-
+            jobs.append(Job("Premiere", lambda progress: create_premiere_project(
+                project, base_path, manager)))
         if self._nle_checks.get("AE", QCheckBox()).isChecked():
-            self.btn_create.setText("After Effects 프로젝트 생성 중...")
-            QApplication.processEvents()
-            ok, msg = create_ae_project(project, base_path)
-            nle_results.append(f"{'✓' if ok else '✗'} AE: {msg}")
+            jobs.append(Job("AE", lambda progress: create_ae_project(
+                project, base_path, manager)))
+        if jobs:
+            dlg = NLEJobDialog(name, jobs, self)
+            dlg.show()
+            pool = QThreadPool.globalInstance()
+            for job in jobs:
+                job.signals.progress.emit(job.key, "진행 중...")
+                pool.start(job)
 
         # NLE 실행
         launch_choice = self.cb_launch.currentText()
@@ -1576,13 +961,6 @@ class NewProjectPage(QWidget):
         self.btn_create.setEnabled(True)
         self.btn_create.setText("  프로젝트 생성")
 
-        # 결과 팝업
-        if nle_results:
-            QMessageBox.information(
-                self, "NLE 프로젝트 생성 결과",
-                "\n\n".join(nle_results)
-            )
-
         # 초기화
         self.inp_name.clear()
         self.inp_client.clear()
@@ -1590,38 +968,293 @@ class NewProjectPage(QWidget):
 
         self.project_created.emit(saved)
 
-    # ── Resolve Worker 관리 ──
 
-    def _launch_resolve_worker(self, project: dict, base_path: Path):
-        """Resolve 자동 실행 + 백그라운드 연결 워커 시작"""
-        worker = ResolveSetupWorker(project, base_path)
-        worker.status_changed.connect(self._on_resolve_status)
-        worker.finished.connect(self._on_resolve_worker_done)
-        # GC 방지
-        self._resolve_worker = worker
-        worker.start()
+# ─────────────────────────────────────────────
+# ProjectListModel / ProjectCardDelegate (최근 프로젝트 카드)
+# ─────────────────────────────────────────────
+class _CardInfo:
+    """
+    카드 1장을 그리는 데 필요한 파일 시스템 정보 (보이는 행만 계산).
+    처음에는 디스크를 건드리지 않는 자리표시(loaded=False)로 그리고, load()는 워커 스레드에서 호출합니다.
+    """
+    __slots__ = ("folder", "exists", "nles", "versions", "drp_exists", "usage", "loaded")
 
-    def _on_resolve_status(self, msg: str):
-        """워커 상태 메시지 → 버튼 텍스트로 표시"""
-        self.btn_create.setText(msg)
-        self.btn_create.setEnabled(False)
+    def __init__(self, project: dict, manager: ProjectManager):
+        name     = project.get("name", "")
+        location = project.get("location", "")
+        self.folder = (Path(location) / name) if location else None
+        self.exists = self.folder is not None   # 확인 전에는 있다고 보고 그림 ('폴더 없음'이 깜빡이지 않도록)
+        cached = manager.nle_cache.peek(self.folder) if self.folder else None
+        self.nles: set[str] = set(cached) if cached else set()
+        self.versions: list[dict] = []
+        self.drp_exists = False
+        self.usage: dict | None = None   # 폴더 용량 — 백그라운드에서 계산 후 채움
+        self.loaded = False
+
+    def load(self, project: dict, manager: ProjectManager):
+        """폴더 존재 / NLE / 버전 / .drp 확인 (워커 스레드 — 검색 색인 반영은 UI 스레드에서)"""
+        name = project.get("name", "")
+        self.exists = bool(self.folder and self.folder.exists())
+        self.nles = detect_project_nles(project, manager.nle_cache) if self.exists else set()
+        self.versions = get_project_versions(self.folder, name) if self.exists else []
+        self.drp_exists = self.exists and (self.folder / f"{name}.drp").exists()
+        self.loaded = True
+
+    def refresh_files(self, project: dict, manager: ProjectManager, nles: set[str] | None = None):
+        """NLE / .drp / 버전만 다시 읽음 (폴더 변경 알림 — 용량은 그대로). nles가 있으면 그대로 사용."""
+        if not (self.loaded and self.exists):
+            return
+        self.nles = nles if nles is not None else detect_project_nles(project, manager.nle_cache)
+        manager.index_nles(project.get("id", ""), self.nles)
+        self.refresh_versions(project)
 
-    def _on_resolve_worker_done(self, ok: bool, msg: str):
-        """워커 완료 → 알림 팝업 + 버튼 복원"""
-        self.btn_create.setEnabled(True)
-        self.btn_create.setText("  프로젝트 생성")
-        self._resolve_worker = None
-        title = "Resolve 프로젝트 생성 완료" if ok else "Resolve 연결 실패"
-        QMessageBox.information(self, title, msg)
+    def refresh_versions(self, project: dict):
+        """버전 목록 / .drp 여부만 다시 읽음 (스냅샷 생성 / 복원 후 — NLE / 용량은 그대로)"""
+        if not (self.loaded and self.exists):
+            return
+        name = project.get("name", "")
+        self.versions = get_project_versions(self.folder, name)
+        self.drp_exists = (self.folder / f"{name}.drp").exists()
 
 
-# ─────────────────────────────────────────────
-# ProjectCard (최근 프로젝트 카드)
-# ─────────────────────────────────────────────
-class ProjectCard(QFrame):
-    deleted  = pyqtSignal(str)
-    opened   = pyqtSignal(str)
-    refresh_requested = pyqtSignal()   # 버전 복원 후 카드 목록 갱신
+class ProjectListModel(QAbstractListModel):
+    """
+    최근 프로젝트 목록 모델.
+    한 페이지씩 불러오고 (스크롤이 끝에 닿으면 fetchMore로 다음 페이지),
+    카드별 파일 시스템 정보는 해당 행이 처음 그려질 때 백그라운드에서 계산하고 캐시합니다
+    (data()는 캐시만 돌려줌 — 그리기 / 스크롤 중 디스크 I/O 없음).
+    """
+    ProjectRole = Qt.ItemDataRole.UserRole + 1
+    CardInfoRole = Qt.ItemDataRole.UserRole + 2
+    PAGE_SIZE = 200
+
+    def __init__(self, manager: ProjectManager, parent=None):
+        super().__init__(parent)
+        self.manager = manager
+        self._projects: list[dict] = []
+        self._rows: dict[str, int] = {}   # 프로젝트 id → 행 (알림마다 목록을 훑지 않도록)
+        self._total = 0
+        self._fetch: Callable[[int, int], list[dict]] | None = None
+        self._info: dict[str, _CardInfo] = {}
+        # 카드 정보 확인 (stat / NLE 감지 / 버전 — 폴더당 몇 번의 stat)
+        self._info_pool = QThreadPool(self)
+        self._info_pool.setMaxThreadCount(4)
+        self._info_results: dict[str, _CardInfo] = {}
+        # 폴더 용량 계산 (카드가 처음 그려질 때 요청, 디스크 부하를 고려해 동시 2개까지)
+        self._usage_pool = QThreadPool(self)
+        self._usage_pool.setMaxThreadCount(2)
+        self._usage_pending: set[str] = set()
+        self._usage_results: dict[str, dict] = {}
+
+    def rowCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._projects)
+
+    def total(self) -> int:
+        """불러오지 않은 페이지까지 포함한 전체 행 수"""
+        return self._total
+
+    def canFetchMore(self, parent=QModelIndex()) -> bool:
+        return not parent.isValid() and len(self._projects) < self._total
+
+    def fetchMore(self, parent=QModelIndex()):
+        if parent.isValid() or self._fetch is None:
+            return
+        more = self._fetch(len(self._projects), self.PAGE_SIZE)
+        if not more:
+            self._total = len(self._projects)
+            return
+        first = len(self._projects)
+        self.beginInsertRows(QModelIndex(), first, first + len(more) - 1)
+        self._projects.extend(more)
+        self._reindex(first)
+        self.endInsertRows()
+
+    def data(self, index: QModelIndex, role: int = Qt.ItemDataRole.DisplayRole):
+        if not index.isValid() or index.row() >= len(self._projects):
+            return None
+        project = self._projects[index.row()]
+        if role == self.ProjectRole:
+            return project
+        if role == self.CardInfoRole:
+            return self.card_info(project)
+        if role == Qt.ItemDataRole.DisplayRole:
+            return project.get("name", "")
+        return None
+
+    def card_info(self, project: dict) -> _CardInfo:
+        pid = project.get("id", "")
+        info = self._info.get(pid)
+        if info is None:
+            info = self._info[pid] = _CardInfo(project, self.manager)
+            self._request_info(project)
+        return info
+
+    def _request_info(self, project: dict):
+        pid = project.get("id", "")
+        manager = self.manager
+
+        def work(progress) -> tuple[bool, str]:
+            info = _CardInfo(project, manager)
+            info.load(project, manager)
+            self._info_results[pid] = info
+            return True, ""
+
+        job = Job(pid, work)
+        job.signals.finished.connect(self._on_info_done)
+        self._info_pool.start(job)
+
+    def _on_info_done(self, pid: str, ok: bool, msg: str):
+        loaded = self._info_results.pop(pid, None)
+        info = self._info.get(pid)
+        if loaded is None or info is None or info.loaded:
+            return   # 목록이 바뀌었거나 그 사이 다른 경로로 갱신됨
+        loaded.usage = info.usage
+        self._info[pid] = loaded
+        self.manager.index_nles(pid, loaded.nles)
+        project = self.manager.get(pid)
+        if loaded.exists and project is not None:
+            self._request_usage(project)
+        row = self.row_of(pid)
+        if row >= 0:
+            idx = self.index(row)
+            self.dataChanged.emit(idx, idx, [self.CardInfoRole])
+
+    def _request_usage(self, project: dict):
+        pid = project.get("id", "")
+        if pid in self._usage_pending:
+            return
+        self._usage_pending.add(pid)
+        cache = self.manager.disk_usage
+
+        def work(progress) -> tuple[bool, str]:
+            self._usage_results[pid] = measure_project_usage(project, cache)
+            return True, ""
+
+        job = Job(pid, work)
+        job.signals.finished.connect(self._on_usage_done)
+        self._usage_pool.start(job)
+
+    def _on_usage_done(self, pid: str, ok: bool, msg: str):
+        self._usage_pending.discard(pid)
+        usage = self._usage_results.pop(pid, None)
+        info = self._info.get(pid)
+        if info is None or usage is None:
+            return
+        info.usage = usage
+        row = self.row_of(pid)
+        if row >= 0:
+            idx = self.index(row)
+            self.dataChanged.emit(idx, idx, [self.CardInfoRole])
+
+    def set_source(
+        self, first_page: list[dict], total: int,
+        fetch: Callable[[int, int], list[dict]], keep_info: bool = False,
+    ):
+        """
+        첫 페이지 + 전체 개수 + fetch(offset, limit)로 목록 교체.
+        keep_info=True면 이미 계산한 카드 정보를 재사용 (정렬 / 검색만 바뀐 경우).
+        """
+        self.beginResetModel()
+        self._projects = list(first_page)
+        self._rows.clear()
+        self._reindex(0)
+        self._total = total
+        self._fetch = fetch
+        if not keep_info:
+            self._info.clear()
+            self._info_pool.clear()
+            self._usage_pool.clear()   # 아직 시작하지 않은 용량 계산은 취소
+            self._usage_pending.clear()
+        self.endResetModel()
+
+    def row_of(self, project_id: str) -> int:
+        return self._rows.get(project_id, -1)
+
+    def projects(self) -> list[dict]:
+        """불러온 행 (읽기 전용 — 변경은 insert_project / remove_project 등으로)"""
+        return self._projects
+
+    def cached_info(self, project_id: str) -> _CardInfo | None:
+        """계산해 둔 카드 정보 (없으면 None — 계산을 요청하지 않음)"""
+        return self._info.get(project_id)
+
+    def _reindex(self, start: int, stop: int | None = None):
+        """행 [start, stop)의 id → 행 갱신 (삽입 / 삭제 / 이동으로 밀린 구간만)"""
+        rows = self._rows
+        for row in range(start, len(self._projects) if stop is None else stop):
+            rows[self._projects[row].get("id", "")] = row
+
+    def refresh_row(self, project_id: str, nles: set[str] | None = None):
+        """
+        해당 카드의 파일 정보(NLE / .drp / 버전)만 다시 계산해서 그 행만 다시 그림.
+        용량은 다시 계산하지 않음 — 폴더가 새로 생기거나 사라진 경우에만 카드 정보를 처음부터.
+        """
+        info = self._info.get(project_id)
+        project = self.manager.get(project_id)
+        if info is not None and project is not None:
+            if bool(info.folder and info.folder.exists()) != info.exists:
+                del self._info[project_id]
+            else:
+                info.refresh_files(project, self.manager, nles)
+        row = self.row_of(project_id)
+        if row >= 0:
+            idx = self.index(row)
+            self.dataChanged.emit(idx, idx, [self.CardInfoRole])
+
+    def refresh_versions(self, project_id: str):
+        """해당 카드의 버전 목록만 다시 읽어서 그 행만 다시 그림"""
+        info = self._info.get(project_id)
+        project = self.manager.get(project_id)
+        if info is None or project is None:
+            return   # 아직 그려지지 않은 카드 — 그릴 때 새로 계산
+        info.refresh_versions(project)
+        row = self.row_of(project_id)
+        if row >= 0:
+            idx = self.index(row)
+            self.dataChanged.emit(idx, idx, [self.CardInfoRole])
+
+    def insert_project(self, row: int, project: dict):
+        """필터 조건을 새로 만족하게 된 프로젝트 1개를 해당 위치에 추가"""
+        self.beginInsertRows(QModelIndex(), row, row)
+        self._projects.insert(row, project)
+        self._reindex(row)
+        self._total += 1
+        self.endInsertRows()
+
+    def set_total(self, total: int):
+        """불러오지 않은 페이지를 포함한 전체 개수 갱신 (다음 fetchMore 판단용)"""
+        self._total = max(total, len(self._projects))
+
+    def remove_project(self, project_id: str):
+        row = self.row_of(project_id)
+        if row < 0:
+            return
+        self.beginRemoveRows(QModelIndex(), row, row)
+        del self._projects[row]
+        del self._rows[project_id]
+        self._reindex(row)
+        self._total -= 1
+        self._info.pop(project_id, None)
+        self.endRemoveRows()
+
+    def move_to_top(self, project_id: str):
+        """최근 연 프로젝트를 맨 위로 (다른 행은 그대로)"""
+        row = self.row_of(project_id)
+        if row <= 0:
+            return
+        self.beginMoveRows(QModelIndex(), row, row, QModelIndex(), 0)
+        self._projects.insert(0, self._projects.pop(row))
+        self._reindex(0, row + 1)
+        self.endMoveRows()
+
+
+class ProjectCardDelegate(QStyledItemDelegate):
+    """
+    프로젝트 카드를 위젯 없이 직접 그리는 델리게이트.
+    화면에 보이는 행만 그려지므로 프로젝트 수와 관계없이 메모리 / 그리기 비용이 일정합니다.
+    버튼은 영역만 계산해 두고 클릭 위치로 동작을 판별합니다.
+    """
+    action_triggered = pyqtSignal(str, str, object)   # (project_id, action, payload)
 
     NLE_COLORS = {
         "Resolve":  COLORS["resolve"],
@@ -1634,397 +1267,371 @@ class ProjectCard(QFrame):
         "AE":       "After Effects",
     }
 
-    def __init__(self, project: dict, manager: ProjectManager):
-        super().__init__()
-        self.project = project
-        self.manager = manager
-        self._ver_expanded = False
-        self._setup_ui()
+    CARD_HEIGHT = 176
+    VERSION_ROW_Y = 16 + 26 + 20 + 22 + 20   # 이름 / 메타 / 경로 / 용량 행 아래
+    SPACING     = 14     # 카드 사이 간격
+    H_MARGIN    = 40     # 페이지 좌우 여백
+    MAX_VERSION_CHIPS = 3
 
-    # ── 메인 UI ──────────────────────────────────
-    def _setup_ui(self):
-        from PyQt6.QtWidgets import QGraphicsDropShadowEffect
-        pid         = self.project.get("id", "")
-        name        = self.project.get("name", "Unknown")
-        client      = self.project.get("client", "")
-        ptype       = self.project.get("type", "")
-        spec        = self.project.get("spec", {})
-        resolution  = spec.get("resolution", self.project.get("resolution", ""))
-        fps         = spec.get("fps", self.project.get("fps", ""))
-        created_at  = self.project.get("created_at", "")
-        location    = self.project.get("location", "")
-        folder_path = str(Path(location) / name) if location else ""
-        exists      = Path(folder_path).exists() if folder_path else False
-
-        # 감지된 NLE 종류
-        nles = detect_project_nles(self.project) if exists else set()
-
-        # NLE 메인 컬러 (Resolve > Premiere > AE > accent)
-        stripe_color = (
+    def __init__(self, manager: ProjectManager, view: QAbstractItemView):
+        super().__init__(view)
+        self.manager = manager
+        self._view = view
+        self._hover: tuple[int, str, object] | None = None
+        self._colors: dict[str, QColor] = {}
+        self._fonts: dict[tuple[int, int], QFont] = {}
+        view.viewport().installEventFilter(self)
+
+    # ── 공용 리소스 (그릴 때마다 만들지 않음) ──
+    def _c(self, hex_color: str, alpha: int | None = None) -> QColor:
+        key = f"{hex_color}/{alpha}"
+        c = self._colors.get(key)
+        if c is None:
+            c = QColor(hex_color)
+            if alpha is not None:
+                c.setAlpha(alpha)
+            self._colors[key] = c
+        return c
+
+    def _f(self, px: int, weight: int = 400) -> QFont:
+        f = self._fonts.get((px, weight))
+        if f is None:
+            f = QFont()
+            f.setPixelSize(px)
+            f.setWeight(QFont.Weight(weight))
+            self._fonts[(px, weight)] = f
+        return f
+
+    def sizeHint(self, option, index) -> QSize:
+        return QSize(option.rect.width(), self.CARD_HEIGHT + self.SPACING)
+
+    # ── 레이아웃 (그리기 / 클릭 판별 공용) ──
+    def _card_rect(self, rect: QRect) -> QRect:
+        half = self.SPACING // 2
+        return rect.adjusted(self.H_MARGIN, half, -self.H_MARGIN, -half)
+
+    def _chip(self, x: int, y: int, text: str, font: QFont, h: int, pad: int) -> QRect:
+        w = QFontMetrics(font).horizontalAdvance(text) + pad * 2
+        return QRect(x, y, w, h)
+
+    def _buttons(self, card: QRect, project: dict, info: _CardInfo) -> list[tuple[QRect, str, str, object, str]]:
+        """(영역, 표시 텍스트, 동작, payload, 색상) 목록"""
+        font = self._f(12, 500)
+        y = card.bottom() - 14 - 28
+        x = card.left() + 20
+        buttons: list[tuple[QRect, str, str, object, str]] = []
+
+        def add(text: str, action: str, color: str, payload: object = None):
+            nonlocal x
+            r = self._chip(x, y, text, font, 28, 12)
+            buttons.append((r, text, action, payload, color))
+            x = r.right() + 7
+
+        if info.exists:
+            add("폴더 열기", "open_folder", COLORS["text"])
+            if self.manager.apps.peek("Resolve"):
+                if info.drp_exists:
+                    add("▶ Resolve", "resolve_import", COLORS["resolve"])
+                else:
+                    add("⚡ Resolve 연결", "resolve_connect", COLORS["resolve"])
+            for disp, app_key in [("▶ Premiere", "Premiere"), ("▶ AE", "AE")]:
+                if self.manager.apps.peek(app_key):
+                    add(disp, "launch", self.NLE_COLORS[app_key], app_key)
+
+        del_r = self._chip(0, y, "삭제", font, 28, 12)
+        del_r.moveRight(card.right() - 20)
+        buttons.append((del_r, "삭제", "delete", None, COLORS["danger"]))
+        return buttons
+
+    def _version_chips(self, card: QRect, info: _CardInfo) -> list[tuple[QRect, str, str, object, str]]:
+        if not (info.drp_exists or info.versions):
+            return []
+        font = self._f(11, 600)
+        y = card.top() + self.VERSION_ROW_Y
+        x = card.left() + 20 + QFontMetrics(self._f(11, 600)).horizontalAdvance(
+            self._version_header(info)) + 12
+        chips: list[tuple[QRect, str, str, object, str]] = []
+        for v in info.versions[:self.MAX_VERSION_CHIPS]:
+            text = f"{v['label']}  {v['modified'].strftime('%m/%d %H:%M')}  {v['size_mb']:.1f} MB  ↺"
+            r = self._chip(x, y, text, font, 22, 8)
+            chips.append((r, text, "restore", v["path"], COLORS["accent"]))
+            x = r.right() + 6
+        hidden = len(info.versions) - self.MAX_VERSION_CHIPS
+        if hidden > 0:
+            text = f"+ {hidden}개 더"
+            r = self._chip(x, y, text, font, 22, 8)
+            chips.append((r, text, "more_versions", None, COLORS["text2"]))
+        if info.drp_exists:
+            r = self._chip(0, y, "스냅샷 생성", font, 22, 10)
+            r.moveRight(card.right() - 20)
+            chips.append((r, "스냅샷 생성", "snapshot", None, COLORS["resolve"]))
+        return chips
+
+    @staticmethod
+    def _version_header(info: _CardInfo) -> str:
+        n = len(info.versions)
+        return f"버전  ·  {n}개" if n else "버전  ·  스냅샷 없음"
+
+    def _hit_targets(self, rect: QRect, index: QModelIndex) -> list[tuple[QRect, str, str, object, str]]:
+        project = index.data(ProjectListModel.ProjectRole)
+        info = index.data(ProjectListModel.CardInfoRole)
+        card = self._card_rect(rect)
+        return self._version_chips(card, info) + self._buttons(card, project, info)
+
+    # ── 그리기 ──
+    def paint(self, painter: QPainter, option, index: QModelIndex):
+        project: dict = index.data(ProjectListModel.ProjectRole)
+        info: _CardInfo = index.data(ProjectListModel.CardInfoRole)
+        card = self._card_rect(option.rect)
+
+        painter.save()
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+
+        nles = info.nles
+        stripe = (
             COLORS["resolve"]  if "Resolve"  in nles else
             COLORS["premiere"] if "Premiere" in nles else
             COLORS["ae"]       if "AE"       in nles else
             COLORS["border2"]
-        )
-
-        # 카드 컨테이너 — 왼쪽 컬러 스트라이프
-        self.setStyleSheet(f"""
-            ProjectCard, QFrame#card {{
-                background: {COLORS['surface2']};
-                border: 1px solid {COLORS['border']};
-                border-left: 4px solid {stripe_color if exists else COLORS['border']};
-                border-radius: 12px;
-            }}
-        """)
-
-        # 드롭 섀도우
-        shadow = QGraphicsDropShadowEffect(self)
-        shadow.setBlurRadius(24)
-        shadow.setOffset(0, 4)
-        shadow.setColor(QColor(0, 0, 0, 80 if exists else 40))
-        self.setGraphicsEffect(shadow)
-
-        outer = QVBoxLayout(self)
-        outer.setContentsMargins(0, 0, 0, 0)
-        outer.setSpacing(0)
-
-        # ── 본문 ──
-        body = QWidget()
-        body.setStyleSheet("background: transparent;")
-        body_layout = QVBoxLayout(body)
-        body_layout.setContentsMargins(20, 16, 20, 14)
-        body_layout.setSpacing(6)
-
-        # 상단: 이름 + 배지들
-        top_row = QHBoxLayout()
-        top_row.setSpacing(8)
-
-        name_text = name if exists else f"{name}  (폴더 없음)"
-        name_lbl = QLabel(name_text)
-        name_lbl.setStyleSheet(
-            f"color: {COLORS['text'] if exists else COLORS['muted']};"
-            f"font-size: 15px; font-weight: 700; background: transparent;"
-        )
-        top_row.addWidget(name_lbl)
-        top_row.addStretch()
-
-        # NLE 배지
+        ) if info.exists else COLORS["border"]
+
+        # 그림자 (반투명 사각형 2겹 — QGraphicsDropShadowEffect 대체)
+        painter.setPen(Qt.PenStyle.NoPen)
+        for spread, alpha in ((6, 14), (3, 24)):
+            painter.setBrush(self._c("#000000", alpha if info.exists else alpha // 2))
+            painter.drawRoundedRect(QRectF(card.adjusted(-spread // 2, 0, spread // 2, spread)), 14, 14)
+
+        # 카드 배경 + 왼쪽 컬러 스트라이프
+        painter.setBrush(self._c(stripe))
+        painter.drawRoundedRect(QRectF(card), 12, 12)
+        painter.setBrush(self._c(COLORS["surface2"]))
+        painter.setPen(QPen(self._c(COLORS["border"]), 1))
+        painter.drawRoundedRect(QRectF(card.adjusted(4, 0, 0, 0)).adjusted(0.5, 0.5, -0.5, -0.5), 10, 10)
+
+        x0 = card.left() + 20
+        right = card.right() - 20
+        y = card.top() + 16
+
+        # 상단: 이름 + 배지
+        badge_font = self._f(10, 700)
+        bx = right
+        badges: list[tuple[str, str, str, str]] = []   # (text, fg, bg, border)
         for nle_key in ["Resolve", "Premiere", "AE"]:
             if nle_key in nles:
                 c = self.NLE_COLORS[nle_key]
-                badge = QLabel(self.NLE_LABELS[nle_key])
-                badge.setStyleSheet(f"""
-                    background: {c}22;
-                    color: {c};
-                    border: 1px solid {c}55;
-                    border-radius: 4px;
-                    font-size: 10px;
-                    font-weight: 700;
-                    padding: 2px 7px;
-                """)
-                top_row.addWidget(badge)
-
-        # 프로젝트 타입 배지
+                badges.append((self.NLE_LABELS[nle_key], c, c, c))
+        ptype = project.get("type", "")
         if ptype:
-            type_lbl = QLabel(ptype)
-            type_lbl.setStyleSheet(f"""
-                background: {COLORS['surface3']};
-                color: {COLORS['text2']};
-                border: 1px solid {COLORS['border2']};
-                border-radius: 4px;
-                font-size: 10px;
-                font-weight: 600;
-                padding: 2px 7px;
-            """)
-            top_row.addWidget(type_lbl)
-        body_layout.addLayout(top_row)
+            badges.append((ptype, COLORS["text2"], COLORS["surface3"], COLORS["border2"]))
+        painter.setFont(badge_font)
+        for text, fg, bg, border in reversed(badges):
+            r = self._chip(0, y + 2, text, badge_font, 18, 7)
+            r.moveRight(bx)
+            nle_badge = bg == fg
+            painter.setBrush(self._c(bg, 0x22) if nle_badge else self._c(bg))
+            painter.setPen(QPen(self._c(border, 0x55) if nle_badge else self._c(border), 1))
+            painter.drawRoundedRect(QRectF(r), 4, 4)
+            painter.setPen(self._c(fg))
+            painter.drawText(r, Qt.AlignmentFlag.AlignCenter, text)
+            bx = r.left() - 8
+
+        name = project.get("name", "Unknown")
+        name_text = name if info.exists else f"{name}  (폴더 없음)"
+        name_font = self._f(15, 700)
+        painter.setFont(name_font)
+        painter.setPen(self._c(COLORS["text"] if info.exists else COLORS["muted"]))
+        name_rect = QRect(x0, y, max(0, bx - x0 - 8), 22)
+        painter.drawText(
+            name_rect, Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter,
+            QFontMetrics(name_font).elidedText(name_text, Qt.TextElideMode.ElideRight, name_rect.width())
+        )
+        y += 26
 
         # 메타 정보
+        spec = project.get("spec", {})
+        resolution = spec.get("resolution", project.get("resolution", ""))
+        fps = spec.get("fps", project.get("fps", ""))
         meta_parts = []
-        if client:
-            meta_parts.append(client)
+        if project.get("client"):
+            meta_parts.append(project["client"])
         if resolution:
             # 짧게 표시: "4K UHD" 부분만
-            short_res = resolution.split("(")[0].strip() if "(" in resolution else resolution
-            meta_parts.append(short_res)
+            meta_parts.append(resolution.split("(")[0].strip() if "(" in resolution else resolution)
         if fps:
             meta_parts.append(f"{fps} fps")
+        created_at = project.get("created_at", "")
         if created_at:
             try:
-                dt = datetime.fromisoformat(created_at)
-                meta_parts.append(dt.strftime("%Y.%m.%d"))
+                meta_parts.append(datetime.fromisoformat(created_at).strftime("%Y.%m.%d"))
             except Exception:
                 pass
-
-        if meta_parts:
-            meta_lbl = QLabel("  ·  ".join(meta_parts))
-            meta_lbl.setStyleSheet(
-                f"color: {COLORS['text2']}; font-size: 12px; background: transparent;"
-            )
-            body_layout.addWidget(meta_lbl)
+        painter.setFont(self._f(12))
+        painter.setPen(self._c(COLORS["text2"]))
+        painter.drawText(QRect(x0, y, right - x0, 18),
+                         Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter,
+                         "  ·  ".join(meta_parts))
+        y += 20
 
         # 경로
-        if folder_path:
-            path_lbl = QLabel(folder_path)
-            path_lbl.setStyleSheet(
-                f"color: {COLORS['muted']}; font-size: 11px; background: transparent;"
+        if info.folder:
+            path_font = self._f(11)
+            painter.setFont(path_font)
+            painter.setPen(self._c(COLORS["muted"]))
+            painter.drawText(
+                QRect(x0, y, right - x0, 16), Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter,
+                QFontMetrics(path_font).elidedText(str(info.folder), Qt.TextElideMode.ElideMiddle, right - x0)
             )
-            path_lbl.setWordWrap(True)
-            body_layout.addWidget(path_lbl)
-
-        # 폴더 없음 경고
-        if not exists:
-            warn = QLabel("⚠  폴더를 찾을 수 없습니다")
-            warn.setStyleSheet(f"""
-                color: {COLORS['danger']};
-                background: {COLORS['danger']}12;
-                border: 1px solid {COLORS['danger']}30;
-                border-radius: 6px;
-                font-size: 12px;
-                padding: 5px 10px;
-            """)
-            body_layout.addWidget(warn)
-
-        # ── 버전 히스토리 (Resolve .drp 존재 시) ──
-        folder = Path(folder_path) if folder_path else None
-        versions = get_project_versions(folder, name) if (folder and folder.exists()) else []
-        drp_file = (folder / f"{name}.drp") if folder else None
-        drp_exists = bool(drp_file and drp_file.exists())
-
-        if drp_exists or versions:
-            body_layout.addSpacing(4)
-            self._ver_frame = self._build_version_section(
-                name, folder, drp_exists, versions, pid
-            )
-            body_layout.addWidget(self._ver_frame)
-
-        # ── 액션 버튼 행 ──
-        btn_row = QHBoxLayout()
-        btn_row.setSpacing(6)
-        btn_row.setContentsMargins(0, 4, 0, 0)
-
-        if exists:
-            open_btn = make_ghost_button("폴더 열기", small=True)
-            open_btn.clicked.connect(lambda: open_folder(folder_path))
-            btn_row.addWidget(open_btn)
-
-            # Resolve
-            resolve_path = find_app("Resolve", self.manager.get_nle_override("Resolve"))
-            if resolve_path:
-                if drp_exists:
-                    rb = make_ghost_button("▶ Resolve", color=COLORS["resolve"], small=True)
-                    rb.clicked.connect(lambda: self._import_resolve_drp(str(drp_file)))
-                else:
-                    rb = make_ghost_button("⚡ Resolve 연결", color=COLORS["resolve"], small=True)
-                    rb.clicked.connect(lambda: self._connect_resolve(name, folder_path))
-                btn_row.addWidget(rb)
-
-            # Premiere / AE
-            for disp, app_key in [("▶ Premiere", "Premiere"), ("▶ AE", "AE")]:
-                if find_app(app_key, self.manager.get_nle_override(app_key)):
-                    ab = make_ghost_button(disp, color=self.NLE_COLORS[app_key], small=True)
-                    ab.clicked.connect(lambda _, ak=app_key: self._launch_and_update(ak))
-                    btn_row.addWidget(ab)
-
-        btn_row.addStretch()
-        del_btn = make_ghost_button("삭제", color=COLORS["danger"], small=True)
-        del_btn.clicked.connect(lambda: self._confirm_delete(pid, name))
-        btn_row.addWidget(del_btn)
-
-        body_layout.addLayout(btn_row)
-        outer.addWidget(body)
-
-    # ── 버전 섹션 ─────────────────────────────────
-    def _build_version_section(
-        self, name: str, folder: Path, drp_exists: bool,
-        versions: list[dict], pid: str
-    ) -> QFrame:
-        frame = QFrame()
-        frame.setStyleSheet(f"""
-            QFrame {{
-                background: {COLORS['surface3']};
-                border: 1px solid {COLORS['border']};
-                border-radius: 8px;
-            }}
-        """)
-        fl = QVBoxLayout(frame)
-        fl.setContentsMargins(12, 8, 12, 8)
-        fl.setSpacing(4)
-
-        # 헤더 행
-        hdr = QHBoxLayout()
-        ver_count = len(versions)
-        hdr_lbl = QLabel(
-            f"버전 히스토리  ·  {ver_count}개 스냅샷"
-            if ver_count else "버전 히스토리  ·  스냅샷 없음"
-        )
-        hdr_lbl.setStyleSheet(
-            f"color: {COLORS['text2']}; font-size: 11px; font-weight: 600; background: transparent;"
+        y += 22
+
+        # 용량 (최상위 폴더별)
+        if info.exists:
+            self._render_usage(painter, QRect(x0, y, right - x0, 16), info.usage)
+        y += 20
+
+        hover = self._hover if self._hover and self._hover[0] == index.row() else None
+
+        # 버전 히스토리 / 폴더 없음 경고
+        if not info.exists:
+            warn = QRect(x0, y, right - x0, 24)
+            painter.setBrush(self._c(COLORS["danger"], 0x12))
+            painter.setPen(QPen(self._c(COLORS["danger"], 0x30), 1))
+            painter.drawRoundedRect(QRectF(warn), 6, 6)
+            painter.setFont(self._f(12))
+            painter.setPen(self._c(COLORS["danger"]))
+            painter.drawText(warn.adjusted(10, 0, 0, 0),
+                             Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter,
+                             "⚠  폴더를 찾을 수 없습니다")
+        elif info.drp_exists or info.versions:
+            self._render_version_list(painter, card, info, hover)
+
+        # 액션 버튼
+        self._paint_chips(painter, self._buttons(card, project, info), self._f(12, 500), hover, radius=6)
+        painter.restore()
+
+    def _render_usage(self, painter: QPainter, rect: QRect, usage: dict | None):
+        head_font = self._f(11, 600)
+        head = f"용량  ·  {format_size(usage['total'])}" if usage else "용량  ·  계산 중…"
+        painter.setFont(head_font)
+        painter.setPen(self._c(COLORS["text2"]))
+        painter.drawText(rect, Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter, head)
+        if not usage:
+            return
+        parts = [
+            f"{'기타' if top == USAGE_ROOT_FILES else top} {format_size(size)}"
+            for top, size in sorted(usage["folders"].items(), key=lambda kv: (kv[0].startswith("."), kv[0]))
+            if size
+        ]
+        if not parts:
+            return
+        x = rect.left() + QFontMetrics(head_font).horizontalAdvance(head) + 14
+        font = self._f(11)
+        painter.setFont(font)
+        painter.setPen(self._c(COLORS["muted"]))
+        width = max(0, rect.right() - x)
+        painter.drawText(
+            QRect(x, rect.top(), width, rect.height()), Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter,
+            QFontMetrics(font).elidedText("   ".join(parts), Qt.TextElideMode.ElideRight, width)
         )
-        hdr.addWidget(hdr_lbl)
-        hdr.addStretch()
 
-        if drp_exists:
-            snap_btn = QPushButton("스냅샷 생성")
-            snap_btn.setCursor(QCursor(Qt.CursorShape.PointingHandCursor))
-            snap_btn.setStyleSheet(f"""
-                QPushButton {{
-                    background: {COLORS['resolve']}22;
-                    color: {COLORS['resolve']};
-                    border: 1px solid {COLORS['resolve']}44;
-                    border-radius: 5px;
-                    font-size: 11px;
-                    font-weight: 600;
-                    padding: 3px 10px;
-                }}
-                QPushButton:hover {{ background: {COLORS['resolve']}40; }}
-            """)
-            snap_btn.clicked.connect(
-                lambda: self._create_snapshot(name, folder)
-            )
-            hdr.addWidget(snap_btn)
-
-        fl.addLayout(hdr)
-
-        # 버전 목록 (최대 5개)
-        self._ver_list_widget = QWidget()
-        self._ver_list_widget.setStyleSheet("background: transparent;")
-        vl = QVBoxLayout(self._ver_list_widget)
-        vl.setContentsMargins(0, 4, 0, 0)
-        vl.setSpacing(3)
-
-        self._render_version_list(vl, versions, name, folder)
-        fl.addWidget(self._ver_list_widget)
-        return frame
-
-    def _render_version_list(
-        self, layout: QVBoxLayout, versions: list[dict], name: str, folder: Path
-    ):
-        # 기존 위젯 제거
-        while layout.count():
-            w = layout.takeAt(0).widget()
-            if w:
-                w.deleteLater()
-
-        show_versions = versions[:5]  # 최대 5개
-        for v in show_versions:
-            row = QHBoxLayout()
-            row.setSpacing(6)
-            ver_lbl = QLabel(v["label"])
-            ver_lbl.setStyleSheet(
-                f"color: {COLORS['resolve']}; font-size: 11px; font-weight: 700;"
-                f"min-width: 38px; background: transparent;"
-            )
-            date_lbl = QLabel(v["modified"].strftime("%m/%d %H:%M"))
-            date_lbl.setStyleSheet(
-                f"color: {COLORS['muted']}; font-size: 11px; background: transparent;"
-            )
-            size_lbl = QLabel(f"{v['size_mb']:.1f} MB")
-            size_lbl.setStyleSheet(
-                f"color: {COLORS['muted']}; font-size: 11px; background: transparent;"
-            )
-            row.addWidget(ver_lbl)
-            row.addWidget(date_lbl)
-            row.addWidget(size_lbl)
-            row.addStretch()
-
-            restore_btn = QPushButton("복원")
-            restore_btn.setCursor(QCursor(Qt.CursorShape.PointingHandCursor))
-            restore_btn.setStyleSheet(f"""
-                QPushButton {{
-                    background: transparent;
-                    color: {COLORS['accent']};
-                    border: 1px solid {COLORS['accent']}44;
-                    border-radius: 4px;
-                    font-size: 10px;
-                    font-weight: 600;
-                    padding: 2px 8px;
-                }}
-                QPushButton:hover {{ background: {COLORS['accent']}22; }}
-            """)
-            vp = v["path"]
-            restore_btn.clicked.connect(
-                lambda _, p=vp: self._restore_version(p, name, folder)
-            )
-            row.addWidget(restore_btn)
-
-            row_widget = QWidget()
-            row_widget.setStyleSheet("background: transparent;")
-            row_widget.setLayout(row)
-            layout.addWidget(row_widget)
-
-        if len(versions) > 5:
-            more = QLabel(f"+ {len(versions) - 5}개 더...")
-            more.setStyleSheet(
-                f"color: {COLORS['muted']}; font-size: 11px; background: transparent;"
-            )
-            layout.addWidget(more)
-
-    # ── 액션 핸들러 ────────────────────────────────
-    def _create_snapshot(self, name: str, folder: Path):
-        project_local = {**self.project, "name": name,
-                         "location": str(folder.parent)}
-        ok, msg = create_smart_snapshot(project_local)
-        if ok:
-            QMessageBox.information(self, "스냅샷 생성", msg)
-            self.refresh_requested.emit()
-        else:
-            QMessageBox.warning(self, "스냅샷 실패", msg)
+    def _render_version_list(self, painter: QPainter, card: QRect, info: _CardInfo, hover):
+        y = card.top() + self.VERSION_ROW_Y
+        painter.setFont(self._f(11, 600))
+        painter.setPen(self._c(COLORS["text2"]))
+        painter.drawText(QRect(card.left() + 20, y, 200, 22),
+                         Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter,
+                         self._version_header(info))
+        self._paint_chips(painter, self._version_chips(card, info), self._f(11, 600), hover, radius=5)
+
+    def _paint_chips(self, painter: QPainter, chips, font: QFont, hover, radius: int):
+        painter.setFont(font)
+        for r, text, action, payload, color in chips:
+            hovered = bool(hover and hover[1] == action and hover[2] == payload)
+            painter.setBrush(self._c(color, 0x40 if hovered else 0x14))
+            painter.setPen(QPen(self._c(color, 0x66) if hovered else self._c(COLORS["border"]), 1))
+            painter.drawRoundedRect(QRectF(r).adjusted(0.5, 0.5, -0.5, -0.5), radius, radius)
+            painter.setPen(self._c(color))
+            painter.drawText(r, Qt.AlignmentFlag.AlignCenter, text)
+
+    # ── 마우스 ──
+    def _target_at(self, rect: QRect, index: QModelIndex, pos) -> tuple[int, str, object] | None:
+        for r, _text, action, payload, _color in self._hit_targets(rect, index):
+            if r.contains(pos):
+                return (index.row(), action, payload)
+        return None
+
+    def editorEvent(self, event, model, option, index) -> bool:
+        if event.type() != QEvent.Type.MouseButtonRelease or event.button() != Qt.MouseButton.LeftButton:
+            return False
+        target = self._target_at(option.rect, index, event.position().toPoint())
+        if not target:
+            return False
+        project = index.data(ProjectListModel.ProjectRole)
+        self.action_triggered.emit(project.get("id", ""), target[1], target[2])
+        return True
 
-    def _restore_version(self, version_path: Path, name: str, folder: Path):
-        v_label = version_path.stem.split("_")[-1]  # V003 등
-        reply = QMessageBox.question(
-            self, "버전 복원",
-            f"{v_label} 버전으로 복원하시겠습니까?\n\n"
-            "현재 상태가 자동으로 새 스냅샷으로 백업됩니다.",
-            QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No
-        )
-        if reply != QMessageBox.StandardButton.Yes:
+    def _set_hover(self, target: tuple[int, str, object] | None):
+        if target == self._hover:
             return
-        project_local = {**self.project, "name": name,
-                         "location": str(folder.parent)}
-        ok, msg = restore_version(version_path, project_local)
-        if ok:
-            QMessageBox.information(self, "복원 완료", msg)
-            self.refresh_requested.emit()
-        else:
-            QMessageBox.warning(self, "복원 실패", msg)
+        self._hover = target
+        viewport = self._view.viewport()
+        viewport.setCursor(
+            Qt.CursorShape.PointingHandCursor if target else Qt.CursorShape.ArrowCursor
+        )
+        viewport.update()
+
+    def eventFilter(self, obj, event) -> bool:
+        """뷰포트 마우스 이동 → 버튼 hover 표시 / 커서 변경"""
+        etype = event.type()
+        if etype == QEvent.Type.MouseMove:
+            pos = event.position().toPoint()
+            index = self._view.indexAt(pos)
+            target = self._target_at(self._view.visualRect(index), index, pos) if index.isValid() else None
+            self._set_hover(target)
+        elif etype == QEvent.Type.Leave:
+            self._set_hover(None)
+        return False
 
-    def _import_resolve_drp(self, drp_path: str):
-        ok, msg = _resolve_import_drp(drp_path)
-        if ok:
-            QMessageBox.information(self, "Import 완료", msg)
-        else:
-            reply = QMessageBox.question(
-                self, "Resolve 실행 필요",
-                f"{msg}\n\n파일 탐색기에서 .drp 위치를 열까요?",
-                QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No
-            )
-            if reply == QMessageBox.StandardButton.Yes:
-                open_folder(str(Path(drp_path).parent))
 
-    def _connect_resolve(self, proj_name: str, folder_path: str):
-        project_local = {**self.project, "name": proj_name}
-        ok, msg = setup_resolve_bins(project_local, Path(folder_path))
-        if ok:
-            QMessageBox.information(self, "Resolve 연결 완료", msg)
-            self.refresh_requested.emit()
-        else:
-            QMessageBox.warning(self, "Resolve 연결 실패", msg)
+class ProjectFolderWatcher(QObject):
+    """
+    등록된 프로젝트 폴더 감시 — Linux는 InotifyWatcher, 그 외는 QFileSystemWatcher.
+    변경된 폴더 경로를 folder_changed로 알립니다 (항상 UI 스레드에서 수신).
+    QFileSystemWatcher는 폴더마다 fd / 핸들을 쓰므로 전체 대신 불러온 카드의 폴더만, 최대 MAX_QT_PATHS개.
+    """
+    folder_changed = pyqtSignal(str)
+    MAX_QT_PATHS = 256
 
-    def _launch_and_update(self, app_key: str):
-        self.manager.update_last_opened(self.project.get("id", ""))
-        self.opened.emit(self.project.get("id", ""))
-        launch_app(app_key, manager=self.manager)
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._inotify = InotifyWatcher.create(self.folder_changed.emit)
+        self._qt: QFileSystemWatcher | None = None
+        if self._inotify is None:
+            self._qt = QFileSystemWatcher(self)
+            self._qt.directoryChanged.connect(self.folder_changed.emit)
+        app = QApplication.instance()
+        if app is not None:
+            app.aboutToQuit.connect(self.close)
+
+    @property
+    def watches_all(self) -> bool:
+        """등록된 폴더 전체를 감시할 수 있는지 (False면 보이는 카드 폴더만 set_folders)"""
+        return self._inotify is not None
+
+    def set_folders(self, folders: list[str]):
+        """감시 대상 교체 (추가 / 삭제된 폴더만 반영). QFileSystemWatcher는 앞쪽 MAX_QT_PATHS개만."""
+        if self._inotify is not None:
+            self._inotify.set_folders(set(folders))
+            return
+        wanted = set(list(dict.fromkeys(folders))[:self.MAX_QT_PATHS])
+        current = set(self._qt.directories())
+        if current - wanted:
+            self._qt.removePaths(list(current - wanted))
+        if wanted - current:
+            self._qt.addPaths(list(wanted - current))   # 없는 폴더는 Qt가 건너뜀 (별도 stat 없음)
 
-    def _confirm_delete(self, pid: str, name: str):
-        reply = QMessageBox.question(
-            self, "프로젝트 삭제",
-            f"'{name}' 프로젝트를 목록에서 삭제하시겠습니까?\n(실제 폴더는 삭제되지 않습니다)",
-            QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No
-        )
-        if reply == QMessageBox.StandardButton.Yes:
-            self.deleted.emit(pid)
+    def close(self):
+        if self._inotify is not None:
+            self._inotify.close()
 
 
 # ─────────────────────────────────────────────
@@ -2032,11 +1639,30 @@ class ProjectCard(QFrame):
 # ─────────────────────────────────────────────
 class RecentProjectsPage(QWidget):
     _FILTERS = ["전체", "Resolve", "Premiere", "AE"]
+    _SORTS = [("최근 연 순", "last_opened"), ("생성일 순", "created_at"), ("이름 순", "name")]
+    NLE_BATCH = 200   # NLE 감지 결과를 UI 스레드로 넘기는 단위
 
     def __init__(self, manager: ProjectManager):
         super().__init__()
         self.manager = manager
         self._active_filter = "전체"
+        self._nles_verified = False   # NLE 패싯: 이번 실행에서 전체 프로젝트를 한 번 확인했는지
+        self._nles_checking = False   # NLE 감지 작업이 백그라운드에서 진행 중
+        # 감지 작업 → UI 스레드에서 검색 색인 반영 (manager는 UI 스레드 전용)
+        self._ui_call = UiThreadCall(self)
+        self._quitting = False
+        app = QApplication.instance()
+        if app is not None:
+            app.aboutToQuit.connect(self._on_quit)
+        # 폴더 → 프로젝트 id (감시 이벤트를 카드 행으로 연결)
+        self._folder_ids: dict[str, list[str]] = {}
+        self._watcher = ProjectFolderWatcher(self)
+        self._watcher.folder_changed.connect(self._on_folder_changed)
+        # QFileSystemWatcher 폴백: 목록 / 스크롤이 바뀌면 잠시 뒤 보이는 카드 폴더로 감시 대상 교체
+        self._watch_timer = QTimer(self)
+        self._watch_timer.setSingleShot(True)
+        self._watch_timer.setInterval(150)
+        self._watch_timer.timeout.connect(self._watch_loaded_rows)
         self._setup_ui()
 
     def _setup_ui(self):
@@ -2066,6 +1692,25 @@ class RecentProjectsPage(QWidget):
         title_row.addWidget(self._count_lbl)
         hl.addLayout(title_row)
 
+        # ── 검색 (입력할 때마다 색인 검색) ──
+        self._search = QLineEdit()
+        self._search.setPlaceholderText("검색 — 이름, 클라이언트, 유형, 스펙, 폴더 경로, 생성일 (2025-03)")
+        self._search.setClearButtonEnabled(True)
+        self._search.setStyleSheet(f"""
+            QLineEdit {{
+                background: {COLORS['surface2']};
+                border: 1px solid {COLORS['border']};
+                border-radius: 6px;
+                color: {COLORS['text']};
+                font-size: 13px;
+                padding: 8px 12px;
+                min-height: 36px;
+            }}
+            QLineEdit:focus {{ border-color: {COLORS['accent']}; }}
+        """)
+        self._search.textChanged.connect(self._apply_filters)
+        hl.addWidget(self._search)
+
         # ── NLE 필터 탭 ──
         filter_row = QHBoxLayout()
         filter_row.setSpacing(6)
@@ -2090,26 +1735,55 @@ class RecentProjectsPage(QWidget):
             btn.clicked.connect(lambda _, l=label: self._set_filter(l))
             filter_row.addWidget(btn)
         filter_row.addStretch()
+
+        # ── 유형 / 해상도 패싯 (항목마다 현재 검색 기준 개수) ──
+        self._type_combo = make_combo([])
+        self._res_combo = make_combo([])
+        for cb in (self._type_combo, self._res_combo):
+            cb.setMinimumWidth(150)
+            cb.currentIndexChanged.connect(self._apply_filters)
+            filter_row.addWidget(cb)
+
+        # ── 정렬 ──
+        self._sort_combo = make_combo([])
+        for label, key in self._SORTS:
+            self._sort_combo.addItem(label, key)
+        self._sort_combo.currentIndexChanged.connect(self._apply_filters)
+        filter_row.addWidget(self._sort_combo)
         hl.addLayout(filter_row)
 
         layout.addWidget(header)
         layout.addWidget(divider())
 
-        # ── 스크롤 카드 영역 ──
-        scroll = QScrollArea()
-        scroll.setWidgetResizable(True)
-        scroll.setStyleSheet("QScrollArea { border: none; background: transparent; }")
-        scroll.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
-
-        self._cards_widget = QWidget()
-        self._cards_widget.setStyleSheet(f"background: {COLORS['bg']};")
-        self._cards_layout = QVBoxLayout(self._cards_widget)
-        self._cards_layout.setContentsMargins(40, 20, 40, 40)
-        self._cards_layout.setSpacing(14)
-        self._cards_layout.addStretch()
-
-        scroll.setWidget(self._cards_widget)
-        layout.addWidget(scroll)
+        # ── 카드 목록 (보이는 행만 그리는 가상 스크롤) ──
+        self._list = QListView()
+        self._list.setUniformItemSizes(True)
+        self._list.setVerticalScrollMode(QAbstractItemView.ScrollMode.ScrollPerPixel)
+        self._list.verticalScrollBar().setSingleStep(24)
+        self._list.setSelectionMode(QAbstractItemView.SelectionMode.NoSelection)
+        self._list.setFocusPolicy(Qt.FocusPolicy.NoFocus)
+        self._list.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
+        self._list.setMouseTracking(True)
+        self._list.setStyleSheet(
+            f"QListView {{ border: none; background: {COLORS['bg']}; padding-top: 13px; }}"
+        )
+        self._model = ProjectListModel(self.manager, self._list)
+        self._delegate = ProjectCardDelegate(self.manager, self._list)
+        self._delegate.action_triggered.connect(self._on_card_action)
+        self._list.setModel(self._model)
+        self._list.setItemDelegate(self._delegate)
+        layout.addWidget(self._list, 1)
+        if not self._watcher.watches_all:
+            for sig in (self._model.modelReset, self._model.rowsInserted, self._model.rowsRemoved,
+                        self._list.verticalScrollBar().valueChanged):
+                sig.connect(self._watch_timer.start)
+
+        self._empty_lbl = QLabel()
+        self._empty_lbl.setAlignment(Qt.AlignmentFlag.AlignHCenter | Qt.AlignmentFlag.AlignTop)
+        self._empty_lbl.setStyleSheet(
+            f"color: {COLORS['muted']}; font-size: 14px; padding: 60px;"
+        )
+        layout.addWidget(self._empty_lbl, 1)
         self.refresh()
 
     def _style_filter_btn(self, btn: QPushButton, active: bool, color: str):
@@ -2153,73 +1827,332 @@ class RecentProjectsPage(QWidget):
         }
         for lbl, btn in self._filter_btns.items():
             self._style_filter_btn(btn, lbl == label, filter_colors[lbl])
-        self.refresh()
+        self._apply_filters()
+
+    def on_apps_detected(self):
+        # 카드의 NLE 버튼은 감지 결과에 따라 달라짐
+        self._list.viewport().update()
 
     def refresh(self):
-        # 기존 카드 제거 (stretch 제외)
-        while self._cards_layout.count() > 1:
-            item = self._cards_layout.takeAt(0)
-            if item.widget():
-                item.widget().deleteLater()
-
-        # 필터 적용
-        all_projects = self.manager.projects
-        if self._active_filter == "전체":
-            filtered = all_projects
+        self._apply_filters(keep_info=False)
+        self._watch_projects(self.manager.projects)
+
+    def _verify_nles(self):
+        """
+        NLE 패싯에 필요한 감지 결과 채우기 (백그라운드 — 프로젝트마다 폴더 stat / scandir).
+        처음 한 번은 전체를 (mtime 캐시로) 확인하고, 이후에는 새로 등록된 프로젝트만 —
+        실행 중 변경은 폴더 감시가 반영합니다. 처음 확인하는 동안 NLE 탭은 '검사 중'.
+        """
+        if self._nles_checking or not self.manager.loaded:
+            return
+        if self._nles_verified:
+            ids = self.manager.index.nle_unknown()
+            projects = [p for p in map(self.manager.get, ids) if p is not None]
+        else:
+            projects = list(self.manager.projects)
+        if not projects:
+            self._nles_verified = True
+            return
+        self._nles_checking = True
+        cache = self.manager.nle_cache
+
+        def work(progress) -> tuple[bool, str]:
+            batch: list[tuple[str, set[str]]] = []
+            for i, project in enumerate(projects, 1):
+                if self._quitting:
+                    return False, ""
+                batch.append((project.get("id", ""), detect_project_nles(project, cache)))
+                if len(batch) >= self.NLE_BATCH or i == len(projects):
+                    ok, _ = self._ui_call.call(self._index_nles, batch, abort=lambda: self._quitting)
+                    if not ok:
+                        return False, ""
+                    batch = []
+            return True, ""
+
+        job = Job("verify_nles", work)
+        job.signals.finished.connect(self._on_nles_verified)
+        QThreadPool.globalInstance().start(job)
+
+    def _index_nles(self, batch: list[tuple[str, set[str]]]):
+        for pid, nles in batch:
+            self.manager.index_nles(pid, nles)
+
+    def _on_nles_verified(self, _key: str, ok: bool, msg: str):
+        self._nles_checking = False
+        if self._quitting:
+            return
+        if not ok:
+            print(f"[ERROR] NLE 감지: {msg}")   # 확인 못 한 항목은 다음 조회 때 다시
+        self._nles_verified = True
+        if ok and self._active_filter != "전체":
+            self._apply_filters()   # 탭 목록 / 개수를 확인된 결과로
         else:
-            filtered = [
-                p for p in all_projects
-                if self._active_filter in detect_project_nles(p)
-            ]
-
-        # 최대 RECENT_LIMIT개만 표시
-        projects = filtered[:RECENT_LIMIT]
-        hidden  = max(0, len(filtered) - RECENT_LIMIT)
-
-        # 카운트 레이블 업데이트
-        total_txt = f"총 {len(all_projects)}개"
-        if self._active_filter != "전체":
-            total_txt += f"  ·  {self._active_filter} {len(filtered)}개"
-        if hidden:
-            total_txt += f"  ·  최근 {RECENT_LIMIT}개 표시"
+            text, filters, _ = self._query_args(verify=False)
+            self._show_facets(self.manager.query(text, filters, limit=0)[2])
+
+    def _on_quit(self):
+        """종료 시 진행 중인 NLE 감지 중단 (스레드 풀이 작업 종료를 기다리므로)"""
+        self._quitting = True
+
+    def _query_args(self, verify: bool = True) -> tuple[str, dict[str, str], str]:
+        """현재 검색어 / 패싯 필터 / 정렬 기준 (verify: NLE 탭이면 감지 안 된 프로젝트 확인 시작)"""
+        if verify and self._active_filter != "전체":
+            self._verify_nles()
+        filters = {
+            "nle": "" if self._active_filter == "전체" else self._active_filter,
+            "type": self._type_combo.currentData() or "",
+            "resolution": self._res_combo.currentData() or "",
+        }
+        return self._search.text(), filters, self._sort_combo.currentData() or "last_opened"
+
+    def _apply_filters(self, *_, keep_info: bool = True):
+        """
+        검색어 + NLE 탭 + 유형 / 해상도 패싯 + 정렬 적용 — 첫 페이지만 불러오고 나머지는 스크롤 시.
+        정렬 / 검색만 바뀐 경우 카드 정보는 다시 계산하지 않습니다.
+        """
+        text, filters, sort_by = self._query_args()
+        first, total, facets = self.manager.query(
+            text, filters, sort_by, 0, ProjectListModel.PAGE_SIZE
+        )
+
+        def fetch(offset: int, limit: int) -> list[dict]:
+            return self.manager.query(text, filters, sort_by, offset, limit)[0]
+
+        self._model.set_source(first, total, fetch, keep_info=keep_info)
+        self._show_facets(facets)
+        self._update_counts()
+
+    def _show_facets(self, facets: dict[str, dict[str, int]]):
+        """패싯 개수를 NLE 탭 / 콤보 항목에 표시"""
+        if self._nles_verified:
+            nle_counts = facets["nle"]
+            for label, btn in self._filter_btns.items():
+                n = nle_counts.get("" if label == "전체" else label, 0)
+                btn.setText(f"{label}  {n}")
+        elif self._nles_checking:
+            for label, btn in self._filter_btns.items():
+                btn.setText(label if label == "전체" else f"{label}  검사 중")
+        order = {t: i for i, t in enumerate(FOLDER_PRESETS)}
+        self._fill_facet_combo(self._type_combo, "유형 전체", facets["type"], order)
+        self._fill_facet_combo(self._res_combo, "해상도 전체", facets["resolution"], {})
+
+    @staticmethod
+    def _fill_facet_combo(cb: QComboBox, all_label: str, counts: dict[str, int], order: dict[str, int]):
+        current = cb.currentData() or ""
+        values = [v for v, n in counts.items() if v and (n or v == current)]
+        values.sort(key=lambda v: (order.get(v, len(order)), -counts[v], v))
+        cb.blockSignals(True)
+        cb.clear()
+        cb.addItem(f"{all_label} ({counts.get('', 0)})", "")
+        for v in values:
+            cb.addItem(f"{v} ({counts[v]})", v)
+        cb.setCurrentIndex(max(0, cb.findData(current)))
+        cb.blockSignals(False)
+
+    def _watch_projects(self, projects: list[dict]):
+        """등록된 프로젝트 폴더를 감시 대상으로 (추가 / 삭제된 폴더만 반영)"""
+        folder_ids: dict[str, list[str]] = {}
+        for p in projects:
+            if p.get("location") and p.get("name"):
+                folder = str(Path(p["location"]) / p["name"])
+                folder_ids.setdefault(folder, []).append(p.get("id", ""))
+        self._folder_ids = folder_ids
+        if self._watcher.watches_all:
+            self._watcher.set_folders(list(folder_ids))
+        else:
+            self._watch_loaded_rows()
+
+    def _watch_loaded_rows(self):
+        """
+        QFileSystemWatcher 폴백: 불러온 카드의 폴더만 감시 — 화면 맨 위 카드부터 (상한은 감시자가 적용).
+        폴더가 없다고 확인된 카드는 건너뜀 (UI 스레드에서 stat하지 않음).
+        """
+        projects = self._model.projects()
+        first = max(0, self._list.indexAt(QPoint(0, 0)).row())
+        folders = []
+        for p in projects[first:] + projects[:first]:
+            info = self._model.cached_info(p.get("id", ""))
+            if info is not None and info.loaded and not info.exists:
+                continue
+            if p.get("location") and p.get("name"):
+                folders.append(str(Path(p["location"]) / p["name"]))
+        self._watcher.set_folders(folders)
+
+    def _on_folder_changed(self, folder: str):
+        """프로젝트 폴더의 NLE 파일이 바뀜 → 캐시 무효화 후 해당 카드만 다시 계산"""
+        self.manager.nle_cache.invalidate(Path(folder))
+        for pid in self._folder_ids.get(folder, []):
+            project = self.manager.get(pid)
+            if project is None:
+                continue
+            nles = detect_project_nles(project, self.manager.nle_cache)
+            self.manager.index_nles(pid, nles)
+            self._model.refresh_row(pid, nles)
+            if self._active_filter != "전체":
+                self._sync_row(pid)   # 이 NLE 탭에 들어오거나 빠질 수 있음
+        if self._nles_verified:
+            text, filters, _ = self._query_args()
+            self._show_facets(self.manager.query(text, filters, limit=0)[2])
+            self._update_counts()
+
+    def _sync_row(self, project_id: str):
+        """프로젝트 1개의 필터 일치 여부가 바뀌었으면 그 행만 추가 / 제거 (스크롤 / 카드 정보 유지)"""
+        text, filters, sort_by = self._query_args()
+        loaded = self._model.rowCount()
+        page, total, _ = self.manager.query(text, filters, sort_by, 0, loaded + 1)
+        pos = next((i for i, p in enumerate(page) if p.get("id") == project_id), None)
+        row = self._model.row_of(project_id)
+        if row >= 0 and pos is None:
+            self._model.remove_project(project_id)
+        elif row < 0 and pos is not None and pos < loaded:
+            self._model.insert_project(pos, page[pos])
+        self._model.set_total(total)
+
+    def _update_counts(self):
+        # 카운트 레이블 + 빈 목록 안내
+        shown = self._model.total()
+        searching = bool(
+            self._search.text().strip() or self._type_combo.currentData() or self._res_combo.currentData()
+        )
+        total_txt = f"총 {len(self.manager.projects)}개" if self.manager.loaded else "불러오는 중..."
+        if searching:
+            total_txt += f"  ·  검색 결과 {shown}개"
+        elif self._active_filter != "전체":
+            total_txt += f"  ·  {self._active_filter} {shown}개"
         self._count_lbl.setText(total_txt)
 
-        if not projects:
-            msg = (
-                "이 NLE로 생성된 프로젝트가 없습니다."
+        empty = not shown
+        self._list.setVisible(not empty)
+        self._empty_lbl.setVisible(empty)
+        if empty:
+            self._empty_lbl.setText(
+                "프로젝트 목록을 불러오는 중입니다..."
+                if not self.manager.loaded
+                else "검색 조건에 맞는 프로젝트가 없습니다."
+                if searching
+                else "NLE 파일을 검사하는 중입니다..."
+                if self._active_filter != "전체" and self._nles_checking and not self._nles_verified
+                else "이 NLE로 생성된 프로젝트가 없습니다."
                 if self._active_filter != "전체"
                 else "아직 생성된 프로젝트가 없습니다.\n새 프로젝트 탭에서 첫 프로젝트를 만들어보세요!"
             )
-            empty_lbl = QLabel(msg)
-            empty_lbl.setAlignment(Qt.AlignmentFlag.AlignCenter)
-            empty_lbl.setStyleSheet(
-                f"color: {COLORS['muted']}; font-size: 14px; padding: 60px;"
+
+    # ── 카드 동작 ────────────────────────────────
+    def _on_card_action(self, project_id: str, action: str, payload: object):
+        project = self.manager.get(project_id)
+        if project is None:
+            return
+        name   = project.get("name", "")
+        folder = Path(project.get("location", "")) / name
+        if action == "open_folder":
+            open_folder(str(folder))
+        elif action == "resolve_import":
+            self._import_resolve_drp(str(folder / f"{name}.drp"))
+        elif action == "resolve_connect":
+            self._connect_resolve(project, folder)
+        elif action == "launch":
+            self._launch_and_update(project, str(payload))
+        elif action == "delete":
+            self._confirm_delete(project)
+        elif action == "snapshot":
+            self._create_snapshot(project)
+        elif action == "restore":
+            self._restore_version(project, Path(payload))
+        elif action == "more_versions":
+            self._show_version_menu(project)
+
+    def _show_version_menu(self, project: dict):
+        """카드에 표시되지 않은 이전 버전까지 모두 보여주는 복원 메뉴"""
+        info = self._model.card_info(project)
+        menu = QMenu(self)
+        for v in info.versions:
+            act = menu.addAction(
+                f"{v['label']}   {v['modified'].strftime('%m/%d %H:%M')}   {v['size_mb']:.1f} MB"
             )
-            self._cards_layout.insertWidget(0, empty_lbl)
+            act.triggered.connect(lambda _, p=v["path"]: self._restore_version(project, p))
+        menu.exec(QCursor.pos())
+
+    def _create_snapshot(self, project: dict):
+        ok, msg = create_smart_snapshot(project)
+        if ok:
+            QMessageBox.information(self, "스냅샷 생성", msg)
+            self._model.refresh_versions(project.get("id", ""))
+        else:
+            QMessageBox.warning(self, "스냅샷 실패", msg)
+
+    def _restore_version(self, project: dict, version_path: Path):
+        v_label = version_path.stem.split("_")[-1]  # V003 등
+        reply = QMessageBox.question(
+            self, "버전 복원",
+            f"{v_label} 버전으로 복원하시겠습니까?\n\n"
+            "현재 상태가 자동으로 새 스냅샷으로 백업됩니다.",
+            QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No
+        )
+        if reply != QMessageBox.StandardButton.Yes:
             return
+        ok, msg = restore_version(version_path, project)
+        if ok:
+            QMessageBox.information(self, "복원 완료", msg)
+            self._model.refresh_versions(project.get("id", ""))
+        else:
+            QMessageBox.warning(self, "복원 실패", msg)
 
-        for i, project in enumerate(projects):
-            card = ProjectCard(project, self.manager)
-            card.deleted.connect(self._on_delete)
-            card.opened.connect(self._on_opened)
-            card.refresh_requested.connect(self.refresh)
-            self._cards_layout.insertWidget(i, card)
+    def _import_resolve_drp(self, drp_path: str):
+        ok, msg = resolve_import_drp(drp_path)
+        if ok:
+            QMessageBox.information(self, "Import 완료", msg)
+        else:
+            reply = QMessageBox.question(
+                self, "Resolve 실행 필요",
+                f"{msg}\n\n파일 탐색기에서 .drp 위치를 열까요?",
+                QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No
+            )
+            if reply == QMessageBox.StandardButton.Yes:
+                open_folder(str(Path(drp_path).parent))
 
-    def _on_delete(self, project_id: str):
-        self.manager.delete(project_id)
-        self.refresh()
+    def _connect_resolve(self, project: dict, folder: Path):
+        ok, msg = setup_resolve_bins(project, folder)
+        if ok:
+            QMessageBox.information(self, "Resolve 연결 완료", msg)
+            self._model.refresh_row(project.get("id", ""))
+        else:
+            QMessageBox.warning(self, "Resolve 연결 실패", msg)
+
+    def _launch_and_update(self, project: dict, app_key: str):
+        self.manager.update_last_opened(project.get("id", ""))
+        if self._sort_combo.currentData() == "last_opened":
+            self._model.move_to_top(project.get("id", ""))
+        launch_app(app_key, manager=self.manager)
 
-    def _on_opened(self, project_id: str):
-        self.manager.update_last_opened(project_id)
+    def _confirm_delete(self, project: dict):
+        reply = QMessageBox.question(
+            self, "프로젝트 삭제",
+            f"'{project.get('name', '')}' 프로젝트를 목록에서 삭제하시겠습니까?\n(실제 폴더는 삭제되지 않습니다)",
+            QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No
+        )
+        if reply == QMessageBox.StandardButton.Yes:
+            self.manager.delete(project.get("id", ""))
+            self._model.remove_project(project.get("id", ""))
+            text, filters, _ = self._query_args()
+            self._show_facets(self.manager.query(text, filters, limit=0)[2])
+            self._update_counts()
 
 
 # ─────────────────────────────────────────────
 # SettingsPage
 # ─────────────────────────────────────────────
 class SettingsPage(QWidget):
+    projects_changed = pyqtSignal()   # 볼륨 스캔으로 프로젝트가 등록됨
+
     def __init__(self, manager: ProjectManager):
         super().__init__()
         self.manager = manager
+        # 스캔 스레드가 찾은 프로젝트는 UI 스레드에서 등록 (manager는 UI 스레드 전용)
+        self._ui_call = UiThreadCall(self)
+        self._quitting = False
+        app = QApplication.instance()
+        if app is not None:
+            app.aboutToQuit.connect(self._on_quit)
         self._setup_ui()
 
     def _setup_ui(self):
@@ -2240,13 +2173,20 @@ class SettingsPage(QWidget):
         layout.addWidget(divider())
 
         # ── NLE 앱 감지 / 수동 경로 지정 ──
-        layout.addWidget(section_label("NLE 앱 감지"))
+        nle_hdr = QHBoxLayout()
+        nle_hdr.addWidget(section_label("NLE 앱 감지"))
+        nle_hdr.addStretch()
+        rescan_btn = make_ghost_button("다시 검색", small=True)
+        rescan_btn.clicked.connect(self._rescan_apps)
+        nle_hdr.addWidget(rescan_btn)
+        layout.addLayout(nle_hdr)
         apps = {
             "DaVinci Resolve": ("Resolve", COLORS["resolve"]),
             "Adobe Premiere Pro": ("Premiere", COLORS["premiere"]),
             "Adobe After Effects": ("AE", COLORS["ae"]),
         }
         self._nle_inputs: dict[str, QLineEdit] = {}
+        self._nle_status: dict[str, tuple[QLabel, QLabel]] = {}
         for display, (key, color) in apps.items():
             # 상태 행
             status_row = QHBoxLayout()
@@ -2255,18 +2195,12 @@ class SettingsPage(QWidget):
             status_row.addWidget(lbl)
 
             override = self.manager.get_nle_override(key)
-            detected = find_app(key, override)
-            if detected:
-                status = QLabel("✓  감지됨")
-                status.setStyleSheet(f"color: {COLORS['success']}; font-size: 12px; font-weight: 600;")
-                status_row.addWidget(status)
-                path_lbl = QLabel(detected)
-                path_lbl.setStyleSheet(f"color: {COLORS['muted']}; font-size: 11px;")
-                status_row.addWidget(path_lbl)
-            else:
-                status = QLabel("✗  미감지  —  아래에 경로를 직접 입력하세요")
-                status.setStyleSheet(f"color: {COLORS['muted']}; font-size: 12px;")
-                status_row.addWidget(status)
+            status = QLabel()
+            path_lbl = QLabel()
+            path_lbl.setStyleSheet(f"color: {COLORS['muted']}; font-size: 11px;")
+            status_row.addWidget(status)
+            status_row.addWidget(path_lbl)
+            self._nle_status[key] = (status, path_lbl)
             status_row.addStretch()
             layout.addLayout(status_row)
 
@@ -2330,6 +2264,21 @@ class SettingsPage(QWidget):
 
         layout.addWidget(divider())
 
+        # ── 볼륨 스캔 (기존 프로젝트 일괄 등록) ──
+        layout.addWidget(section_label("기존 프로젝트 가져오기"))
+        scan_row = QHBoxLayout()
+        self._scan_lbl = QLabel("project.json이 있는 폴더를 찾아 최근 프로젝트에 등록합니다 (중단 시 이어서 탐색)")
+        self._scan_lbl.setStyleSheet(f"color: {COLORS['muted']}; font-size: 12px;")
+        scan_row.addWidget(self._scan_lbl)
+        scan_row.addStretch()
+        self._scan_btn = make_ghost_button("볼륨 스캔", small=True)
+        self._scan_btn.clicked.connect(self._scan_volume)
+        scan_row.addWidget(self._scan_btn)
+        layout.addLayout(scan_row)
+        self._crawler: ProjectCrawler | None = None
+
+        layout.addWidget(divider())
+
         # ── 데이터 파일 위치 ──
         layout.addWidget(section_label("데이터 파일 위치"))
         data_row = QHBoxLayout()
@@ -2348,6 +2297,83 @@ class SettingsPage(QWidget):
         outer.setContentsMargins(0, 0, 0, 0)
         scroll.setWidget(inner)
         outer.addWidget(scroll)
+        self._refresh_detection()
+
+    def on_apps_detected(self):
+        self._refresh_detection()
+
+    def _refresh_detection(self):
+        """감지 상태 레이블 갱신 (AppDetector 캐시 기준 — 탐색 중이면 '검색 중')"""
+        searching = not self.manager.apps.ready()
+        for key, (status, path_lbl) in self._nle_status.items():
+            detected = self.manager.apps.peek(key)
+            if searching:
+                status.setText("…  검색 중")
+                status.setStyleSheet(f"color: {COLORS['muted']}; font-size: 12px;")
+                path_lbl.setText("")
+            elif detected:
+                status.setText("✓  감지됨")
+                status.setStyleSheet(f"color: {COLORS['success']}; font-size: 12px; font-weight: 600;")
+                path_lbl.setText(detected)
+            else:
+                status.setText("✗  미감지  —  아래에 경로를 직접 입력하세요")
+                status.setStyleSheet(f"color: {COLORS['muted']}; font-size: 12px;")
+                path_lbl.setText("")
+
+    def _rescan_apps(self):
+        self.manager.apps.rescan()
+        self._refresh_detection()
+
+    def _scan_volume(self):
+        """볼륨 스캔 시작 / 진행 중이면 중단"""
+        if self._crawler is not None:
+            self._crawler.cancel()
+            self._scan_btn.setEnabled(False)
+            return
+        if not self.manager.loaded:
+            # 등록된 폴더를 모르면 이미 있는 프로젝트까지 다시 등록하게 됨
+            QMessageBox.information(self, "볼륨 스캔", "프로젝트 목록을 불러오는 중입니다. 잠시 후 다시 시도하세요.")
+            return
+        root = QFileDialog.getExistingDirectory(self, "스캔할 볼륨 / 폴더 선택")
+        if not root:
+            return
+
+        def register(batch: list[dict]) -> bool:
+            ok, _ = self._ui_call.call(self.manager.add_many, batch, abort=lambda: self._quitting)
+            return ok
+
+        crawler = self._crawler = ProjectCrawler(self.manager, [root], register=register)
+
+        def run(progress: Callable[[str], None]) -> tuple[bool, str]:
+            crawler.progress = lambda scanned, added: progress(
+                f"폴더 {scanned:,}개 확인 · 프로젝트 {added:,}개 등록"
+            )
+            result = crawler.run()
+            state = "중단됨 (다시 스캔하면 이어서 탐색)" if result["cancelled"] else "완료"
+            return True, (
+                f"{state} — 폴더 {result['scanned']:,}개 · 새 프로젝트 {result['added']:,}개"
+                f"  ({result['seconds']:.1f}초)"
+            )
+
+        job = Job("scan", run)
+        job.signals.progress.connect(lambda _, text: self._scan_lbl.setText(text))
+        job.signals.finished.connect(self._on_scan_done)
+        self._scan_btn.setText("중단")
+        self._scan_lbl.setText("스캔 중...")
+        QThreadPool.globalInstance().start(job)
+
+    def _on_scan_done(self, _key: str, ok: bool, msg: str):
+        self._crawler = None
+        self._scan_btn.setEnabled(True)
+        self._scan_btn.setText("볼륨 스캔")
+        self._scan_lbl.setText(msg)
+        self.projects_changed.emit()
+
+    def _on_quit(self):
+        """종료 시 진행 중인 스캔 중단 (스레드 풀이 작업 종료를 기다리므로)"""
+        self._quitting = True
+        if self._crawler is not None:
+            self._crawler.cancel()
 
     def _browse_default(self):
         path = QFileDialog.getExistingDirectory(
@@ -2381,7 +2407,8 @@ class SettingsPage(QWidget):
             QMessageBox.warning(self, "경로 오류", f"해당 경로가 존재하지 않습니다:\n{path}")
             return
         self.manager.set_nle_override(app_key, path)
-        QMessageBox.information(self, "저장 완료", f"경로가 저장되었습니다.\n앱을 재시작하면 감지 상태가 업데이트됩니다.")
+        self._refresh_detection()
+        QMessageBox.information(self, "저장 완료", "경로가 저장되었습니다.")
 
 
 # ─────────────────────────────────────────────
@@ -2440,14 +2467,57 @@ class NavButton(QPushButton):
 # MainWindow
 # ─────────────────────────────────────────────
 class MainWindow(QMainWindow):
+    apps_detected = pyqtSignal()   # AppDetector 탐색 완료 (탐색 스레드 → UI 스레드)
+
     def __init__(self):
         super().__init__()
-        self.manager = ProjectManager()
+        # 레지스트리 / 검색 색인은 백그라운드에서 (첫 화면은 빈 목록으로 — 끝나면 최근 탭 갱신)
+        self.manager = ProjectManager(defer_load=True)
+        startup_trace.mark("ProjectManager")
+        self._load_registry()
+        # NLE 앱 탐색은 백그라운드 — 끝나면 열린 페이지들이 결과를 반영
+        self.manager.apps.subscribe(self.apps_detected.emit)
+        self.manager.apps.start()
         self.setWindowTitle(f"{APP_NAME}  —  {APP_TAGLINE}")
         self.resize(1120, 720)
         self.setMinimumSize(800, 560)
         self._setup_ui()
         self._apply_global_style()
+        startup_trace.mark("MainWindow UI")
+
+    def paintEvent(self, event):
+        super().paintEvent(event)
+        startup_trace.mark("첫 프레임")
+        startup_trace.report()
+
+    def _load_registry(self):
+        """레지스트리 읽기 + 검색 색인 / 정렬 순서 생성 (작업 스레드) → UI 스레드에서 반영"""
+        manager = self.manager
+        loaded: dict = {}
+
+        def work(progress) -> tuple[bool, str]:
+            t0 = time.perf_counter()
+            by_id = manager.read_registry()
+            t1 = time.perf_counter()
+            loaded["search"] = manager.build_search(by_id)
+            loaded["by_id"] = by_id
+            loaded["ms"] = ((t1 - t0) * 1000, (time.perf_counter() - t1) * 1000)
+            return True, f"{len(by_id):,}개"
+
+        def done(_key: str, ok: bool, msg: str):
+            if not ok:
+                print(f"[ERROR] 레지스트리 로드 실패: {msg}")
+                manager.install_registry({})   # 빈 목록으로라도 동작 (검색 색인은 첫 조회 때)
+            else:
+                manager.install_registry(loaded["by_id"], loaded["search"])
+                read_ms, index_ms = loaded["ms"]
+                startup_trace.note(f"레지스트리 로드 ({msg})", read_ms)
+                startup_trace.note("검색 색인 / 정렬", index_ms)
+            self._on_projects_changed()
+
+        job = Job("registry", work)
+        job.signals.finished.connect(done)
+        QThreadPool.globalInstance().start(job)
 
     def _apply_global_style(self):
         self.setStyleSheet(f"""
@@ -2545,38 +2615,62 @@ class MainWindow(QMainWindow):
         self._stack = QStackedWidget()
         self._stack.setStyleSheet(f"background: {COLORS['bg']};")
 
-        self._new_page = NewProjectPage(self.manager)
-        self._recent_page = RecentProjectsPage(self.manager)
-        self._settings_page = SettingsPage(self.manager)
-
-        self._stack.addWidget(self._new_page)
-        self._stack.addWidget(self._recent_page)
-        self._stack.addWidget(self._settings_page)
-
-        # 프로젝트 생성 시 최근 탭으로 이동
-        self._new_page.project_created.connect(self._on_project_created)
+        # 페이지는 처음 열 때 생성 (시작 시에는 첫 페이지만)
+        self._page_factories: list[Callable[[], QWidget]] = [
+            lambda: NewProjectPage(self.manager),
+            lambda: RecentProjectsPage(self.manager),
+            lambda: SettingsPage(self.manager),
+        ]
+        self._pages: dict[int, QWidget] = {}
 
         root.addWidget(self._stack)
 
         # 초기 선택
         self._navigate(0)
 
+    def _page(self, index: int) -> tuple[QWidget, bool]:
+        """(페이지, 이번에 새로 만들었는지)"""
+        page = self._pages.get(index)
+        if page is not None:
+            return page, False
+        t0 = time.perf_counter()
+        page = self._page_factories[index]()
+        self.apps_detected.connect(page.on_apps_detected)
+        if isinstance(page, NewProjectPage):
+            # 프로젝트 생성 시 최근 탭으로 이동
+            page.project_created.connect(self._on_project_created)
+        elif isinstance(page, SettingsPage):
+            page.projects_changed.connect(self._on_projects_changed)
+        self._stack.addWidget(page)
+        self._pages[index] = page
+        startup_trace.note(f"{type(page).__name__} 생성", (time.perf_counter() - t0) * 1000)
+        return page, True
+
     def _navigate(self, index: int):
         for i, btn in enumerate(self._nav_buttons):
             btn.setActive(i == index)
-        self._stack.setCurrentIndex(index)
-        if index == 1:
-            self._recent_page.refresh()
+        page, created = self._page(index)
+        self._stack.setCurrentWidget(page)
+        if index == 1 and not created:
+            page.refresh()
 
     def _on_project_created(self, project: dict):
         self._navigate(1)
 
+    def _on_projects_changed(self):
+        # 최근 탭이 이미 만들어져 있으면 다시 조회 (아직이면 처음 열 때 최신 목록으로 생성)
+        # — 볼륨 스캔 / 시작 시 레지스트리 로드 완료
+        page = self._pages.get(1)
+        if page is not None:
+            page.refresh()
+
 
 # ─────────────────────────────────────────────
 # 엔트리포인트
 # ─────────────────────────────────────────────
 def main():
     app = QApplication(sys.argv)
+    startup_trace.mark("QApplication")
     app.setApplicationName(APP_NAME)
     app.setApplicationVersion(APP_VERSION)
     app.setOrganizationName(APP_NAME)
@@ -2586,7 +2680,9 @@ def main():
     app.setFont(font)
 
     window = MainWindow()
+    app.aboutToQuit.connect(window.manager.close)
     window.show()
+    startup_trace.mark("show")
     sys.exit(app.exec())
 
 
@@ -0,0 +1 @@
+"""NEXUS — NLE 통합 관제 플랫폼 (핵심 로직: nexus.core, 일괄 생성 CLI: nexus.cli)"""
@@ -0,0 +1,202 @@
+"""
+NEXUS CLI — nexus.core만 사용하므로 PyQt6 / 디스플레이 없이 동작합니다.
+  python main.py batch manifest.csv|json   매니페스트로 프로젝트 일괄 생성
+  python main.py scan ROOT [ROOT ...]      볼륨을 훑어 기존 프로젝트 폴더 등록 (중단 후 재개 가능)
+"""
+
+import re
+import sys
+import json
+import time
+from pathlib import Path
+
+from nexus.core import (
+    FOLDER_PRESETS, ProjectManager, ProjectCrawler, atomic_write_text,
+    create_premiere_project, create_ae_project, setup_resolve_bins,
+)
+
+USAGE = """사용법:
+  python main.py batch manifest.csv|json [--workers N] [--force] [--report PATH]
+  python main.py scan ROOT [ROOT ...] [--workers N]"""
+
+_BATCH_NLE_KEYS = {"premiere": "Premiere", "ae": "AE", "resolve": "Resolve"}
+
+
+def load_batch_manifest(path: Path) -> list[dict]:
+    """
+    매니페스트 읽기 → 행 목록.
+    CSV: 헤더 name, client, location, type, resolution, fps, colorspace, samplerate, nles
+         (nles는 "Premiere;AE"처럼 ; 또는 , 구분)
+    JSON: 같은 키를 가진 객체 배열 또는 {"projects": [...]} (folders 목록 지정 가능)
+    """
+    if path.suffix.lower() == ".json":
+        data = json.loads(path.read_text(encoding="utf-8"))
+        rows = data.get("projects", []) if isinstance(data, dict) else data
+    else:
+        import csv
+        with open(path, newline="", encoding="utf-8-sig") as f:
+            rows = [{k.strip(): (v or "").strip() for k, v in row.items() if k} for row in csv.DictReader(f)]
+    for row in rows:
+        nles = row.get("nles") or []
+        if isinstance(nles, str):
+            nles = re.split(r"[;,]", nles)
+        row["nles"] = [n.strip() for n in nles if n.strip()]
+    return rows
+
+
+def _batch_project(row: dict, manager: ProjectManager) -> tuple[dict | None, str]:
+    """매니페스트 행 → 프로젝트 dict (검증 포함). 실패 시 (None, 오류)"""
+    project_type = row.get("type") or "유튜브"
+    if project_type not in FOLDER_PRESETS:
+        return None, f"알 수 없는 프로젝트 유형: {project_type}"
+    unknown = [n for n in row["nles"] if n.lower() not in _BATCH_NLE_KEYS]
+    if unknown:
+        return None, f"알 수 없는 NLE: {', '.join(unknown)}"
+    project = {
+        "name": str(row.get("name", "")).strip(),
+        "client": str(row.get("client", "")).strip(),
+        "location": str(row.get("location") or manager.get_default_location()).strip(),
+        "type": project_type,
+    }
+    ok, msg = manager.validate_project(project)
+    if not ok:
+        return None, msg
+    custom = manager.get_custom_preset(project_type)
+    project["folders"] = row.get("folders") or (custom if custom is not None else FOLDER_PRESETS[project_type])
+    project["spec"] = {k: str(row.get(k, "")) for k in ("resolution", "fps", "colorspace", "samplerate")}
+    return project, ""
+
+
+def _batch_create(project: dict, nles: list[str], manager: ProjectManager) -> dict:
+    """프로젝트 1개 생성 (워커 스레드). 결과 보고용 dict 반환."""
+    t0 = time.perf_counter()
+    base_path = Path(project["location"]) / project["name"]
+    result = {"name": project["name"], "path": str(base_path), "ok": False, "folders_ok": False,
+              "error": "", "nles": {}}
+    scaffold = manager.create_folders(project)
+    result["folders_ms"] = {step: round(ms, 1) for step, ms in scaffold["timings"].items()}
+    if not scaffold["ok"]:
+        result["error"] = f"폴더 생성 실패: {scaffold['error']}"
+    else:
+        result["folders_ok"] = True
+        for nle in nles:
+            key = _BATCH_NLE_KEYS[nle.lower()]
+            if key == "Premiere":
+                ok, msg = create_premiere_project(project, base_path, manager, run=False)
+            elif key == "AE":
+                ok, msg = create_ae_project(project, base_path, manager, run=False)
+            else:
+                ok, msg = setup_resolve_bins(project, base_path)
+            result["nles"][key] = {"ok": ok, "message": msg}
+        failed = [key for key, n in result["nles"].items() if not n["ok"]]
+        result["ok"] = not failed
+        if failed:
+            result["error"] = f"NLE 설정 실패: {', '.join(failed)}"
+    result["seconds"] = round(time.perf_counter() - t0, 3)
+    return result
+
+
+def batch_main(argv: list[str]) -> int:
+    """일괄 생성 진입점. 요약 JSON을 stdout(또는 --report 파일)에 출력. 전부 성공하면 0 (NLE 설정 포함)."""
+    import argparse
+    from concurrent.futures import ThreadPoolExecutor
+
+    parser = argparse.ArgumentParser(prog="main.py batch", description="매니페스트로 프로젝트 일괄 생성")
+    parser.add_argument("manifest", type=Path, help="CSV 또는 JSON 매니페스트")
+    parser.add_argument("--workers", type=int, default=8, help="동시 생성 수 (기본 8)")
+    parser.add_argument("--force", action="store_true", help="이미 있는 폴더에도 생성")
+    parser.add_argument("--report", type=Path, help="요약 JSON 저장 경로 (기본: stdout)")
+    args = parser.parse_args(argv)
+
+    t0 = time.perf_counter()
+    manager = ProjectManager()
+    rows = load_batch_manifest(args.manifest)
+
+    results: list[dict | None] = [None] * len(rows)
+    todo: list[tuple[int, dict, list[str]]] = []
+    seen: set[Path] = set()
+    for i, row in enumerate(rows):
+        project, err = _batch_project(row, manager)
+        if project is not None:
+            path = Path(project["location"]) / project["name"]
+            if path in seen:
+                project, err = None, "매니페스트 안에서 중복된 프로젝트"
+            elif path.exists() and not args.force:
+                project, err = None, f"폴더가 이미 존재합니다: {path}"
+            seen.add(path)
+        if project is None:
+            results[i] = {"name": str(row.get("name", "")), "ok": False, "error": err, "nles": {}}
+        else:
+            todo.append((i, project, row["nles"]))
+
+    with ThreadPoolExecutor(max_workers=max(1, args.workers)) as pool:
+        futures = [(i, project, pool.submit(_batch_create, project, nles, manager))
+                   for i, project, nles in todo]
+        created = []
+        for i, project, fut in futures:
+            results[i] = fut.result()
+            if results[i]["folders_ok"]:   # NLE 설정만 실패해도 폴더는 있으므로 등록
+                created.append(project)
+
+    # 레지스트리 기록은 마지막에 1회
+    if created:
+        manager.add_many(created)
+    manager.close()
+
+    failed = sum(1 for r in results if not r["ok"])
+    summary = {
+        "manifest": str(args.manifest),
+        "total": len(rows),
+        "created": len(created),
+        "failed": failed,
+        "seconds": round(time.perf_counter() - t0, 3),
+        "projects": [dict(r, row=i + 1) for i, r in enumerate(results)],
+    }
+    text = json.dumps(summary, ensure_ascii=False, indent=2)
+    if args.report:
+        atomic_write_text(args.report, text)
+    else:
+        print(text)
+    return 0 if not failed else 1
+
+
+def scan_main(argv: list[str]) -> int:
+    """볼륨 스캔 진입점. 진행 상황은 stderr, 요약 JSON은 stdout. Ctrl+C로 중단하면 다음 실행 때 이어서 탐색."""
+    import argparse
+
+    parser = argparse.ArgumentParser(prog="main.py scan", description="볼륨의 기존 프로젝트 폴더(project.json) 일괄 등록")
+    parser.add_argument("roots", nargs="+", help="탐색할 루트 폴더")
+    parser.add_argument("--workers", type=int, default=ProjectCrawler.WORKERS, help="동시 scandir 수")
+    args = parser.parse_args(argv)
+
+    manager = ProjectManager()
+    crawler = ProjectCrawler(
+        manager, args.roots,
+        progress=lambda scanned, added: print(
+            f"\r폴더 {scanned:,}개 확인 · 프로젝트 {added:,}개 등록", end="", file=sys.stderr, flush=True
+        ),
+    )
+    crawler.WORKERS = max(1, args.workers)
+    try:
+        result = crawler.run()
+    except KeyboardInterrupt:
+        # 마지막 재개 지점 이후 분량은 다음 실행 때 다시 훑음
+        crawler.cancel()
+        result = {"scanned": crawler.scanned, "added": crawler.added, "cancelled": True}
+    print(file=sys.stderr)
+    manager.close()
+    print(json.dumps(dict(result, roots=crawler.roots), ensure_ascii=False, indent=2))
+    return 0
+
+
+_COMMANDS = {"batch": batch_main, "scan": scan_main}
+
+
+def cli_main(argv: list[str]) -> int:
+    """python main.py <command> ... 분기. 알 수 없는 명령이면 사용법 출력 후 2"""
+    command, rest = argv[0], argv[1:]
+    handler = _COMMANDS.get(command)
+    if handler is None:
+        print(f"알 수 없는 명령: {command}\n{USAGE}", file=sys.stderr)
+        return 2
+    return handler(rest)
@@ -0,0 +1,2902 @@
+"""
+NEXUS 핵심 로직 — 프로젝트 레지스트리 · NLE 앱 감지 · NLE 빈 자동 설정 · 버전 스냅샷.
+PyQt6를 불러오지 않으므로 CLI / 스크립트에서 가볍게 import 할 수 있습니다.
+"""
+
+import os
+import sys
+import re
+import json
+import time
+import atexit
+import threading
+import uuid
+import shutil
+import hashlib
+import bisect
+import gc
+import zipfile
+import sqlite3
+import subprocess
+import platform
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, Iterable, Iterator
+from itertools import islice
+from functools import lru_cache
+from concurrent.futures import ThreadPoolExecutor
+
+try:
+    import fcntl  # reflink(FICLONE)용 — Windows에는 없음
+except ImportError:
+    fcntl = None
+
+try:
+    import psutil  # Resolve 프로세스 감지 (없으면 /proc → pgrep / tasklist)
+except ImportError:
+    psutil = None
+
+APP_NAME    = "NEXUS"
+APP_TAGLINE = "NLE 통합 관제 플랫폼"
+APP_VERSION = "1.1.0"
+
+# ─────────────────────────────────────────────
+# 폴더 프리셋 (프로젝트 타입별)
+# ─────────────────────────────────────────────
+FOLDER_PRESETS = {
+    "광고": [
+        "01_FOOTAGE/RAW",
+        "01_FOOTAGE/SELECTS",
+        "02_AUDIO/MUSIC",
+        "02_AUDIO/SFX",
+        "02_AUDIO/VO",
+        "03_GRAPHICS/AE_Projects",
+        "03_GRAPHICS/Motion",
+        "04_EDIT/Sequences",
+        "04_EDIT/Exports",
+        "05_DELIVERY/Master",
+        "05_DELIVERY/Social",
+        "06_DOCS/Brief",
+        "06_DOCS/Scripts",
+    ],
+    "다큐": [
+        "01_FOOTAGE/Camera_A",
+        "01_FOOTAGE/Camera_B",
+        "01_FOOTAGE/Archive",
+        "01_FOOTAGE/SELECTS",
+        "02_AUDIO/Interview",
+        "02_AUDIO/Ambient",
+        "02_AUDIO/Music",
+        "03_GRAPHICS/Titles",
+        "04_EDIT/Sequences",
+        "04_EDIT/Exports",
+        "05_DELIVERY/Master",
+        "05_DELIVERY/Online",
+        "06_DOCS/Research",
+        "06_DOCS/Scripts",
+    ],
+    "MV": [
+        "01_FOOTAGE/RAW",
+        "01_FOOTAGE/SELECTS",
+        "02_AUDIO/Reference",
+        "02_AUDIO/Stems",
+        "03_GRAPHICS/AE_Projects",
+        "03_GRAPHICS/VFX",
+        "04_EDIT/Sequences",
+        "04_EDIT/Exports",
+        "05_DELIVERY/Master",
+        "05_DELIVERY/YouTube",
+        "05_DELIVERY/Instagram",
+        "06_DOCS/Concept",
+        "06_DOCS/Lyrics",
+    ],
+    "단편": [
+        "01_FOOTAGE/RAW",
+        "01_FOOTAGE/SELECTS",
+        "02_AUDIO/Production",
+        "02_AUDIO/Music",
+        "02_AUDIO/SFX",
+        "02_AUDIO/Dialogue",
+        "03_GRAPHICS/Titles",
+        "04_EDIT/Sequences",
+        "04_EDIT/Exports",
+        "05_DELIVERY/DCP",
+        "05_DELIVERY/Online",
+        "06_DOCS/Script",
+        "06_DOCS/Schedule",
+    ],
+    "이벤트": [
+        "01_FOOTAGE/Main_Stage",
+        "01_FOOTAGE/Behind",
+        "01_FOOTAGE/SELECTS",
+        "02_AUDIO/Sync",
+        "02_AUDIO/Music",
+        "03_GRAPHICS/Intro",
+        "03_GRAPHICS/Lower_Thirds",
+        "04_EDIT/Sequences",
+        "04_EDIT/Exports",
+        "05_DELIVERY/Highlight",
+        "05_DELIVERY/Full",
+        "06_DOCS/Runsheet",
+    ],
+    "유튜브": [
+        "01_FOOTAGE/RAW",
+        "01_FOOTAGE/SELECTS",
+        "02_AUDIO/BGM",
+        "02_AUDIO/SFX",
+        "02_AUDIO/VO",
+        "03_GRAPHICS/Thumbnail",
+        "03_GRAPHICS/Intro_Outro",
+        "04_EDIT/Sequences",
+        "04_EDIT/Exports",
+        "05_DELIVERY/YouTube",
+        "05_DELIVERY/Shorts",
+        "06_DOCS/Script",
+    ],
+}
+
+# ─────────────────────────────────────────────
+# Resolve 기술 스펙 매핑 테이블
+# ─────────────────────────────────────────────
+_RESOLVE_RESOLUTION_MAP: dict[str, tuple[str, str]] = {
+    "4K UHD (3840×2160)":   ("3840", "2160"),
+    "2K DCI (2048×1080)":   ("2048", "1080"),
+    "FHD (1920×1080)":      ("1920", "1080"),
+    "HD (1280×720)":        ("1280", "720"),
+    "Vertical (1080×1920)": ("1080", "1920"),
+}
+
+# (colorScienceMode, colorSpaceTimeline)
+_RESOLVE_COLORSPACE_MAP: dict[str, tuple[str, str]] = {
+    "DaVinci Wide Gamut":  ("davinciYRGBColorManagedv2", "DaVinci WG/Intermediate"),
+    "Rec. 709":            ("davinciYRGB",               "Rec.709 Gamma 2.4"),
+    "Rec. 2020":           ("davinciYRGB",               "Rec.2020"),
+    "S-Gamut3.Cine":       ("davinciYRGB",               "S-Gamut3.Cine/S-Log3"),
+    "ARRI Wide Gamut 4":   ("davinciYRGB",               "ARRI LogC4/LogC4"),
+    "P3-D65":              ("davinciYRGB",               "P3-D65/ST.2084"),
+}
+
+_RESOLVE_SAMPLERATE_MAP: dict[str, str] = {
+    "48 kHz":   "48000",
+    "44.1 kHz": "44100",
+    "96 kHz":   "96000",
+}
+
+
+# ─────────────────────────────────────────────
+# ProjectStore (SQLite 레지스트리)
+# ─────────────────────────────────────────────
+class ProjectStore:
+    """
+    projects.db (SQLite, WAL 모드) 기반 프로젝트 레지스트리.
+    프로젝트 1개 = 1행 — 추가/삭제/갱신 시 해당 행만 기록합니다.
+    id는 PRIMARY KEY 인덱스, last_opened / type은 보조 인덱스로 조회합니다.
+    """
+
+    _SCHEMA = """
+        CREATE TABLE IF NOT EXISTS projects (
+            id          TEXT PRIMARY KEY,
+            seq         INTEGER NOT NULL,
+            type        TEXT,
+            created_at  TEXT,
+            last_opened TEXT,
+            data        TEXT NOT NULL
+        );
+        CREATE INDEX IF NOT EXISTS idx_projects_seq         ON projects(seq);
+        CREATE INDEX IF NOT EXISTS idx_projects_last_opened ON projects(last_opened);
+        CREATE INDEX IF NOT EXISTS idx_projects_type        ON projects(type);
+
+        CREATE TABLE IF NOT EXISTS nle_cache (
+            folder TEXT PRIMARY KEY,
+            mtime  REAL NOT NULL,
+            nles   TEXT NOT NULL
+        );
+
+        CREATE TABLE IF NOT EXISTS dir_usage (
+            path    TEXT PRIMARY KEY,
+            mtime   REAL NOT NULL,
+            bytes   INTEGER NOT NULL,
+            files   INTEGER NOT NULL,
+            subdirs TEXT NOT NULL
+        );
+    """
+
+    def __init__(self, db_path: Path):
+        self.path = db_path
+        self._conn = sqlite3.connect(str(db_path), check_same_thread=False)
+        self._lock = threading.RLock()   # 기록 워커 스레드와 공유
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(self._SCHEMA)
+        self._conn.commit()
+
+    @staticmethod
+    def _row(project: dict, seq: int) -> tuple:
+        return (
+            project["id"],
+            seq,
+            project.get("type", ""),
+            project.get("created_at", ""),
+            project.get("last_opened", ""),
+            json.dumps(project, ensure_ascii=False),
+        )
+
+    def count(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM projects").fetchone()[0]
+
+    def load_all(self) -> list[dict]:
+        """전체 프로젝트 (최근 추가 순)"""
+        with self._lock:
+            rows = self._conn.execute("SELECT data FROM projects ORDER BY seq DESC").fetchall()
+        projects = []
+        for (data,) in rows:
+            try:
+                projects.append(json.loads(data))
+            except Exception:
+                continue
+        return projects
+
+    def insert_many(self, projects: list[dict]):
+        """여러 프로젝트를 한 트랜잭션으로 추가. projects는 최신순 (첫 항목이 맨 앞)."""
+        with self._lock, self._conn:
+            base = self._conn.execute(
+                "SELECT COALESCE(MAX(seq), 0) FROM projects"
+            ).fetchone()[0]
+            n = len(projects)
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO projects VALUES (?, ?, ?, ?, ?, ?)",
+                [self._row(p, base + n - i) for i, p in enumerate(projects)],
+            )
+
+    def apply(self, changes: dict[str, dict | None], to_front: set[str] = frozenset()):
+        """
+        변경분을 한 트랜잭션으로 기록. {id: project} = 추가/갱신, {id: None} = 삭제.
+        새 id와 to_front에 포함된 id는 목록 맨 앞(가장 큰 seq)으로, 나머지는 순서를 유지합니다.
+        """
+        with self._lock, self._conn:
+            for project_id, project in changes.items():
+                if project is None or project_id in to_front:
+                    self._conn.execute("DELETE FROM projects WHERE id = ?", (project_id,))
+                if project is None:
+                    continue
+                row = self._row(project, 0)
+                self._conn.execute(
+                    "INSERT INTO projects VALUES "
+                    "(?, (SELECT COALESCE(MAX(seq), 0) + 1 FROM projects), ?, ?, ?, ?) "
+                    "ON CONFLICT(id) DO UPDATE SET type = excluded.type, "
+                    "created_at = excluded.created_at, last_opened = excluded.last_opened, "
+                    "data = excluded.data",
+                    row[:1] + row[2:],
+                )
+
+    def load_nle_cache(self) -> dict[str, tuple[float, frozenset[str]]]:
+        """폴더 경로 → (폴더 mtime, 감지된 NLE)"""
+        with self._lock:
+            rows = self._conn.execute("SELECT folder, mtime, nles FROM nle_cache").fetchall()
+        return {
+            folder: (mtime, frozenset(n for n in nles.split(",") if n))
+            for folder, mtime, nles in rows
+        }
+
+    def save_nle_cache(self, entries: dict[str, tuple[float, frozenset[str]]]):
+        with self._lock, self._conn:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO nle_cache VALUES (?, ?, ?)",
+                [(folder, mtime, ",".join(sorted(nles)))
+                 for folder, (mtime, nles) in entries.items()],
+            )
+
+    def load_dir_usage(self) -> dict[str, tuple[float, int, int, tuple[str, ...]]]:
+        """폴더 경로 → (폴더 mtime, 바로 아래 파일 용량 합, 파일 수, 하위 폴더 이름들)"""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT path, mtime, bytes, files, subdirs FROM dir_usage"
+            ).fetchall()
+        return {
+            path: (mtime, size, files, tuple(json.loads(subdirs)))
+            for path, mtime, size, files, subdirs in rows
+        }
+
+    def save_dir_usage(self, entries: dict[str, tuple[float, int, int, tuple[str, ...]] | None]):
+        """None이면 삭제"""
+        with self._lock, self._conn:
+            self._conn.executemany(
+                "DELETE FROM dir_usage WHERE path = ?",
+                [(path,) for path, entry in entries.items() if entry is None],
+            )
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO dir_usage VALUES (?, ?, ?, ?, ?)",
+                [(path, mtime, size, files, json.dumps(list(subdirs), ensure_ascii=False))
+                 for path, entry in entries.items() if entry is not None
+                 for mtime, size, files, subdirs in (entry,)],
+            )
+
+    def migrate_from_json(self, json_path: Path) -> int:
+        """
+        기존 projects.json → SQLite 1회 이관. 이관된 프로젝트 수 반환.
+        성공 시 원본은 projects.json.migrated로 이름을 바꿔 보관합니다.
+        파일이 손상돼 읽을 수 없으면 원본을 그대로 두고 이관하지 않습니다.
+        """
+        if not json_path.exists() or self.count():
+            return 0
+        try:
+            projects = json.loads(json_path.read_text(encoding="utf-8"))
+        except Exception as e:
+            print(f"[ERROR] migrate_from_json: {e}")
+            return 0
+        if not isinstance(projects, list):
+            return 0
+        projects = [p for p in projects if isinstance(p, dict)]
+        for p in projects:
+            p.setdefault("id", str(uuid.uuid4()))
+        self.insert_many(projects)
+        json_path.replace(json_path.with_name(json_path.name + ".migrated"))
+        return len(projects)
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+
+# ─────────────────────────────────────────────
+# 백그라운드 지연 기록 (write-behind)
+# ─────────────────────────────────────────────
+def atomic_write_text(path: Path, text: str):
+    """임시 파일에 기록 → fsync → os.replace. 기록 도중 중단돼도 기존 파일은 온전히 남습니다."""
+    tmp = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    try:
+        with open(tmp, "w", encoding="utf-8") as f:
+            f.write(text)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, path)
+    finally:
+        if tmp.exists():
+            tmp.unlink()
+
+
+class WriteBehind:
+    """
+    변경 표시(mark) 후 DEBOUNCE초 안에 워커 스레드가 모아서 기록합니다.
+    같은 키로 여러 번 표시하면 마지막 작업 1회만 실행됩니다.
+    """
+
+    DEBOUNCE = 0.25  # 첫 변경 후 기록까지 최대 지연 (초)
+
+    def __init__(self, debounce: float = DEBOUNCE):
+        self._debounce = debounce
+        self._jobs: dict[str, Callable[[], None]] = {}
+        self._deadline: float | None = None
+        self._closed = False
+        self._cond = threading.Condition()
+        self._io_lock = threading.Lock()   # 워커 / flush() 동시 기록 방지
+        self._thread = threading.Thread(target=self._run, name="nexus-writer", daemon=True)
+        self._thread.start()
+
+    def mark(self, key: str, job: Callable[[], None]):
+        with self._cond:
+            self._jobs[key] = job
+            if self._deadline is None:
+                self._deadline = time.monotonic() + self._debounce
+            self._cond.notify()
+
+    def _take(self) -> dict[str, Callable[[], None]]:
+        jobs, self._jobs = self._jobs, {}
+        self._deadline = None
+        return jobs
+
+    def _run(self):
+        while True:
+            with self._cond:
+                while not self._closed:
+                    if self._deadline is None:
+                        self._cond.wait()
+                        continue
+                    remaining = self._deadline - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    self._cond.wait(remaining)
+                if self._closed:
+                    return
+                jobs = self._take()
+            self._execute(jobs)
+
+    def _execute(self, jobs: dict[str, Callable[[], None]]):
+        with self._io_lock:
+            for key, job in jobs.items():
+                try:
+                    job()
+                except Exception as e:
+                    print(f"[ERROR] write-behind ({key}): {e}")
+
+    def flush(self):
+        """대기 중인 작업을 호출 스레드에서 즉시 기록 (종료 직전 등)"""
+        with self._cond:
+            jobs = self._take()
+        self._execute(jobs)
+
+    def close(self):
+        with self._cond:
+            if self._closed:
+                return
+            self._closed = True
+            self._cond.notify()
+        self._thread.join()
+        self.flush()
+
+
+# ─────────────────────────────────────────────
+# NLE 사용 여부 캐시
+# ─────────────────────────────────────────────
+class NLEPresenceCache:
+    """
+    프로젝트 폴더별 NLE 감지 결과 캐시 (projects.db에 함께 저장).
+    폴더 mtime이 같으면 재탐색 없이 재사용 — 새로고침 시 프로젝트당 stat 1회.
+    파일 추가/삭제/이름 변경은 폴더 mtime을 바꾸므로 그때만 다시 훑습니다.
+    """
+
+    # mtime이 이보다 최근이면 같은 시각 안에 추가 변경이 있을 수 있어 캐시하지 않음
+    # (SMB/FAT 등 mtime 해상도가 1~2초인 파일 시스템 대비)
+    _RACY_WINDOW = 2.0
+
+    def __init__(self, store: ProjectStore, writer: WriteBehind):
+        self._store = store
+        self._writer = writer
+        self._entries = store.load_nle_cache()
+        self._dirty: dict[str, tuple[float, frozenset[str]]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, folder: Path, mtime: float) -> frozenset[str] | None:
+        hit = self._entries.get(str(folder))
+        if hit and hit[0] == mtime:
+            return hit[1]
+        return None
+
+    def peek(self, folder: Path) -> frozenset[str] | None:
+        """mtime 확인 없이 마지막으로 기록된 결과 (검색 색인 초기값용 — 카드가 그려질 때 다시 확인)"""
+        hit = self._entries.get(str(folder))
+        return hit[1] if hit else None
+
+    def invalidate(self, folder: Path):
+        """폴더 변경 알림 (파일 감시) — 다음 조회 때 다시 훑음"""
+        self._entries.pop(str(folder), None)
+
+    def put(self, folder: Path, mtime: float, nles: set[str]):
+        if time.time() - mtime < self._RACY_WINDOW:
+            return
+        entry = (mtime, frozenset(nles))
+        self._entries[str(folder)] = entry
+        with self._lock:
+            self._dirty[str(folder)] = entry
+        self._writer.mark("nle_cache", self._write)
+
+    def _write(self):
+        with self._lock:
+            dirty, self._dirty = self._dirty, {}
+        if dirty:
+            self._store.save_nle_cache(dirty)
+
+
+# ─────────────────────────────────────────────
+# 폴더 용량 캐시
+# ─────────────────────────────────────────────
+class DiskUsageCache:
+    """
+    폴더별 용량 캐시 (projects.db에 함께 저장) — 폴더 1개 = 바로 아래 파일 합계 + 하위 폴더 이름.
+    폴더 mtime이 같으면 scandir / 파일 stat 없이 재사용하므로, 다시 계산할 때는
+    폴더마다 stat 1회 + 바뀐 폴더만 다시 훑습니다.
+    (기존 파일을 제자리에서 덮어써 크기만 바뀐 경우는 폴더 mtime이 그대로라 다음 변경 때 반영)
+    """
+
+    _RACY_WINDOW = NLEPresenceCache._RACY_WINDOW
+
+    def __init__(self, store: ProjectStore, writer: WriteBehind):
+        self._store = store
+        self._writer = writer
+        self._entries: dict[str, tuple[float, int, int, tuple[str, ...]]] | None = None   # 첫 사용 때 로드
+        self._dirty: dict[str, tuple[float, int, int, tuple[str, ...]] | None] = {}
+        self._lock = threading.Lock()
+
+    def _loaded(self) -> dict[str, tuple[float, int, int, tuple[str, ...]]]:
+        with self._lock:
+            if self._entries is None:
+                self._entries = self._store.load_dir_usage()
+            return self._entries
+
+    def get(self, folder: str, mtime: float) -> tuple[int, int, tuple[str, ...]] | None:
+        hit = self._loaded().get(folder)
+        if hit and hit[0] == mtime:
+            return hit[1:]
+        return None
+
+    def put(self, folder: str, mtime: float, size: int, files: int, subdirs: tuple[str, ...]):
+        entries = self._loaded()
+        old = entries.get(folder)
+        if old is not None:
+            for gone in set(old[3]) - set(subdirs):   # 삭제 / 이름 변경된 하위 폴더 기록 정리
+                self.forget(os.path.join(folder, gone))
+        if time.time() - mtime < self._RACY_WINDOW:
+            return
+        entry = (mtime, size, files, subdirs)
+        with self._lock:
+            entries[folder] = entry
+            self._dirty[folder] = entry
+        self._writer.mark("dir_usage", self._write)
+
+    def forget(self, folder: str):
+        """폴더와 그 아래 기록 모두 제거"""
+        entries = self._loaded()
+        prefix = folder + os.sep
+        with self._lock:
+            gone = [p for p in entries if p == folder or p.startswith(prefix)]
+            for p in gone:
+                del entries[p]
+                self._dirty[p] = None
+        if gone:
+            self._writer.mark("dir_usage", self._write)
+
+    def _write(self):
+        with self._lock:
+            dirty, self._dirty = self._dirty, {}
+        if dirty:
+            self._store.save_dir_usage(dirty)
+
+
+# ─────────────────────────────────────────────
+# FolderTree (폴더 프리셋 → 트리, 미리보기 / 폴더 생성 / NLE 빈 공용)
+# ─────────────────────────────────────────────
+class FolderTree:
+    """
+    폴더 프리셋을 한 번 컴파일한 불변 트리 — folder_tree()로 얻으면 같은 프리셋은 재사용됩니다.
+    노드 i의 정보는 배열로: names[i], paths[i], parents[i] (-1 = 최상위), children[i].
+    노드 순서는 프리셋에서 처음 등장한 순서이므로 부모가 항상 자식보다 앞에 옵니다.
+    """
+
+    __slots__ = ("names", "paths", "parents", "children", "roots", "_leaf_groups")
+
+    def __init__(self, folders: tuple[str, ...]):
+        index: dict[str, int] = {}
+        names: list[str] = []
+        paths: list[str] = []
+        parents: list[int] = []
+        for folder in folders:
+            parent = -1
+            cumulative = ""
+            for part in folder.replace("\\", "/").split("/"):
+                if not part:
+                    continue
+                cumulative = f"{cumulative}/{part}" if cumulative else part
+                i = index.get(cumulative)
+                if i is None:
+                    i = index[cumulative] = len(names)
+                    names.append(part)
+                    paths.append(cumulative)
+                    parents.append(parent)
+                parent = i
+        children: list[list[int]] = [[] for _ in names]
+        roots: list[int] = []
+        for i, parent in enumerate(parents):
+            (children[parent] if parent >= 0 else roots).append(i)
+        self.names    = tuple(names)
+        self.paths    = tuple(paths)
+        self.parents  = tuple(parents)
+        self.children = tuple(tuple(c) for c in children)
+        self.roots    = tuple(roots)
+        self._leaf_groups: dict[str, tuple[str, ...]] | None = None
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def leaf_groups(self) -> dict[str, tuple[str, ...]]:
+        """
+        {최상위 폴더: 말단 경로들}. 말단만 mkdir(parents=True) 하면 상위도 함께 생기므로
+        경로당 mkdir 1회로 전체 트리를 만들 수 있습니다.
+        """
+        if self._leaf_groups is None:
+            groups: dict[str, list[str]] = {}
+            for i, path in enumerate(self.paths):
+                if not self.children[i]:
+                    groups.setdefault(path.split("/", 1)[0], []).append(path)
+            self._leaf_groups = {top: tuple(leaves) for top, leaves in groups.items()}
+        return self._leaf_groups
+
+
+@lru_cache(maxsize=64)
+def _compile_folder_tree(folders: tuple[str, ...]) -> FolderTree:
+    return FolderTree(folders)
+
+
+def folder_tree(folders: list[str] | tuple[str, ...]) -> FolderTree:
+    """프리셋 내용이 같으면 같은 FolderTree를 반환 (내용 기준 캐시)"""
+    return _compile_folder_tree(tuple(folders))
+
+
+# ─────────────────────────────────────────────
+# 프로젝트 검색 색인 (역색인 + 패싯)
+# ─────────────────────────────────────────────
+_WORD_RE = re.compile(r"\w+")
+
+
+@lru_cache(maxsize=4096)
+def _text_tokens(text: str) -> frozenset[str]:
+    """문자열 하나 → 소문자 토큰 (클라이언트 / 스펙 / 경로처럼 반복되는 값은 캐시 재사용)"""
+    text = text.lower().replace("_", " ")            # "nike_tvc_2403" → nike, tvc, 2403
+    tokens = set(text.split())                      # "29.97", "3840x2160" 그대로
+    tokens.update(_WORD_RE.findall(text))
+    return frozenset(tokens)
+
+
+def _index_tokens(project: dict) -> set[str]:
+    """이름 / 클라이언트 / 유형 / 스펙 / 폴더 경로 / 생성일 → 소문자 토큰"""
+    tokens = set(_text_tokens.__wrapped__(str(project.get("name", ""))))   # 이름은 대부분 고유
+    for key in ("client", "type", "location"):
+        tokens |= _text_tokens(str(project.get(key, "")))
+    for value in (project.get("spec") or {}).values():
+        tokens |= _text_tokens(str(value))
+    created = str(project.get("created_at", ""))[:10]   # 2025, 2025-03, 2025-03-04
+    if created:
+        tokens.update((created[:4], created[:7], created))
+    return tokens
+
+
+def _bits_to_mask(slots) -> int:
+    """슬롯 번호들 → 비트마스크 int"""
+    slots = list(slots)
+    if not slots:
+        return 0
+    buf = bytearray(max(slots) // 8 + 1)
+    for s in slots:
+        buf[s >> 3] |= 1 << (s & 7)
+    return int.from_bytes(buf, "little")
+
+
+class SearchHits:
+    """ProjectIndex.search() 결과 — 비트마스크 기반 (in / len만 지원, 순서는 호출 측 목록을 따름)"""
+
+    __slots__ = ("_slot", "_bits", "_count")
+
+    def __init__(self, slot_of: dict[str, int], mask: int):
+        self._slot = slot_of
+        self._bits = format(mask, "b")[::-1]   # 슬롯 i → _bits[i] (조회 O(1))
+        self._count = self._bits.count("1") if mask else 0
+
+    def __contains__(self, project_id: str) -> bool:
+        s = self._slot.get(project_id)
+        return s is not None and s < len(self._bits) and self._bits[s] == "1"
+
+    def __len__(self) -> int:
+        return self._count
+
+    def take(self, ids: Iterable[str], offset: int = 0, limit: int | None = None) -> list[str]:
+        """ids(정렬 순서) 중 일치하는 것의 offset번째부터 limit개"""
+        if not self._count or limit == 0:
+            return []
+        stop = None if limit is None else offset + limit
+        if self._count == len(self._slot):   # 전부 일치 (검색어 / 필터 없음)
+            return list(islice(ids, offset, stop))
+        slot, bits = self._slot.get, self._bits
+        n = len(bits)
+        matched = (pid for pid in ids if (s := slot(pid, n)) < n and bits[s] == "1")
+        return list(islice(matched, offset, stop))
+
+
+class ProjectIndex:
+    """
+    레지스트리 전체에 대한 메모리 역색인 (토큰 → 프로젝트) + 패싯(유형 / NLE / 해상도).
+    프로젝트마다 슬롯 번호를 주고 포스팅을 비트마스크로 다뤄, 교집합 / 개수 계산이 정수 연산 1회.
+    검색어의 각 단어는 토큰 접두어로 매칭 (정렬된 토큰 목록 + bisect), 단어끼리는 AND.
+    ProjectManager가 load 이후 첫 검색 때 만들고, add / delete 때 함께 갱신합니다.
+    """
+
+    FACETS = ("type", "nle", "resolution")
+    # 포스팅이 이보다 작으면 슬롯 목록, 크면 비트마스크로만 보관 (고유 토큰이 대부분이라 메모리 절약)
+    _MASK_MIN = 32
+
+    def __init__(self):
+        self._lock = threading.RLock()
+        self._reset()
+
+    def _reset(self):
+        self._slot: dict[str, int] = {}             # id → 슬롯
+        self._free: list[int] = []                  # 삭제로 빈 슬롯 (재사용)
+        self._next = 0
+        self._all = 0                               # 등록된 슬롯 전체
+        self._small: dict[str, list[int]] = {}      # 토큰 → 슬롯 목록
+        self._masks: dict[str, int] = {}            # 토큰 → 비트마스크 (큰 포스팅)
+        self._tokens: list[str] = []                # 정렬 유지 (접두어 범위 검색용)
+        self._initials: dict[str, int] = {}         # 첫 글자 → 비트마스크 (한 글자 검색어용)
+        self._doc_tokens: dict[int, set[str]] = {}
+        self._facets: dict[str, dict[str, int]] = {f: {} for f in self.FACETS}
+        self._doc_facets: dict[int, dict[str, set[str]]] = {}
+        self._nle_known = 0                         # NLE 값이 확인된 슬롯
+        self._prefix_cache: dict[str, int] = {}     # 검색어 입력 중 같은 접두어 반복 대비
+
+    def __len__(self) -> int:
+        return len(self._slot)
+
+    @staticmethod
+    def _facet_values(project: dict, nles: set[str] | None) -> dict[str, set[str]]:
+        return {
+            "type": {str(project.get("type", ""))} - {""},
+            "nle": set(nles or ()),
+            "resolution": {str((project.get("spec") or {}).get("resolution", ""))} - {""},
+        }
+
+    # ── 갱신 ──────────────────────────────────
+    def rebuild(self, projects: list[dict], nles_of: Callable[[dict], set[str] | None]):
+        """전체 재구성. nles_of(project)가 None이면 NLE 값 미확인."""
+        gc_was_enabled = gc.isenabled()
+        gc.disable()   # 작은 객체 수십만 개 생성 — 중간 GC 순회가 빌드 시간의 절반을 차지
+        try:
+            with self._lock:
+                self._build(projects, nles_of)
+        finally:
+            if gc_was_enabled:
+                gc.enable()
+
+    def _build(self, projects: list[dict], nles_of: Callable[[dict], set[str] | None]):
+        self._reset()
+        postings: dict[str, list[int]] = {}
+        initials: dict[str, list[int]] = {}
+        facets: dict[str, dict[str, list[int]]] = {f: {} for f in self.FACETS}
+        known: list[int] = []
+        for project in projects:
+            pid = project.get("id")
+            if not pid or pid in self._slot:
+                continue
+            s = self._slot[pid] = len(self._slot)
+            tokens = self._doc_tokens[s] = _index_tokens(project)
+            for token in tokens:
+                slots = postings.get(token)
+                if slots is None:
+                    postings[token] = [s]
+                else:
+                    slots.append(s)
+            for c in {t[0] for t in tokens}:
+                initials.setdefault(c, []).append(s)
+            nles = nles_of(project)
+            if nles is not None:
+                known.append(s)
+            values = self._doc_facets[s] = self._facet_values(project, nles)
+            for facet, vals in values.items():
+                for v in vals:
+                    facets[facet].setdefault(v, []).append(s)
+        self._next = len(self._slot)
+        self._all = (1 << self._next) - 1
+        self._nle_known = _bits_to_mask(known)
+        for token, slots in postings.items():
+            if len(slots) > self._MASK_MIN:
+                self._masks[token] = _bits_to_mask(slots)
+            else:
+                self._small[token] = slots
+        self._tokens = sorted(postings)
+        self._initials = {c: _bits_to_mask(slots) for c, slots in initials.items()}
+        self._facets = {f: {v: _bits_to_mask(slots) for v, slots in vals.items()} for f, vals in facets.items()}
+
+    def add(self, project: dict, nles: set[str] | None = None):
+        pid = project.get("id")
+        if not pid:
+            return
+        with self._lock:
+            if pid in self._slot:
+                self._delete(pid)
+            self._insert(project, nles)
+
+    def remove(self, project_id: str):
+        with self._lock:
+            if project_id in self._slot:
+                self._delete(project_id)
+
+    def set_nles(self, project_id: str, nles: set[str]):
+        """NLE 패싯 갱신 (카드 정보 / 폴더 감시로 새로 확인됐을 때)"""
+        with self._lock:
+            s = self._slot.get(project_id)
+            if s is None:
+                return
+            bit = 1 << s
+            doc = self._doc_facets[s]
+            values = self._facets["nle"]
+            for v in doc["nle"] - nles:
+                values[v] &= ~bit
+                if not values[v]:
+                    del values[v]
+            for v in nles - doc["nle"]:
+                values[v] = values.get(v, 0) | bit
+            doc["nle"] = set(nles)
+            self._nle_known |= bit
+
+    def nle_unknown(self) -> set[str]:
+        """NLE 값이 아직 확인되지 않은 프로젝트 id"""
+        with self._lock:
+            known = self._nle_known
+            return {pid for pid, s in self._slot.items() if not known >> s & 1}
+
+    def _insert(self, project: dict, nles: set[str] | None):
+        s = self._free.pop() if self._free else self._next
+        if s == self._next:
+            self._next += 1
+        bit = 1 << s
+        self._slot[project["id"]] = s
+        self._all |= bit
+        tokens = self._doc_tokens[s] = _index_tokens(project)
+        for token in tokens:
+            self._initials[token[0]] = self._initials.get(token[0], 0) | bit
+            if token in self._masks:
+                self._masks[token] |= bit
+                continue
+            slots = self._small.get(token)
+            if slots is None:
+                self._small[token] = [s]
+                bisect.insort(self._tokens, token)
+            elif len(slots) < self._MASK_MIN:
+                slots.append(s)
+            else:
+                self._masks[token] = _bits_to_mask(self._small.pop(token)) | bit
+        values = self._doc_facets[s] = self._facet_values(project, nles)
+        for facet, vals in values.items():
+            for v in vals:
+                self._facets[facet][v] = self._facets[facet].get(v, 0) | bit
+        if nles is not None:
+            self._nle_known |= bit
+        self._prefix_cache.clear()
+
+    def _delete(self, pid: str):
+        s = self._slot.pop(pid)
+        keep = ~(1 << s)
+        for token in self._doc_tokens.pop(s, ()):
+            initial = self._initials.get(token[0], 0) & keep
+            if initial:
+                self._initials[token[0]] = initial
+            else:
+                self._initials.pop(token[0], None)
+            if token in self._masks:
+                mask = self._masks[token] & keep
+                if mask:
+                    self._masks[token] = mask
+                    continue
+                del self._masks[token]
+            else:
+                slots = self._small[token]
+                slots.remove(s)
+                if slots:
+                    continue
+                del self._small[token]
+            i = bisect.bisect_left(self._tokens, token)   # 더 이상 쓰이지 않는 토큰
+            if i < len(self._tokens) and self._tokens[i] == token:
+                del self._tokens[i]
+        for facet, vals in self._doc_facets.pop(s, {}).items():
+            values = self._facets[facet]
+            for v in vals:
+                values[v] &= keep
+                if not values[v]:
+                    del values[v]
+        self._all &= keep
+        self._nle_known &= keep
+        self._free.append(s)
+        self._prefix_cache.clear()
+
+    # ── 검색 ──────────────────────────────────
+    def _match_prefix(self, prefix: str) -> int:
+        if len(prefix) == 1:
+            return self._initials.get(prefix, 0)
+        cached = self._prefix_cache.get(prefix)
+        if cached is not None:
+            return cached
+        lo = bisect.bisect_left(self._tokens, prefix)
+        hi = bisect.bisect_left(self._tokens, prefix + "\U0010ffff")
+        mask = 0
+        loose: list[int] = []   # 작은 포스팅의 슬롯은 모아서 한 번에 비트마스크로
+        for token in self._tokens[lo:hi]:
+            big = self._masks.get(token)
+            if big is not None:
+                mask |= big
+            else:
+                loose.extend(self._small[token])
+        mask |= _bits_to_mask(loose)
+        if len(self._prefix_cache) > 256:
+            self._prefix_cache.clear()
+        self._prefix_cache[prefix] = mask
+        return mask
+
+    def search(
+        self, query: str = "", filters: dict[str, str] | None = None,
+    ) -> tuple[SearchHits, dict[str, dict[str, int]]]:
+        """
+        (일치하는 프로젝트, 패싯별 {값: 개수}). 패싯의 "" 키는 해당 패싯 '전체' 개수.
+        패싯 개수는 그 패싯 자신의 필터를 뺀 나머지 조건 기준 (선택을 바꿨을 때 보일 개수).
+        """
+        filters = {k: v for k, v in (filters or {}).items() if v}
+        with self._lock:
+            base = self._all
+            for term in query.lower().replace("_", " ").split():
+                base &= self._match_prefix(term)
+                if not base:
+                    break
+            chosen = {f: self._facets[f].get(v, 0) for f, v in filters.items()}
+
+            facets = {}
+            for facet in self.FACETS:
+                scope = base
+                for other, mask in chosen.items():
+                    if other != facet:
+                        scope &= mask
+                counts = {v: (scope & mask).bit_count() for v, mask in self._facets[facet].items()}
+                counts[""] = scope.bit_count()
+                facets[facet] = counts
+            hits = base
+            for mask in chosen.values():
+                hits &= mask
+            return SearchHits(self._slot, hits), facets
+
+
+class ProjectOrder:
+    """
+    프로젝트 정렬 순서 하나 — (키, seq, id) 정렬 리스트를 bisect로 유지 (전체 재정렬 없음).
+    seq는 같은 키끼리의 순서 (나중에 등록 / 갱신된 것이 큰 값).
+    """
+
+    def __init__(self, key: Callable[[dict], str], descending: bool):
+        self._key = key
+        self.descending = descending
+        self._items: list[tuple[str, int, str]] = []
+        self._entry: dict[str, tuple[str, int, str]] = {}   # id → 현재 항목 (삭제용)
+
+    def rebuild(self, projects: list[dict]):
+        """projects는 레지스트리 순서 (맨 앞 = 가장 최근)"""
+        n = len(projects)
+        self._entry = {
+            p["id"]: (self._key(p), n - i, p["id"]) for i, p in enumerate(projects) if "id" in p
+        }
+        self._items = sorted(self._entry.values())
+
+    def add(self, project: dict, seq: int):
+        self.remove(project["id"])
+        entry = self._entry[project["id"]] = (self._key(project), seq, project["id"])
+        bisect.insort(self._items, entry)
+
+    def remove(self, project_id: str):
+        entry = self._entry.pop(project_id, None)
+        if entry is not None:
+            i = bisect.bisect_left(self._items, entry)
+            if i < len(self._items) and self._items[i] == entry:
+                del self._items[i]
+
+    def ids(self) -> Iterator[str]:
+        items = reversed(self._items) if self.descending else iter(self._items)
+        return (pid for _, _, pid in items)
+
+
+# ─────────────────────────────────────────────
+# ProjectManager
+# ─────────────────────────────────────────────
+class ProjectManager:
+    """프로젝트 데이터 관리 (저장/불러오기/CRUD)"""
+
+    DATA_DIR: Path = (
+        Path.home() / "Library" / "Application Support" / "VideoProjectSetup"
+        if platform.system() == "Darwin"
+        else Path.home() / "AppData" / "Roaming" / "VideoProjectSetup"
+        if platform.system() == "Windows"
+        else Path.home() / ".config" / "VideoProjectSetup"
+    )
+
+    def __init__(self, defer_load: bool = False):
+        """
+        defer_load=True면 설정만 읽고 레지스트리는 읽지 않음 (GUI 시작) — 작업 스레드에서
+        read_registry / build_search 후 UI 스레드에서 install_registry로 반영합니다.
+        """
+        self.DATA_DIR.mkdir(parents=True, exist_ok=True)
+        self._file = self.DATA_DIR / "projects.json"   # 레거시 (SQLite 이관 전)
+        self._settings_file = self.DATA_DIR / "settings.json"
+        self._store = ProjectStore(self.DATA_DIR / "projects.db")
+        self.settings: dict = {}
+        # id → project. dict 삽입 순서 = 레지스트리 순서의 역순 (마지막 = 가장 최근)
+        # → 추가 / 삭제 / 맨 앞으로 이동이 모두 O(1)
+        self._by_id: dict[str, dict] = {}
+        self._projects_view: list[dict] | None = None   # projects 캐시 (변경 시 무효화)
+        # 기록 대기 중인 변경 {id: 스냅샷 | None(삭제)} — 워커 스레드가 모아서 기록
+        self._pending: dict[str, dict | None] = {}
+        self._to_front: set[str] = set()
+        self._pending_lock = threading.Lock()
+        self._writer = WriteBehind()
+        atexit.register(self.close)
+        self.nle_cache = NLEPresenceCache(self._store, self._writer)
+        self.disk_usage = DiskUsageCache(self._store, self._writer)
+        self._index: ProjectIndex | None = None   # 첫 검색 때 생성
+        self._orders: dict[str, ProjectOrder] | None = None   # 첫 query() 때 생성
+        self._seq = 0
+        self.loaded = False   # 레지스트리를 읽어 들였는지
+        self.apps = AppDetector(self)
+        if defer_load:
+            self.load_settings()
+        else:
+            self.load()
+
+    @property
+    def projects(self) -> list[dict]:
+        """
+        레지스트리 순서 목록 (맨 앞 = 가장 최근). 변경이 없으면 같은 리스트를 재사용하므로
+        목록 자체를 고치지 말고 add / update / delete 등으로 변경하세요 (행 단위 기록).
+        """
+        if self._projects_view is None:
+            self._projects_view = list(reversed(self._by_id.values()))
+        return self._projects_view
+
+    def load(self):
+        self.install_registry(self.read_registry())
+        self.load_settings()
+
+    def read_registry(self) -> dict[str, dict]:
+        """
+        레지스트리 읽기 (+ projects.json 이관). manager 상태는 바꾸지 않으므로 작업 스레드에서 호출 가능.
+        반환은 _by_id와 같은 형식 (삽입 순서 = 가장 오래된 것부터).
+        """
+        self._store.migrate_from_json(self._file)
+        return {p["id"]: p for p in reversed(self._store.load_all()) if "id" in p}
+
+    def build_search(self, by_id: dict[str, dict]) -> tuple[ProjectIndex, dict[str, ProjectOrder]]:
+        """read_registry 결과로 검색 색인 + 정렬 순서 생성 (작업 스레드에서 호출 가능)"""
+        projects = list(reversed(by_id.values()))
+        index = ProjectIndex()
+        index.rebuild(projects, self._cached_nles)
+        return index, self._build_orders(projects)
+
+    def install_registry(
+        self, by_id: dict[str, dict],
+        search: tuple[ProjectIndex, dict[str, ProjectOrder]] | None = None,
+    ):
+        """
+        읽어 둔 레지스트리 반영 (manager를 쓰는 스레드에서). search가 없으면 첫 검색 때 생성.
+        읽는 동안 add()로 추가된 프로젝트는 가장 최근으로 유지하고 색인 / 정렬에도 추가합니다.
+        """
+        extra = [p for pid, p in self._by_id.items() if pid not in by_id]
+        by_id.update(self._by_id)
+        self._by_id = by_id
+        self._projects_view = None
+        self._index, self._orders = search if search is not None else (None, None)
+        self._seq = len(by_id) - len(extra)
+        for project in extra:
+            if self._index is not None:
+                self._index.add(project, self._cached_nles(project))
+            self._reorder(project)
+        self.loaded = True
+
+    def load_settings(self):
+        if self._settings_file.exists():
+            try:
+                self.settings = json.loads(self._settings_file.read_text(encoding="utf-8"))
+            except Exception as e:
+                # 손상된 파일은 덮어쓰기 전에 따로 보관
+                print(f"[ERROR] settings.json 읽기 실패: {e}")
+                self._settings_file.replace(
+                    self._settings_file.with_name(f"settings.json.corrupt-{int(time.time())}")
+                )
+                self.settings = {}
+
+    def flush(self):
+        """대기 중인 변경을 호출 스레드에서 즉시 기록"""
+        self._writer.flush()
+
+    def close(self):
+        """대기 중인 변경 기록 후 워커 종료 (앱 종료 시)"""
+        self._writer.close()
+
+    def _mark_dirty(self, project_id: str, project: dict | None, to_front: bool = False):
+        """
+        변경 표시만 하고 반환 — 실제 기록은 WriteBehind 워커가 담당.
+        같은 프로젝트의 연속 변경은 마지막 상태 1회로 합쳐집니다.
+        to_front=True면 저장 순서도 맨 앞으로 옮깁니다.
+        """
+        with self._pending_lock:
+            if to_front:
+                self._pending.pop(project_id, None)   # dict 순서상 맨 뒤 = 가장 큰 seq
+                self._to_front.add(project_id)
+            self._pending[project_id] = dict(project) if project is not None else None
+        self._writer.mark("projects", self._write_projects)
+
+    def _write_projects(self):
+        with self._pending_lock:
+            pending, self._pending = self._pending, {}
+            to_front, self._to_front = self._to_front, set()
+        if pending:
+            self._store.apply(pending, to_front)
+
+    def get(self, project_id: str) -> dict | None:
+        return self._by_id.get(project_id)
+
+    def _cached_nles(self, project: dict) -> set[str] | None:
+        if not (project.get("location") and project.get("name")):
+            return None
+        nles = self.nle_cache.peek(Path(project["location"]) / project["name"])
+        return set(nles) if nles is not None else None
+
+    @property
+    def index(self) -> ProjectIndex:
+        """검색 색인 — 처음 접근할 때 전체 목록으로 만들고 이후 add / delete로 갱신"""
+        if self._index is None:
+            index = ProjectIndex()
+            index.rebuild(self.projects, self._cached_nles)
+            self._index = index
+        return self._index
+
+    def index_nles(self, project_id: str, nles: set[str]):
+        """NLE 감지 결과를 검색 색인에 반영 (색인이 아직 없으면 생성 때 캐시에서 읽음)"""
+        if self._index is not None:
+            self._index.set_nles(project_id, nles)
+
+    # 정렬 기준 → (키, 내림차순 여부)
+    SORT_KEYS: dict[str, tuple[Callable[[dict], str], bool]] = {
+        "last_opened": (lambda p: str(p.get("last_opened", "")), True),
+        "created_at":  (lambda p: str(p.get("created_at", "")), True),
+        "name":        (lambda p: str(p.get("name", "")).lower(), False),
+    }
+
+    def _order(self, sort_by: str) -> ProjectOrder:
+        if self._orders is None:
+            self._orders = self._build_orders(self.projects)
+            self._seq = len(self.projects)
+        return self._orders[sort_by]
+
+    def _build_orders(self, projects: list[dict]) -> dict[str, ProjectOrder]:
+        orders = {}
+        for name, (key, descending) in self.SORT_KEYS.items():
+            order = orders[name] = ProjectOrder(key, descending)
+            order.rebuild(projects)
+        return orders
+
+    def _reorder(self, project: dict, removed: bool = False):
+        """정렬 순서 갱신 (아직 만들어지지 않았으면 생략)"""
+        if self._orders is None:
+            return
+        self._seq += 1
+        for order in self._orders.values():
+            if removed:
+                order.remove(project["id"])
+            else:
+                order.add(project, self._seq)
+
+    def query(
+        self, text: str = "", filters: dict[str, str] | None = None,
+        sort_by: str = "last_opened", offset: int = 0, limit: int | None = None,
+    ) -> tuple[list[dict], int, dict[str, dict[str, int]]]:
+        """
+        검색 + 패싯 필터 + 정렬 + 페이지. (이번 페이지 프로젝트, 전체 일치 개수, 패싯 개수) 반환.
+        정렬 순서는 미리 유지되므로 페이지마다 일치하는 항목만 앞에서부터 골라냅니다.
+        """
+        if sort_by not in self.SORT_KEYS:
+            raise ValueError(f"알 수 없는 정렬 기준: {sort_by}")
+        hits, facets = self.index.search(text, filters)
+        ids = hits.take(self._order(sort_by).ids(), offset, limit)
+        return [self._by_id[pid] for pid in ids], len(hits), facets
+
+    def save_settings(self):
+        # 직렬화는 호출 시점에 (이후 변경과 섞이지 않도록), 디스크 기록은 워커에서
+        text = json.dumps(self.settings, ensure_ascii=False, indent=2)
+        path = self._settings_file
+        self._writer.mark("settings", lambda: atomic_write_text(path, text))
+
+    def add(self, project: dict) -> dict:
+        project["id"] = str(uuid.uuid4())
+        project["created_at"] = datetime.now().isoformat()
+        project["last_opened"] = project["created_at"]
+        self._by_id[project["id"]] = project
+        self._projects_view = None
+        if self._index is not None:
+            self._index.add(project, self._cached_nles(project))
+        self._reorder(project)
+        self._mark_dirty(project["id"], project)
+        return project
+
+    def add_many(self, projects: list[dict]) -> list[dict]:
+        """
+        여러 프로젝트를 한 번에 등록 (일괄 생성용) — 레지스트리 기록 1회.
+        목록 순서는 add()를 차례로 부른 것과 같습니다 (마지막 항목이 맨 앞).
+        """
+        now = datetime.now().isoformat()
+        for project in projects:
+            project["id"] = str(uuid.uuid4())
+            project.setdefault("created_at", now)   # 볼륨 스캔: ProjectCrawler가 채운 생성 시각 유지
+            project.setdefault("last_opened", project["created_at"])
+        newest_first = projects[::-1]
+        self.flush()   # 대기 중인 개별 변경이 뒤에 기록되어 순서가 바뀌지 않도록
+        self._store.insert_many(newest_first)
+        self._by_id.update((p["id"], p) for p in projects)
+        self._projects_view = None
+        for project in projects:
+            if self._index is not None:
+                self._index.add(project, self._cached_nles(project))
+            self._reorder(project)
+        return projects
+
+    def delete(self, project_id: str):
+        p = self._by_id.pop(project_id, None)
+        if p is None:
+            return
+        self._projects_view = None
+        if self._index is not None:
+            self._index.remove(project_id)
+        self._reorder(p, removed=True)
+        self._mark_dirty(project_id, None)
+
+    def update_last_opened(self, project_id: str):
+        p = self._by_id.pop(project_id, None)
+        if p is None:
+            return
+        p["last_opened"] = datetime.now().isoformat()
+        # 최근 연 프로젝트를 목록 맨 앞으로 (dict 맨 뒤로 다시 넣기)
+        self._by_id[project_id] = p
+        self._projects_view = None
+        self._reorder(p)
+        self._mark_dirty(project_id, p, to_front=True)
+
+    SCAFFOLD_WORKERS = 8   # 최상위 폴더별 동시 생성 수
+
+    def create_folders(self, project: dict) -> dict:
+        """
+        프리셋(또는 커스텀) 폴더 생성 + project.json 저장.
+        말단 폴더만 mkdir 하고 (상위는 함께 생성), 최상위 폴더별 하위 트리를 병렬로 만듭니다.
+        project.json은 모든 폴더가 만들어진 뒤 마지막에 원자적으로 기록.
+        반환: {"ok", "error", "dirs": mkdir 횟수, "timings": {단계: ms}}
+        """
+        result = {"ok": False, "error": "", "dirs": 0, "timings": {}}
+        timings = result["timings"]
+        t_start = time.perf_counter()
+
+        def make_subtree(top: str, leaves: tuple[str, ...]) -> tuple[str, float]:
+            t0 = time.perf_counter()
+            for leaf in leaves:
+                (base / leaf).mkdir(parents=True, exist_ok=True)
+            return top, (time.perf_counter() - t0) * 1000
+
+        try:
+            base = Path(project["location"]) / project["name"]
+            folders = (
+                project.get("folders")
+                or FOLDER_PRESETS.get(project.get("type", "유튜브"), FOLDER_PRESETS["유튜브"])
+            )
+            groups = folder_tree(folders).leaf_groups()
+
+            t0 = time.perf_counter()
+            base.mkdir(parents=True, exist_ok=True)
+            timings["(프로젝트 폴더)"] = (time.perf_counter() - t0) * 1000
+
+            workers = max(1, min(self.SCAFFOLD_WORKERS, len(groups)))
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                for top, ms in pool.map(lambda g: make_subtree(*g), groups.items()):
+                    timings[top] = ms
+            result["dirs"] = 1 + sum(len(leaves) for leaves in groups.values())
+
+            # 메타데이터 저장 (마지막 — project.json이 있으면 폴더 구성 완료)
+            t0 = time.perf_counter()
+            meta = {k: v for k, v in project.items() if k != "id"}
+            atomic_write_text(base / "project.json", json.dumps(meta, ensure_ascii=False, indent=2))
+            timings["project.json"] = (time.perf_counter() - t0) * 1000
+            result["ok"] = True
+        except Exception as e:
+            print(f"[ERROR] create_folders: {e}")
+            result["error"] = str(e)
+        timings["total"] = (time.perf_counter() - t_start) * 1000
+        return result
+
+    def get_default_location(self) -> str:
+        return self.settings.get("default_location", str(Path.home() / "Movies"))
+
+    def set_default_location(self, path: str):
+        self.settings["default_location"] = path
+        self.save_settings()
+
+    def get_custom_preset(self, project_type: str) -> list[str] | None:
+        """커스텀 폴더 프리셋 반환. 설정 없으면 None."""
+        return self.settings.get("custom_presets", {}).get(project_type)
+
+    def set_custom_preset(self, project_type: str, folders: list[str] | None):
+        """커스텀 폴더 프리셋 저장. folders=None이면 기본값으로 복원."""
+        if "custom_presets" not in self.settings:
+            self.settings["custom_presets"] = {}
+        if folders is None:
+            self.settings["custom_presets"].pop(project_type, None)
+        else:
+            self.settings["custom_presets"][project_type] = folders
+        self.save_settings()
+
+    def get_nle_override(self, app_key: str) -> str:
+        """사용자가 수동으로 지정한 NLE 경로 반환"""
+        return self.settings.get(f"nle_{app_key}", "")
+
+    def set_nle_override(self, app_key: str, path: str):
+        self.settings[f"nle_{app_key}"] = path
+        self.save_settings()
+        self.apps.rescan()
+
+    def validate_project(self, project: dict) -> tuple[bool, str]:
+        """프로젝트 생성 전 유효성 검사. (bool, 오류메시지) 반환"""
+        name = project.get("name", "").strip()
+        location = project.get("location", "").strip()
+
+        if not name:
+            return False, "프로젝트 이름을 입력해주세요."
+
+        # Windows 금지 문자 체크
+        forbidden = set(r'\/:*?"<>|')
+        bad_chars = [c for c in name if c in forbidden]
+        if bad_chars:
+            return False, f"프로젝트 이름에 사용할 수 없는 문자가 포함되어 있습니다: {'  '.join(bad_chars)}"
+
+        if not location:
+            return False, "저장 위치를 선택해주세요."
+        if not Path(location).exists():
+            return False, f"저장 위치가 존재하지 않습니다:\n{location}"
+
+        return True, ""
+
+
+# ─────────────────────────────────────────────
+# NLE 앱 감지
+# ─────────────────────────────────────────────
+def _build_app_candidates() -> dict[str, dict[str, tuple[str, ...]]]:
+    """앱별 · OS별 설치 경로 후보 (최신 버전 우선)"""
+    # 가장 최신 버전부터 탐색 (2026→2022)
+    years = list(range(2026, 2021, -1))
+    return {
+        "Resolve": {
+            "Darwin": (
+                "/Applications/DaVinci Resolve/DaVinci Resolve.app",
+            ),
+            "Windows": (
+                r"C:\Program Files\Blackmagic Design\DaVinci Resolve\Resolve.exe",
+            ),
+        },
+        "Premiere": {
+            "Darwin": tuple(
+                f"/Applications/Adobe Premiere Pro {y}/Adobe Premiere Pro {y}.app"
+                for y in years
+            ),
+            "Windows": tuple(
+                rf"C:\Program Files\Adobe\Adobe Premiere Pro {y}\Adobe Premiere Pro.exe"
+                for y in years
+            ),
+        },
+        "AE": {
+            "Darwin": tuple(
+                f"/Applications/Adobe After Effects {y}/Adobe After Effects {y}.app"
+                for y in years
+            ),
+            "Windows": tuple(
+                rf"C:\Program Files\Adobe\Adobe After Effects {y}\AfterFX.exe"
+                for y in years
+            ),
+        },
+    }
+
+
+_APP_CANDIDATES = _build_app_candidates()
+
+
+def find_app(app_name: str, override_path: str = "") -> str | None:
+    """설치된 NLE 앱 경로 반환 (없으면 None). 수동 지정 경로 우선."""
+    if override_path and Path(override_path).exists():
+        return override_path
+
+    for path_str in _APP_CANDIDATES.get(app_name, {}).get(platform.system(), ()):
+        if Path(path_str).exists():
+            return path_str
+    return None
+
+
+class AppDetector:
+    """
+    NLE 앱 경로 감지 결과 캐시 (UI 전체 공용).
+    시작 시 백그라운드에서 한 번만 탐색하고,
+    수동 경로 변경(set_nle_override) 또는 설정의 [다시 검색] 시에만 다시 탐색합니다.
+    """
+
+    APP_KEYS = ("Resolve", "Premiere", "AE")
+
+    def __init__(self, manager: "ProjectManager"):
+        self._manager = manager
+        self._paths: dict[str, str | None] = {}
+        self._ready = threading.Event()
+        self._lock = threading.Lock()
+        self._generation = 0
+        self._thread: threading.Thread | None = None
+        self._listeners: list[Callable[[], None]] = []
+
+    def start(self):
+        """백그라운드 탐색 시작 (이전 결과는 폐기)"""
+        with self._lock:
+            self._generation += 1
+            self._ready.clear()
+            gen = self._generation
+            self._thread = threading.Thread(
+                target=self._resolve_all, args=(gen,), name="nexus-app-detect", daemon=True
+            )
+        self._thread.start()
+
+    def _resolve_all(self, gen: int):
+        paths = {
+            key: find_app(key, self._manager.get_nle_override(key))
+            for key in self.APP_KEYS
+        }
+        with self._lock:
+            if gen != self._generation:
+                return
+            self._paths = paths
+            self._ready.set()
+        for callback in list(self._listeners):
+            callback()
+
+    def subscribe(self, callback: Callable[[], None]):
+        """탐색이 끝날 때마다 호출 (탐색 스레드에서 — UI는 시그널로 넘겨받을 것)"""
+        self._listeners.append(callback)
+
+    def ready(self) -> bool:
+        return self._ready.is_set()
+
+    def peek(self, app_key: str) -> str | None:
+        """기다리지 않고 현재 결과 반환 (탐색 중이면 None)"""
+        return self._paths.get(app_key) if self._ready.is_set() else None
+
+    def _wait(self):
+        if self._ready.is_set():
+            return
+        if self._thread is None:
+            self._resolve_all(self._generation)
+        else:
+            self._ready.wait()
+
+    def get(self, app_key: str) -> str | None:
+        self._wait()
+        return self._paths.get(app_key)
+
+    def all(self) -> dict[str, str | None]:
+        """내부 키(Resolve/Premiere/AE) → 설치 경로 or None"""
+        self._wait()
+        return dict(self._paths)
+
+    def rescan(self):
+        self.start()
+
+
+def launch_app(app_name: str, app_path: str | None = None, manager: "ProjectManager | None" = None) -> bool:
+    """NLE 앱 실행"""
+    path = app_path or (manager.apps.get(app_name) if manager else find_app(app_name))
+    if not path:
+        return False
+    try:
+        if platform.system() == "Darwin":
+            subprocess.Popen(["open", path])
+        else:
+            subprocess.Popen([path])
+        return True
+    except Exception as e:
+        print(f"[ERROR] launch_app: {e}")
+        return False
+
+
+def open_folder(folder_path: str):
+    """파일 탐색기로 폴더 열기"""
+    try:
+        if platform.system() == "Darwin":
+            subprocess.Popen(["open", folder_path])
+        elif platform.system() == "Windows":
+            subprocess.Popen(["explorer", folder_path])
+        else:
+            subprocess.Popen(["xdg-open", folder_path])
+    except Exception as e:
+        print(f"[ERROR] open_folder: {e}")
+
+
+# ─────────────────────────────────────────────
+# NLE 프로젝트 / 빈 자동 생성
+# ─────────────────────────────────────────────
+
+def _jsx_bins_premiere(folders: list[str], project_name: str, prproj_path: str) -> str:
+    """Premiere Pro ExtendScript: 새 프로젝트 생성 + 빈 트리 구성"""
+    safe_path = prproj_path.replace("\\", "/")
+    lines = [
+        "// VPS Auto-generated — Adobe Premiere Pro Setup",
+        f'// Project: {project_name}',
+        "",
+        f'app.newProject("{safe_path}");',
+        "var root = app.project.rootItem;",
+        "",
+    ]
+    tree = folder_tree(folders)
+    for i, part in enumerate(tree.names):
+        parent = tree.parents[i]
+        parent_var = f"b{parent + 1}" if parent >= 0 else "root"
+        safe = part.replace('"', '\\"')
+        lines.append(f'var b{i + 1} = {parent_var}.createBin("{safe}");')
+
+    lines += [
+        "",
+        "app.project.save();",
+        f'$.writeln("VPS: {project_name} 생성 완료");',
+    ]
+    return "\n".join(lines)
+
+
+def _jsx_bins_ae(folders: list[str], project_name: str, aep_path: str) -> str:
+    """After Effects ExtendScript: 새 프로젝트 생성 + 폴더 트리 구성"""
+    safe_path = aep_path.replace("\\", "/")
+    lines = [
+        "// VPS Auto-generated — Adobe After Effects Setup",
+        f'// Project: {project_name}',
+        "",
+        "app.newProject();",
+        "",
+        "function mkFolder(name) { return app.project.items.addFolder(name); }",
+        "",
+    ]
+    tree = folder_tree(folders)
+    for i, part in enumerate(tree.names):
+        safe = part.replace('"', '\\"')
+        lines.append(f'var f{i + 1} = mkFolder("{safe}");')
+        parent = tree.parents[i]
+        if parent >= 0:
+            lines.append(f"f{i + 1}.parentFolder = f{parent + 1};")
+
+    lines += [
+        "",
+        f'var saveFile = new File("{safe_path}");',
+        "app.project.save(saveFile);",
+        f'alert("VPS: {project_name}.aep 생성 완료!");',
+    ]
+    return "\n".join(lines)
+
+
+def create_premiere_project(
+    project: dict, base_path: Path, manager: "ProjectManager | None" = None,
+    run: bool = True,
+) -> tuple[bool, str]:
+    """
+    Premiere Pro 프로젝트 자동 생성.
+    JSX 스크립트를 생성하고 실행 중인 Premiere에 osascript로 전달 (macOS).
+    run=False면 스크립트 생성만 합니다 (일괄 생성).
+    """
+    name = project["name"]
+    prproj_path = base_path / f"{name}.prproj"
+    jsx_path = base_path / "_setup_premiere.jsx"
+
+    folders = project.get("folders") or FOLDER_PRESETS.get(project.get("type", "유튜브"), [])
+    jsx_path.write_text(
+        _jsx_bins_premiere(folders, name, str(prproj_path)),
+        encoding="utf-8"
+    )
+
+    if run and platform.system() == "Darwin":
+        premiere_path = manager.apps.get("Premiere") if manager else find_app("Premiere")
+        if premiere_path:
+            app_stem = Path(premiere_path).stem
+            osa = f'tell application "{app_stem}" to do script "{str(jsx_path)}"'
+            result = subprocess.run(
+                ["osascript", "-e", osa],
+                capture_output=True, text=True, timeout=10
+            )
+            if result.returncode == 0:
+                return True, f"Premiere 빈 구성 완료 → {prproj_path.name}"
+
+    # Windows 또는 osascript 실패 → 수동 안내
+    return True, (
+        f"JSX 스크립트 생성됨: {jsx_path.name}\n"
+        "Premiere 실행 후 File > Scripts > Browse 로 직접 실행하세요."
+    )
+
+
+def create_ae_project(
+    project: dict, base_path: Path, manager: "ProjectManager | None" = None,
+    run: bool = True,
+) -> tuple[bool, str]:
+    """
+    After Effects 프로젝트 자동 생성.
+    JSX 생성 후 afterfx 바이너리를 -r flag로 실행.
+    run=False면 스크립트 생성만 합니다 (일괄 생성).
+    """
+    name = project["name"]
+    aep_path = base_path / f"{name}.aep"
+    jsx_path = base_path / "_setup_ae.jsx"
+
+    folders = project.get("folders") or FOLDER_PRESETS.get(project.get("type", "유튜브"), [])
+    jsx_path.write_text(
+        _jsx_bins_ae(folders, name, str(aep_path)),
+        encoding="utf-8"
+    )
+
+    ae_app = (manager.apps.get("AE") if manager else find_app("AE")) if run else None
+    ae_bin: str | None = None
+    if ae_app:
+        if platform.system() == "Darwin":
+            candidates = list(Path(ae_app).glob("Contents/MacOS/After Effects*"))
+            if candidates:
+                ae_bin = str(candidates[0])
+        else:
+            ae_bin = ae_app  # Windows: .exe 직접
+
+    if ae_bin and Path(ae_bin).exists():
+        subprocess.Popen([ae_bin, "-r", str(jsx_path)])
+        return True, f"AE 실행 중 — 스크립트로 {name}.aep 자동 생성됩니다"
+
+    return True, (
+        f"JSX 스크립트 생성됨: {jsx_path.name}\n"
+        "AE 실행 후 File > Scripts > Run Script File 로 직접 실행하세요."
+    )
+
+
+class ResolveSession:
+    """
+    DaVinci Resolve 스크립팅 연결 (프로세스당 1개 — resolve_session).
+    scriptapp("Resolve") 연결과 ProjectManager 핸들을 유지하고, 사용할 때마다
+    GetVersionString() 한 번으로 살아있는지만 확인합니다. 끊겼으면 그때 다시 연결.
+    Resolve API는 스레드 안전하지 않으므로 호출부는 lock을 잡고 사용합니다.
+    """
+
+    def __init__(self):
+        self.lock     = threading.RLock()
+        self._resolve = None
+        self._pm      = None
+
+    @staticmethod
+    def modules_path() -> str | None:
+        if platform.system() == "Darwin":
+            return (
+                "/Library/Application Support/Blackmagic Design"
+                "/DaVinci Resolve/Developer/Scripting/Modules"
+            )
+        if platform.system() == "Windows":
+            return (
+                r"C:\ProgramData\Blackmagic Design\DaVinci Resolve"
+                r"\Support\Developer\Scripting\Modules"
+            )
+        return None
+
+    def _alive(self) -> bool:
+        try:
+            return bool(self._resolve.GetVersionString())
+        except Exception:
+            return False
+
+    def invalidate(self):
+        """연결 끊김이 의심될 때 — 다음 사용 시 재연결"""
+        with self.lock:
+            self._resolve = None
+            self._pm      = None
+
+    def project_manager(self) -> tuple[object | None, str]:
+        """(ProjectManager, 오류 메시지). 연결돼 있으면 재사용, 아니면 연결."""
+        with self.lock:
+            if self._pm is not None and self._alive():
+                return self._pm, ""
+            self._resolve = self._pm = None
+
+            modules_path = self.modules_path()
+            if modules_path is None:
+                return None, "지원하지 않는 OS입니다"
+            if not Path(modules_path).exists():
+                return None, f"Resolve Scripting Modules 없음:\n{modules_path}"
+            if modules_path not in sys.path:
+                sys.path.insert(0, modules_path)
+
+            try:
+                import DaVinciResolveScript as dvr_script  # type: ignore
+            except ImportError as e:
+                return None, f"DaVinciResolveScript 임포트 실패: {e}"
+
+            try:
+                resolve = dvr_script.scriptapp("Resolve")
+            except Exception as e:
+                return None, f"Resolve 연결 오류: {e}"
+            if not resolve:
+                return None, "Resolve가 실행 중이지 않거나 응답이 없습니다\n(Resolve를 먼저 실행해주세요)"
+
+            pm = resolve.GetProjectManager()
+            if not pm:
+                return None, "ProjectManager를 가져올 수 없습니다"
+            self._resolve, self._pm = resolve, pm
+            return pm, ""
+
+
+resolve_session = ResolveSession()
+
+
+def setup_resolve_bins(project: dict, base_path: Path | None = None) -> tuple[bool, str]:
+    """
+    DaVinci Resolve Python Scripting API로 프로젝트 + 빈 트리 생성.
+    base_path 지정 시 .drp 아카이브를 해당 폴더에 내보냄 (Resolve 미실행 시 import 가능).
+    Resolve가 실행 중이어야 합니다.
+    """
+    with resolve_session.lock:
+        pm, err = resolve_session.project_manager()
+        if pm is None:
+            return False, err
+        return _setup_resolve_bins(pm, project, base_path)
+
+
+def _setup_resolve_bins(pm, project: dict, base_path: Path | None) -> tuple[bool, str]:
+    name = project["name"]
+    proj = pm.CreateProject(name)
+    is_new = bool(proj)
+    if not proj:
+        # 이미 있는 프로젝트 (재연결) → 열어서 빈만 맞춤. 몇 번을 눌러도 결과가 같음
+        proj = pm.LoadProject(name)
+    if not proj:
+        return False, f"프로젝트 '{name}' 생성 실패\n(이름 중복 또는 권한 문제)"
+
+    media_pool = proj.GetMediaPool()
+    folders = project.get("folders") or FOLDER_PRESETS.get(project.get("type", "유튜브"), [])
+    calls = ResolveCallStats()
+    root_folder = calls("GetRootFolder", media_pool.GetRootFolder)
+    created, reused = sync_resolve_bins(media_pool, root_folder, folders, calls)
+    print(f"[INFO] Resolve 빈 동기화 '{name}': {calls.summary()}")
+
+    # 기술 스펙 전체 적용 (해상도 / FPS / 색상 공간 / 샘플 레이트) — 새 프로젝트만
+    if is_new:
+        _apply_resolve_settings(proj, project.get("spec", {}))
+
+    # .drp 아카이브 내보내기 (로컬 import용)
+    drp_exported = False
+    if base_path:
+        drp_path = base_path / f"{name}.drp"
+        try:
+            drp_exported = pm.ExportProject(name, str(drp_path), False)
+        except Exception:
+            pass
+
+    if is_new:
+        msg = f"Resolve 프로젝트 '{name}' + 빈 구조 생성 완료"
+    else:
+        msg = f"기존 Resolve 프로젝트 '{name}'에 연결 — 빈 구조 동기화 완료"
+    count, seconds = calls.total()
+    msg += f"\n빈 {created}개 생성 · {reused}개 재사용  (API 호출 {count}회, {seconds * 1000:.0f}ms)"
+    if drp_exported:
+        msg += f"\n📦 {name}.drp 저장됨 (나중에 File > Import Project로 불러올 수 있습니다)"
+    return True, msg
+
+
+def _apply_resolve_settings(proj_obj, spec: dict):
+    """Resolve 프로젝트에 기술 스펙(해상도/FPS/색상공간/샘플레이트) 적용"""
+    # 해상도
+    res_str = spec.get("resolution", "")
+    if res_str in _RESOLVE_RESOLUTION_MAP:
+        w, h = _RESOLVE_RESOLUTION_MAP[res_str]
+        try:
+            proj_obj.SetSetting("timelineResolutionWidth", w)
+            proj_obj.SetSetting("timelineResolutionHeight", h)
+        except Exception:
+            pass
+
+    # FPS (23.976, 29.97 등 소수점 포함 문자열 그대로 전달)
+    fps_str = spec.get("fps", "")
+    if fps_str:
+        try:
+            proj_obj.SetSetting("timelineFrameRate", fps_str)
+        except Exception:
+            pass
+
+    # 색상 공간
+    cs_str = spec.get("colorspace", "")
+    if cs_str in _RESOLVE_COLORSPACE_MAP:
+        science_mode, timeline_cs = _RESOLVE_COLORSPACE_MAP[cs_str]
+        try:
+            proj_obj.SetSetting("colorScienceMode", science_mode)
+            proj_obj.SetSetting("colorSpaceTimeline", timeline_cs)
+        except Exception:
+            pass
+
+    # 오디오 샘플 레이트
+    sr_str = spec.get("samplerate", "")
+    if sr_str in _RESOLVE_SAMPLERATE_MAP:
+        try:
+            proj_obj.SetSetting("timelineAudioSampleRate", _RESOLVE_SAMPLERATE_MAP[sr_str])
+        except Exception:
+            pass
+
+
+class ResolveCallStats:
+    """Resolve API 왕복 횟수 / 소요 시간 (메서드별). calls("이름", fn, *args)로 감싸서 호출."""
+
+    def __init__(self):
+        self.calls: dict[str, list] = {}   # 메서드 → [횟수, 누적 초]
+
+    def __call__(self, method: str, fn, *args):
+        t0 = time.perf_counter()
+        try:
+            return fn(*args)
+        finally:
+            entry = self.calls.setdefault(method, [0, 0.0])
+            entry[0] += 1
+            entry[1] += time.perf_counter() - t0
+
+    def total(self) -> tuple[int, float]:
+        return (sum(n for n, _ in self.calls.values()),
+                sum(t for _, t in self.calls.values()))
+
+    def summary(self) -> str:
+        return " · ".join(
+            f"{method} {n}회 {t * 1000:.1f}ms (평균 {t * 1000 / n:.1f}ms)"
+            for method, (n, t) in self.calls.items()
+        ) or "호출 없음"
+
+
+def sync_resolve_bins(
+    media_pool, root_folder, folder_paths: list[str],
+    calls: ResolveCallStats | None = None,
+) -> tuple[int, int]:
+    """
+    폴더 경로 리스트에 맞춰 Resolve 빈 트리 동기화 — 있는 빈은 재사용, 없는 빈만 생성.
+    기존 트리는 프리셋에 있는 가지만 GetSubFolderList로 한 번씩 읽고,
+    새로 만든 빈 아래는 읽지 않습니다. 반환: (생성 수, 재사용 수)
+    """
+    calls = calls or ResolveCallStats()
+    tree = folder_tree(folder_paths)
+
+    created = reused = 0
+    stack = [(root_folder, tree.roots, True)]   # (빈, 원하는 하위 노드들, 기존 빈 여부)
+    while stack:
+        folder, wanted, existing = stack.pop()
+        present: dict[str, object] = {}
+        if existing:
+            for sub in calls("GetSubFolderList", folder.GetSubFolderList) or []:
+                present.setdefault(calls("GetName", sub.GetName), sub)
+        for i in wanted:
+            part = tree.names[i]
+            sub = present.get(part)
+            if sub is not None:
+                reused += 1
+            else:
+                sub = calls("AddSubFolder", media_pool.AddSubFolder, folder, part)
+                if not sub:
+                    continue
+                created += 1
+            if tree.children[i]:
+                stack.append((sub, tree.children[i], part in present))
+    return created, reused
+
+
+# ─────────────────────────────────────────────
+# 버전 스냅샷 관리
+# ─────────────────────────────────────────────
+
+_FICLONE = 0x40049409   # linux/fs.h: _IOW(0x94, 9, int)
+_O_BINARY = getattr(os, "O_BINARY", 0)   # Windows: 텍스트 모드 변환 방지
+
+
+def _reflink(src_fd: int, dst_fd: int) -> bool:
+    """FICLONE 시도 (btrfs / XFS 등 CoW 파일 시스템). 데이터 복사 없이 블록을 공유합니다."""
+    if fcntl is None or not sys.platform.startswith("linux"):
+        return False
+    try:
+        fcntl.ioctl(dst_fd, _FICLONE, src_fd)
+        return True
+    except OSError:
+        return False
+
+
+def _pread(fd: int, size: int, offset: int) -> bytes:
+    if hasattr(os, "pread"):
+        return os.pread(fd, size, offset)
+    os.lseek(fd, offset, os.SEEK_SET)   # Windows: pread 없음
+    return os.read(fd, size)
+
+
+def _copy_fd_range(src_fd: int, dst_fd: int, offset: int, length: int) -> str:
+    """
+    src의 [offset, offset + length) 구간을 dst 현재 위치에 기록.
+    copy_file_range(커널 내부 복사) → 스트리밍 순으로 시도하고 사용한 방식을 반환합니다.
+    """
+    strategy = "stream"
+    if hasattr(os, "copy_file_range"):
+        try:
+            while length > 0:
+                n = os.copy_file_range(src_fd, dst_fd, length, offset)
+                if n == 0:
+                    break
+                offset += n
+                length -= n
+            strategy = "copy_file_range"
+        except OSError:
+            pass   # EXDEV / EINVAL / ENOSYS 등 → 남은 구간은 스트리밍
+    while length > 0:
+        data = _pread(src_fd, min(length, 1024 * 1024), offset)
+        if not data:
+            break
+        os.write(dst_fd, data)
+        offset += len(data)
+        length -= len(data)
+        strategy = "stream"
+    return strategy
+
+
+def clone_file(src: Path, dst: Path) -> str:
+    """reflink → copy_file_range → 스트리밍 순으로 파일 복사. 사용한 방식을 반환합니다."""
+    src_fd = os.open(src, os.O_RDONLY | _O_BINARY)
+    try:
+        dst_fd = os.open(dst, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | _O_BINARY, 0o644)
+        try:
+            if _reflink(src_fd, dst_fd):
+                strategy = "reflink"
+            else:
+                strategy = _copy_fd_range(src_fd, dst_fd, 0, os.fstat(src_fd).st_size)
+        finally:
+            os.close(dst_fd)
+    finally:
+        os.close(src_fd)
+    shutil.copystat(src, dst)
+    return strategy
+
+
+class SnapshotStore:
+    """
+    프로젝트별 .drp 스냅샷 저장소 (<프로젝트>/.nexus/snapshots).
+    .drp(zip 컨테이너)를 zip 멤버 경계로 청크 분할하고, 고유 청크는 해시 이름으로 한 번만 저장합니다.
+    버전(V001..Vn)은 청크 목록(manifest)만 가지며 복원 시에만 .drp 파일로 조립됩니다.
+    reflink를 지원하는 파일 시스템에서는 청크 분할 없이 파일 전체를 reflink로 보관합니다
+    (블록 공유로 중복 제거는 파일 시스템이 담당).
+    """
+
+    CHUNK_MAX = 4 * 1024 * 1024   # zip이 아니거나 큰 멤버는 이 크기 이하로 분할
+
+    # reflink가 실패한 파일 시스템(st_dev) — 이후 스냅샷은 시험용 파일 생성 / 삭제 없이 바로 청크 저장
+    _no_reflink: set[int] = set()
+
+    def __init__(self, folder: Path, name: str):
+        self.folder = folder
+        self.name   = name
+        self.root   = folder / ".nexus" / "snapshots"
+        self._chunks = self.root / "chunks"
+        self._files  = self.root / "files"
+
+    def _manifest_path(self, version: int) -> Path:
+        return self.root / f"V{version:03d}.json"
+
+    def _chunk_path(self, digest: str) -> Path:
+        return self._chunks / digest[:2] / digest
+
+    def version_path(self, version: int) -> Path:
+        """버전의 (가상) .drp 경로 — 복원 전까지 실제 파일은 없을 수 있음"""
+        return self.folder / f"{self.name}_V{version:03d}.drp"
+
+    @classmethod
+    def _ranges(cls, path: Path, size: int) -> list[tuple[int, int]]:
+        """청크 (시작, 끝) 오프셋. zip이면 멤버(로컬 헤더 + 데이터) 단위로 자릅니다."""
+        bounds = {0, size}
+        try:
+            with zipfile.ZipFile(path) as zf:
+                bounds.update(zi.header_offset for zi in zf.infolist())
+                start_dir = getattr(zf, "start_dir", None)
+                if start_dir is not None:
+                    bounds.add(start_dir)
+        except (zipfile.BadZipFile, OSError):
+            pass
+        edges = sorted(b for b in bounds if 0 <= b <= size)
+        ranges = []
+        for start, end in zip(edges, edges[1:]):
+            while end - start > cls.CHUNK_MAX:
+                ranges.append((start, start + cls.CHUNK_MAX))
+                start += cls.CHUNK_MAX
+            if end > start:
+                ranges.append((start, end))
+        return ranges
+
+    def put(self, src: Path, version: int, source: str = "copy") -> dict:
+        """
+        src(.drp)를 버전으로 저장. 이미 있는 청크는 다시 쓰지 않습니다.
+        반환: {"size": 전체 바이트, "new_bytes": 새로 기록한 바이트, "chunks", "new_chunks",
+               "strategy": reflink | stream | dedup}
+        """
+        size = src.stat().st_size
+        manifest = {
+            "version": version,
+            "size":    size,
+            "created": datetime.now().isoformat(),
+            "source":  source,
+        }
+
+        # 1) reflink — 데이터 복사 없이 즉시 완료 (실패한 파일 시스템은 다시 시도하지 않음)
+        dev = self._reflink_dev()
+        if dev is not None:
+            self._files.mkdir(parents=True, exist_ok=True)
+            rel = f"files/V{version:03d}.drp"
+            if self._reflink_into(src, self.root / rel):
+                manifest["file"] = rel
+                atomic_write_text(self._manifest_path(version), json.dumps(manifest))
+                return {"size": size, "new_bytes": 0, "chunks": 1, "new_chunks": 1,
+                        "strategy": "reflink"}
+            SnapshotStore._no_reflink.add(dev)
+
+        # 2) 청크 중복 제거 — 해시한 버퍼를 그대로 기록 (청크당 읽기 1회)
+        chunks: list[list] = []
+        new_bytes = new_chunks = 0
+        strategy = "dedup"   # 새로 기록한 청크가 없으면 그대로 유지
+        src_fd = os.open(src, os.O_RDONLY | _O_BINARY)
+        try:
+            for start, end in self._ranges(src, size):
+                data = _pread(src_fd, end - start, start)
+                digest = hashlib.sha256(data).hexdigest()
+                chunks.append([digest, end - start])
+                path = self._chunk_path(digest)
+                if path.exists():
+                    continue
+                path.parent.mkdir(parents=True, exist_ok=True)
+                tmp = path.with_name(f".{digest}.tmp")
+                out_fd = os.open(tmp, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | _O_BINARY, 0o644)
+                try:
+                    view = memoryview(data)
+                    while view:
+                        view = view[os.write(out_fd, view):]
+                    strategy = "stream"
+                finally:
+                    os.close(out_fd)
+                os.replace(tmp, path)
+                new_bytes += end - start
+                new_chunks += 1
+        finally:
+            os.close(src_fd)
+
+        manifest["chunks"] = chunks
+        atomic_write_text(self._manifest_path(version), json.dumps(manifest))
+        return {"size": size, "new_bytes": new_bytes, "chunks": len(chunks),
+                "new_chunks": new_chunks, "strategy": strategy}
+
+    def _reflink_dev(self) -> int | None:
+        """reflink를 시도할 파일 시스템의 st_dev. 지원하지 않는 플랫폼 / 이미 실패한 파일 시스템이면 None"""
+        if fcntl is None or not sys.platform.startswith("linux"):
+            return None
+        try:
+            dev = os.stat(self.folder).st_dev
+        except OSError:
+            return None
+        return None if dev in SnapshotStore._no_reflink else dev
+
+    @staticmethod
+    def _reflink_into(src: Path, dst: Path) -> bool:
+        src_fd = os.open(src, os.O_RDONLY | _O_BINARY)
+        try:
+            dst_fd = os.open(dst, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | _O_BINARY, 0o644)
+            try:
+                ok = _reflink(src_fd, dst_fd)
+            finally:
+                os.close(dst_fd)
+        finally:
+            os.close(src_fd)
+        if not ok:
+            dst.unlink()
+        return ok
+
+    def versions(self) -> list[dict]:
+        """저장된 버전 목록 (get_project_versions와 같은 형식)"""
+        versions = []
+        if not self.root.exists():
+            return versions
+        for mf in self.root.glob("V*.json"):
+            try:
+                manifest = json.loads(mf.read_text(encoding="utf-8"))
+                v = int(manifest["version"])
+                versions.append({
+                    "version":  v,
+                    "path":     self.version_path(v),
+                    "size_mb":  manifest["size"] / (1024 * 1024),
+                    "modified": datetime.fromisoformat(manifest["created"]),
+                    "label":    f"V{v:03d}",
+                    "stored":   True,
+                })
+            except Exception:
+                continue
+        return versions
+
+    def has(self, version: int) -> bool:
+        return self._manifest_path(version).exists()
+
+    def materialize(self, version: int, dest: Path) -> str:
+        """버전을 dest에 .drp로 조립 (임시 파일에 쓴 뒤 교체). 사용한 복사 방식을 반환합니다."""
+        manifest = json.loads(self._manifest_path(version).read_text(encoding="utf-8"))
+        tmp = dest.with_name(f".{dest.name}.restore.tmp")
+        try:
+            if "file" in manifest:
+                strategy = clone_file(self.root / manifest["file"], tmp)
+            else:
+                strategy = "stream"
+                out_fd = os.open(tmp, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | _O_BINARY, 0o644)
+                try:
+                    for digest, size in manifest["chunks"]:
+                        chunk_fd = os.open(self._chunk_path(digest), os.O_RDONLY | _O_BINARY)
+                        try:
+                            strategy = _copy_fd_range(chunk_fd, out_fd, 0, size)
+                        finally:
+                            os.close(chunk_fd)
+                finally:
+                    os.close(out_fd)
+            os.replace(tmp, dest)
+        finally:
+            if tmp.exists():
+                tmp.unlink()
+        return strategy
+
+
+class VersionsIndex:
+    """
+    <프로젝트>/.nexus/versions.json — 버전 목록 색인.
+    스냅샷 생성 시 항목을 바로 추가하고, 읽을 때는 프로젝트 폴더 mtime이 기록과 다를 때만
+    (= 누군가 _V###.drp 파일을 추가/삭제했을 때만) 폴더를 다시 훑습니다.
+    SMB 등에서 버전 목록 = 파일 1개 읽기 + stat 1회.
+    """
+
+    _RACY_WINDOW = 2.0   # NLEPresenceCache와 같은 이유 (mtime 해상도)
+
+    def __init__(self, folder: Path, name: str):
+        self.folder = folder
+        self.name   = name
+        self.path   = folder / ".nexus" / "versions.json"
+
+    def _folder_mtime(self) -> int | None:
+        try:
+            return self.folder.stat().st_mtime_ns
+        except OSError:
+            return None
+
+    def _to_entry(self, v: dict) -> dict:
+        return {
+            "version":  v["version"],
+            "file":     v["path"].name,
+            "size":     int(v["size_mb"] * 1024 * 1024),
+            "modified": v["modified"].isoformat(),
+            "stored":   bool(v.get("stored")),
+        }
+
+    def _from_entry(self, e: dict) -> dict:
+        v = {
+            "version":  e["version"],
+            "path":     self.folder / e["file"],
+            "size_mb":  e["size"] / (1024 * 1024),
+            "modified": datetime.fromisoformat(e["modified"]),
+            "label":    f"V{e['version']:03d}",
+        }
+        if e.get("stored"):
+            v["stored"] = True
+        return v
+
+    def _scan(self) -> list[dict]:
+        """스냅샷 저장소 + 기존 버전 파일 전체 탐색 (같은 번호는 실제 파일 우선)"""
+        pattern = re.compile(rf'^{re.escape(self.name)}_V(\d+)\.drp$', re.IGNORECASE)
+        versions = {v["version"]: v for v in SnapshotStore(self.folder, self.name).versions()}
+        for drp in self.folder.glob("*.drp"):
+            m = pattern.match(drp.name)
+            if m:
+                stat = drp.stat()
+                versions[int(m.group(1))] = {
+                    "version":  int(m.group(1)),
+                    "path":     drp,
+                    "size_mb":  stat.st_size / (1024 * 1024),
+                    "modified": datetime.fromtimestamp(stat.st_mtime),
+                    "label":    f"V{int(m.group(1)):03d}",
+                }
+        return sorted(versions.values(), key=lambda v: v["version"], reverse=True)
+
+    def _write(self, versions: list[dict]):
+        if not self.folder.exists():
+            return
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        # .nexus 생성 후의 mtime을 기록해야 다음 읽기에서 일치
+        mtime = self._folder_mtime()
+        if mtime is not None and time.time() - mtime / 1e9 < self._RACY_WINDOW:
+            mtime = None
+        try:
+            atomic_write_text(self.path, json.dumps({
+                "folder_mtime": mtime,
+                "versions": [self._to_entry(v) for v in versions],
+            }, ensure_ascii=False))
+        except OSError as e:
+            print(f"[ERROR] versions.json 기록 실패: {e}")
+
+    def load(self) -> list[dict]:
+        """버전 목록 (최신순). 색인이 없거나 폴더가 바뀌었으면 다시 훑고 색인 갱신."""
+        mtime = self._folder_mtime()
+        if mtime is None:
+            return []
+        try:
+            data = json.loads(self.path.read_text(encoding="utf-8"))
+            if data.get("folder_mtime") == mtime:
+                return [self._from_entry(e) for e in data["versions"]]
+        except Exception:
+            pass
+        versions = self._scan()
+        self._write(versions)
+        return versions
+
+    def add(self, version: dict):
+        """새 버전 1개 반영 (스냅샷 직후)"""
+        versions = [v for v in self.load() if v["version"] != version["version"]]
+        versions.append(version)
+        versions.sort(key=lambda v: v["version"], reverse=True)
+        self._write(versions)
+
+
+def get_project_versions(folder: Path, name: str) -> list[dict]:
+    """
+    프로젝트 폴더의 버전 목록: 스냅샷 저장소 + 기존 버전 파일 (ProjectName_V001.drp ...).
+    .nexus/versions.json 색인을 우선 사용합니다. 최신 버전 순으로 정렬해서 반환.
+    """
+    return VersionsIndex(folder, name).load()
+
+
+def create_smart_snapshot(project: dict) -> tuple[bool, str]:
+    """
+    스마트 스냅샷: 실행 중인 Resolve에서 현재 프로젝트 상태를 API로 내보낸 후 스냅샷 저장소에 저장.
+    Resolve가 실행 중이지 않거나 해당 프로젝트가 열려있지 않으면 기존 .drp 파일로 폴백.
+    저장소는 바뀐 청크만 새로 기록하므로 시간 / 용량이 변경량에 비례합니다.
+    """
+    folder = Path(project.get("location", "")) / project.get("name", "")
+    name   = project.get("name", "")
+    drp    = folder / f"{name}.drp"
+    store  = SnapshotStore(folder, name)
+
+    existing = get_project_versions(folder, name)
+    next_v   = (max(v["version"] for v in existing) + 1) if existing else 1
+    label    = f"{name}_V{next_v:03d}"
+
+    # 1단계: Resolve API로 현재 상태 직접 내보내기 시도 (저장소 임시 파일로)
+    export_note = ""
+    exported: Path | None = None
+    try:
+        with resolve_session.lock:
+            pm, _ = resolve_session.project_manager()
+            if pm:
+                cur = pm.GetCurrentProject()
+                if cur and cur.GetName() == name:
+                    # 현재 열린 프로젝트와 이름이 일치 → API로 직접 내보내기
+                    store.root.mkdir(parents=True, exist_ok=True)
+                    tmp_export = store.root / f".export_{next_v:03d}.drp"
+                    ok = pm.ExportProject(name, str(tmp_export), False)
+                    if ok and tmp_export.exists():
+                        exported = tmp_export
+                        export_note = "  [Resolve 현재 작업 상태]"
+                elif cur:
+                    export_note = f"\n⚠ Resolve에 '{cur.GetName()}' 프로젝트가 열려 있어 파일 복사로 대체했습니다."
+    except Exception:
+        resolve_session.invalidate()
+
+    # 2단계: Resolve 내보내기 실패 → 기존 .drp 파일로 폴백
+    if exported is None and not drp.exists():
+        return False, (
+            f"{name}.drp 파일을 찾을 수 없습니다.\n"
+            "Resolve에서 해당 프로젝트를 열고 스냅샷을 생성해주세요."
+        )
+    try:
+        src = exported or drp
+        stats = store.put(src, next_v, source="resolve" if exported else "copy")
+    finally:
+        if exported is not None and exported.exists():
+            exported.unlink()
+    VersionsIndex(folder, name).add({
+        "version":  next_v,
+        "path":     store.version_path(next_v),
+        "size_mb":  stats["size"] / (1024 * 1024),
+        "modified": datetime.now(),
+        "label":    f"V{next_v:03d}",
+        "stored":   True,
+    })
+
+    size_mb = stats["size"] / (1024 * 1024)
+    new_mb  = stats["new_bytes"] / (1024 * 1024)
+    return True, (
+        f"스냅샷 저장됨: {label}  ({size_mb:.1f} MB, 신규 {new_mb:.1f} MB · "
+        f"청크 {stats['new_chunks']}/{stats['chunks']} · {stats['strategy']}){export_note}"
+    )
+
+
+# 하위 호환 별칭 (restore_version 내부에서 호출)
+def create_version_snapshot(project: dict) -> tuple[bool, str]:
+    return create_smart_snapshot(project)
+
+
+def restore_version(version_path: Path, project: dict) -> tuple[bool, str]:
+    """
+    선택한 버전의 .drp를 현재 ProjectName.drp로 복원 (덮어쓰기).
+    복원 전 현재 상태를 자동 백업 (스냅샷 저장소 — 바뀐 청크만 기록).
+    저장소에만 있는 버전은 이때 청크를 조립해 만듭니다.
+    """
+    folder = Path(project.get("location", "")) / project.get("name", "")
+    name   = project.get("name", "")
+    drp    = folder / f"{name}.drp"
+    store  = SnapshotStore(folder, name)
+
+    m = re.search(r'_V(\d+)\.drp$', version_path.name, re.IGNORECASE)
+    version = int(m.group(1)) if m else None
+    if not version_path.exists() and not (version and store.has(version)):
+        return False, f"{version_path.name} 버전을 찾을 수 없습니다."
+
+    # 복원 전 현재 상태 백업
+    if drp.exists():
+        backup_ok, backup_msg = create_version_snapshot(project)
+        if not backup_ok:
+            return False, f"복원 전 백업 실패: {backup_msg}"
+
+    if version_path.exists():
+        tmp = drp.with_name(f".{drp.name}.restore.tmp")
+        strategy = clone_file(version_path, tmp)
+        os.replace(tmp, drp)
+    else:
+        strategy = store.materialize(version, drp)
+    return True, (
+        f"{version_path.name} → {name}.drp 복원 완료  ({strategy})\n"
+        "Resolve에서 File > Import Project로 복원된 파일을 불러오세요."
+    )
+
+
+def _scan_project_nles(folder: Path, name: str) -> set[str]:
+    """폴더를 scandir 1회로 훑어 NLE 프로젝트 파일 존재 여부 판별"""
+    nles: set[str] = set()
+    name = name.lower()   # 이름 / 확장자 대소문자 무시 (Foo.PRPROJ, foo.AEP)
+    try:
+        with os.scandir(folder) as it:
+            for entry in it:
+                fname = entry.name.lower()
+                if not fname.startswith(name):
+                    continue
+                if fname.endswith(".drp"):
+                    if fname == f"{name}.drp" or fname.startswith(f"{name}_v"):
+                        nles.add("Resolve")
+                elif fname.endswith(".prproj"):
+                    nles.add("Premiere")
+                elif fname.endswith(".aep"):
+                    nles.add("AE")
+    except OSError:
+        pass
+    return nles
+
+
+def detect_project_nles(project: dict, cache: NLEPresenceCache | None = None) -> set[str]:
+    """
+    프로젝트 폴더의 파일 존재 여부로 NLE 사용 여부 탐지.
+    cache 지정 시 폴더 mtime이 그대로면 폴더를 다시 훑지 않습니다.
+    """
+    folder = Path(project.get("location", "")) / project.get("name", "")
+    name   = project.get("name", "")
+    try:
+        mtime = folder.stat().st_mtime
+    except OSError:
+        return set()
+    if cache is not None:
+        hit = cache.get(folder, mtime)
+        if hit is not None:
+            return set(hit)
+    nles = _scan_project_nles(folder, name)
+    if cache is not None:
+        cache.put(folder, mtime, nles)
+    return nles
+
+
+USAGE_WORKERS = 8      # 용량 계산 동시 scandir 수
+USAGE_ROOT_FILES = "."   # folders 키: 프로젝트 폴더 바로 아래 파일 (.drp / project.json 등)
+
+
+def _scan_dir_usage(path: str, cache: DiskUsageCache | None) -> tuple[int, int, tuple[str, ...], bool] | None:
+    """폴더 1개 → (바로 아래 파일 용량 합, 파일 수, 하위 폴더 이름, 다시 훑었는지). 읽을 수 없으면 None."""
+    try:
+        mtime = os.stat(path).st_mtime
+        if cache is not None:
+            hit = cache.get(path, mtime)
+            if hit is not None:
+                return (*hit, False)
+        size = files = 0
+        subdirs: list[str] = []
+        with os.scandir(path) as it:
+            for entry in it:
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        subdirs.append(entry.name)
+                    elif entry.is_file(follow_symlinks=False):
+                        size += entry.stat(follow_symlinks=False).st_size
+                        files += 1
+                except OSError:
+                    continue
+    except OSError:
+        return None
+    names = tuple(sorted(subdirs))
+    if cache is not None:
+        cache.put(path, mtime, size, files, names)
+    return size, files, names, True
+
+
+def measure_project_usage(
+    project: dict, cache: DiskUsageCache | None = None, workers: int = USAGE_WORKERS,
+) -> dict:
+    """
+    프로젝트 폴더 용량 — 최상위 폴더(01_FOOTAGE, 02_AUDIO ...)별 합계 (심볼릭 링크는 따라가지 않음).
+    같은 깊이의 폴더들을 한 번에 병렬로 훑으며 내려가므로 큰 폴더 하나에 몰려 있어도 병렬이 유지됩니다.
+    cache 지정 시 mtime이 그대로인 폴더는 다시 훑지 않습니다.
+    반환: {"total", "folders": {최상위 폴더 | ".": bytes}, "files", "dirs", "rescanned", "ms"}
+    """
+    t0 = time.perf_counter()
+    result = {"total": 0, "folders": {}, "files": 0, "dirs": 0, "rescanned": 0, "ms": 0.0}
+    root = os.path.join(project.get("location", ""), project.get("name", ""))
+    scanned = _scan_dir_usage(root, cache)
+    if scanned is None:
+        return result
+    folders: dict[str, int] = result["folders"]
+
+    def tally(top: str, scanned: tuple[int, int, tuple[str, ...], bool]):
+        size, files, _, rescanned = scanned
+        folders[top] = folders.get(top, 0) + size
+        result["files"] += files
+        result["dirs"] += 1
+        result["rescanned"] += rescanned
+
+    tally(USAGE_ROOT_FILES, scanned)
+    frontier = [(name, os.path.join(root, name)) for name in scanned[2]]
+    with ThreadPoolExecutor(max_workers=max(1, workers)) as pool:
+        while frontier:
+            next_frontier: list[tuple[str, str]] = []
+            for (top, path), scanned in zip(
+                frontier, pool.map(lambda item: _scan_dir_usage(item[1], cache), frontier)
+            ):
+                if scanned is None:
+                    continue
+                tally(top, scanned)
+                next_frontier.extend((top, os.path.join(path, name)) for name in scanned[2])
+            frontier = next_frontier
+    result["total"] = sum(folders.values())
+    result["ms"] = (time.perf_counter() - t0) * 1000
+    return result
+
+
+def format_size(size: int) -> str:
+    """바이트 → 1.2 GB 형식"""
+    if size < 1024:
+        return f"{size} B"
+    value = float(size)
+    for unit in ("KB", "MB", "GB"):
+        value /= 1024
+        if value < 1024:
+            return f"{value:.1f} {unit}"
+    return f"{value / 1024:.1f} TB"
+
+
+def resolve_import_drp(drp_path: str) -> tuple[bool, str]:
+    """실행 중인 Resolve에 .drp 파일을 API로 import"""
+    with resolve_session.lock:
+        pm, err = resolve_session.project_manager()
+        if pm is None:
+            return False, err
+
+        ok = pm.ImportProject(drp_path)
+        if ok:
+            name = Path(drp_path).stem
+            pm.LoadProject(name)
+            return True, f"'{name}' 프로젝트가 Resolve에 import 되었습니다"
+    return False, f"Import 실패: {drp_path}"
+
+
+_RESOLVE_WAIT_TIMEOUT = 90.0   # 최대 대기 (초)
+_RESOLVE_PROBE_MIN    = 0.1    # 첫 확인 간격 — 이후 2배씩
+_RESOLVE_PROBE_MAX    = 2.0
+_RESOLVE_PROCESS_NAMES = {"resolve", "resolve.exe"}
+
+
+def _resolve_process_running() -> bool | None:
+    """
+    Resolve 프로세스가 떠 있는지 (스크립팅 연결보다 훨씬 가벼운 확인).
+    psutil → /proc → OS 도구(pgrep / tasklist) 순. 확인할 방법이 없으면 None.
+    """
+    if psutil is not None:
+        try:
+            return any(
+                (p.info["name"] or "").lower() in _RESOLVE_PROCESS_NAMES
+                for p in psutil.process_iter(["name"])
+            )
+        except Exception:
+            pass
+    proc = Path("/proc")
+    if proc.is_dir():
+        for entry in os.scandir(proc):
+            if not entry.name.isdigit():
+                continue
+            try:
+                with open(os.path.join(entry.path, "comm"), encoding="utf-8") as f:
+                    if f.read().strip().lower() in _RESOLVE_PROCESS_NAMES:
+                        return True
+            except OSError:
+                continue
+        return False
+    try:
+        if platform.system() == "Windows":
+            result = subprocess.run(
+                ["tasklist", "/FI", "IMAGENAME eq Resolve.exe", "/NH"],
+                capture_output=True, text=True, timeout=5,
+                creationflags=getattr(subprocess, "CREATE_NO_WINDOW", 0),
+            )
+            return "resolve.exe" in result.stdout.lower() if result.returncode == 0 else None
+        # macOS: pgrep 종료 코드 0 = 있음, 1 = 없음
+        result = subprocess.run(["pgrep", "-ix", "resolve"], capture_output=True, timeout=5)
+        return {0: True, 1: False}.get(result.returncode)
+    except (OSError, subprocess.SubprocessError):
+        return None
+
+
+def wait_for_resolve(
+    timeout: float = _RESOLVE_WAIT_TIMEOUT,
+    progress: Callable[[str], None] | None = None,
+) -> bool:
+    """
+    Resolve 스크립팅 연결이 가능해질 때까지 대기 (프로젝트는 만들지 않음).
+    프로세스가 아직 없으면 연결 시도 없이 기다리고, 뜬 뒤에는 resolve_session 연결만 확인합니다.
+    확인 간격은 0.1초에서 시작해 2초까지 늘어납니다.
+    """
+    start = time.monotonic()
+    delay = _RESOLVE_PROBE_MIN
+    while True:
+        running = _resolve_process_running()
+        if running is not False:
+            pm, _ = resolve_session.project_manager()
+            if pm is not None:
+                return True
+        elapsed = time.monotonic() - start
+        if elapsed >= timeout:
+            return False
+        if progress:
+            state = "연결 대기 중" if running else "실행 대기 중"
+            progress(f"Resolve {state}... {int(elapsed)}초")
+        time.sleep(min(delay, timeout - elapsed))
+        delay = min(delay * 2, _RESOLVE_PROBE_MAX)
+
+
+def setup_resolve_with_launch(
+    project: dict, base_path: Path,
+    progress: Callable[[str], None], manager: "ProjectManager | None" = None,
+) -> tuple[bool, str]:
+    """
+    setup_resolve_bins + Resolve가 꺼져있을 때:
+      1. Resolve 자동 실행
+      2. API 연결될 때까지 최대 90초 대기 (wait_for_resolve — 프로세스 / 연결만 확인)
+      3. 연결 성공 → 프로젝트 + 빈 생성 + .drp 내보내기 (1회)
+    """
+    ok, msg = setup_resolve_bins(project, base_path)
+    if ok or ("실행 중이지 않" not in msg and "응답이 없" not in msg):
+        return ok, msg
+
+    progress("DaVinci Resolve 실행 중...")
+    launch_app("Resolve", manager=manager)
+
+    if not wait_for_resolve(progress=progress):
+        return False, (
+            "Resolve 시작 대기 시간 초과 (90초)\n"
+            "Resolve를 직접 실행 후 '최근 프로젝트' 탭에서 [Resolve 연결] 버튼을 눌러주세요."
+        )
+    progress("Resolve 연결됨 — 프로젝트 생성 중...")
+    return setup_resolve_bins(project, base_path)
+
+
+# ─────────────────────────────────────────────
+# 프로젝트 폴더 감시 (Linux inotify)
+# ─────────────────────────────────────────────
+WATCH_SUFFIXES = (".drp", ".prproj", ".aep")   # 카드 정보(NLE / 버전)에 영향을 주는 파일
+
+
+class InotifyWatcher:
+    """
+    Linux inotify(ctypes)로 프로젝트 폴더 직속 항목 변경 감시.
+    WATCH_SUFFIXES 파일의 생성 / 삭제 / 이름 변경 / 쓰기 완료와 폴더 자체 삭제를 감지하고,
+    debounce 동안 모은 뒤 폴더마다 callback(folder)을 한 번 호출합니다 (감시 스레드에서).
+    create()는 inotify를 쓸 수 없으면 None — GUI는 QFileSystemWatcher로 대체합니다.
+    """
+
+    _IN_CLOSE_WRITE = 0x00000008
+    _IN_MOVED_FROM  = 0x00000040
+    _IN_MOVED_TO    = 0x00000080
+    _IN_CREATE      = 0x00000100
+    _IN_DELETE      = 0x00000200
+    _IN_DELETE_SELF = 0x00000400
+    _IN_MOVE_SELF   = 0x00000800
+    _IN_IGNORED     = 0x00008000
+    _IN_ONLYDIR     = 0x01000000
+    _IN_NONBLOCK    = 0o4000
+    _IN_CLOEXEC     = 0o2000000
+    _MASK = (_IN_CLOSE_WRITE | _IN_MOVED_FROM | _IN_MOVED_TO | _IN_CREATE | _IN_DELETE
+             | _IN_DELETE_SELF | _IN_MOVE_SELF | _IN_ONLYDIR)
+    _SELF_EVENTS = _IN_DELETE_SELF | _IN_MOVE_SELF
+
+    DEBOUNCE = 0.2
+
+    @classmethod
+    def create(cls, callback: Callable[[str], None]) -> "InotifyWatcher | None":
+        if not sys.platform.startswith("linux"):
+            return None
+        try:
+            import ctypes
+            libc = ctypes.CDLL(None, use_errno=True)
+            fd = libc.inotify_init1(cls._IN_NONBLOCK | cls._IN_CLOEXEC)
+        except (OSError, AttributeError):
+            return None
+        if fd < 0:
+            return None
+        return cls(libc, fd, callback)
+
+    def __init__(self, libc, fd: int, callback: Callable[[str], None]):
+        self._libc = libc
+        self._fd = fd
+        self._callback = callback
+        self._lock = threading.Lock()
+        self._wd_folder: dict[int, str] = {}
+        self._folder_wd: dict[str, int] = {}
+        self._wake_r, self._wake_w = os.pipe()
+        self._closed = False
+        self._thread = threading.Thread(target=self._run, name="nexus-watch", daemon=True)
+        self._thread.start()
+
+    def set_folders(self, folders) -> None:
+        """감시 대상 폴더 목록 교체 (추가 / 제거된 폴더만 반영)"""
+        wanted = {str(f) for f in folders}
+        with self._lock:
+            for folder in set(self._folder_wd) - wanted:
+                wd = self._folder_wd.pop(folder)
+                self._wd_folder.pop(wd, None)
+                self._libc.inotify_rm_watch(self._fd, wd)
+            for folder in wanted - set(self._folder_wd):
+                wd = self._libc.inotify_add_watch(self._fd, os.fsencode(folder), self._MASK)
+                if wd >= 0:   # 없는 폴더 / 권한 / max_user_watches 초과는 건너뜀
+                    self._folder_wd[folder] = wd
+                    self._wd_folder[wd] = folder
+
+    def close(self):
+        if self._closed:
+            return
+        self._closed = True
+        os.write(self._wake_w, b"x")
+        self._thread.join(timeout=1.0)
+        for fd in (self._fd, self._wake_r, self._wake_w):
+            os.close(fd)
+
+    def _run(self):
+        import select
+        import struct
+        header = struct.Struct("iIII")   # wd, mask, cookie, len
+        pending: set[str] = set()
+        while True:
+            timeout = self.DEBOUNCE if pending else None
+            ready, _, _ = select.select([self._fd, self._wake_r], [], [], timeout)
+            if self._closed:
+                return
+            if not ready:
+                # 조용해지면 모아둔 폴더를 한 번씩 알림
+                for folder in pending:
+                    self._callback(folder)
+                pending.clear()
+                continue
+            if self._fd not in ready:
+                continue
+            try:
+                data = os.read(self._fd, 64 * 1024)
+            except BlockingIOError:
+                continue
+            offset = 0
+            with self._lock:
+                while offset < len(data):
+                    wd, mask, _, length = header.unpack_from(data, offset)
+                    raw = data[offset + header.size: offset + header.size + length]
+                    offset += header.size + length
+                    folder = self._wd_folder.get(wd)
+                    if folder is None:
+                        continue
+                    if mask & self._IN_IGNORED:
+                        # 폴더가 사라져 감시가 해제됨
+                        self._wd_folder.pop(wd, None)
+                        self._folder_wd.pop(folder, None)
+                        pending.add(folder)
+                    elif mask & self._SELF_EVENTS:
+                        pending.add(folder)
+                    else:
+                        name = os.fsdecode(raw.rstrip(b"\0")).lower()
+                        if name.endswith(WATCH_SUFFIXES):
+                            pending.add(folder)
+
+
+# ─────────────────────────────────────────────
+# 볼륨 스캔 (기존 프로젝트 폴더 일괄 등록)
+# ─────────────────────────────────────────────
+# 프로젝트가 아닌 폴더 안에서도 내려가지 않는 이름 (시스템 / 휴지통 / 미디어 캐시)
+_CRAWL_SKIP_DIRS = {
+    "$RECYCLE.BIN", "System Volume Information", "CacheClip", "OptimizedMedia",
+    "ProxyMedia", "Adobe Premiere Pro Auto-Save", "Adobe Premiere Pro Video Previews",
+    "node_modules", "__pycache__",
+}
+
+
+class ProjectCrawler:
+    """
+    루트 폴더(볼륨)를 병렬 scandir로 훑어 project.json이 있는 폴더를 레지스트리에 등록.
+    - project.json이 있는 폴더는 프로젝트로 보고 그 아래로는 내려가지 않음 (미디어 트리 전체 생략)
+    - 숨김 폴더 / 프리셋 미디어 폴더(01_FOOTAGE 등) / 시스템 폴더도 건너뜀
+    - 생성 시각은 project.json의 created_at, 없으면 project.json 파일의 생성(수정) 시각
+    - 찾은 프로젝트는 BATCH개씩 한 트랜잭션으로 등록하고, 남은 탐색 위치를 DATA_DIR에 기록
+      → 중단(cancel / 종료) 후 같은 루트로 다시 실행하면 이어서 탐색
+    - 등록은 register(batch)로 — 기본값 manager.add_many는 스캔 스레드에서 호출되므로,
+      manager를 다른 스레드(UI)도 쓰는 경우 그 스레드로 넘기는 함수를 지정합니다.
+      register가 False를 반환하면 (종료 중 등) 등록하지 못한 것으로 보고 재개 지점을 기록하지 않음.
+    """
+
+    WORKERS = 16
+    BATCH = 500
+    CHECKPOINT_INTERVAL = 2.0   # 초
+
+    def __init__(self, manager: "ProjectManager", roots: list[str],
+                 progress: Callable[[int, int], None] | None = None,
+                 register: Callable[[list[dict]], object] | None = None):
+        self.manager = manager
+        self.roots = sorted({str(Path(r)) for r in roots})
+        self.progress = progress   # (훑은 폴더 수, 새로 등록한 프로젝트 수) — 스캔 스레드에서 호출
+        self.register = register or manager.add_many
+        key = hashlib.sha1("\n".join(self.roots).encode("utf-8")).hexdigest()[:12]
+        self._state_file = manager.DATA_DIR / f"crawl-{key}.json"
+        self._cancel = threading.Event()
+        self._wake = threading.Event()       # 탐색 완료 또는 cancel() → 대기 루프 즉시 종료
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()  # 등록 + 재개 지점 기록 순서 보장
+        self._pending: set[str] = set()     # 아직 다 훑지 않은 폴더 (재개 지점)
+        self._found: list[dict] = []         # 등록 대기
+        # 이미 등록된 프로젝트 폴더 — manager를 만든 스레드에서 미리 떠 둠
+        self._known: set[str] = {
+            str(Path(p["location"]) / p["name"])
+            for p in manager.projects if p.get("location") and p.get("name")
+        }
+        self.scanned = 0
+        self.added = 0
+        self._prune = {"", ".nexus"} | _CRAWL_SKIP_DIRS | {
+            leaf.split("/", 1)[0] for folders in FOLDER_PRESETS.values() for leaf in folders
+        }
+
+    def cancel(self):
+        self._cancel.set()
+        self._wake.set()
+
+    def cancelled(self) -> bool:
+        return self._cancel.is_set()
+
+    def run(self) -> dict:
+        """탐색 → 등록. 반환: {"scanned", "added", "seconds", "resumed", "cancelled"}"""
+        import queue
+
+        t0 = time.perf_counter()
+        start, resumed = self._load_state()
+        work: "queue.Queue[str | None]" = queue.Queue()
+        for d in start:
+            self._pending.add(d)
+            work.put(d)
+
+        workers = [
+            threading.Thread(target=self._worker, args=(work,), name=f"nexus-crawl-{i}", daemon=True)
+            for i in range(self.WORKERS)
+        ]
+        for w in workers:
+            w.start()
+        threading.Thread(target=lambda: (work.join(), self._wake.set()), daemon=True).start()
+
+        while not self._wake.wait(self.CHECKPOINT_INTERVAL):
+            self._checkpoint()
+        for _ in workers:
+            work.put(None)
+
+        cancelled = self._cancel.is_set()
+        for w in workers:
+            w.join(timeout=5.0)
+        self._checkpoint()
+        if not cancelled and not self._found:
+            self._state_file.unlink(missing_ok=True)
+        return {
+            "scanned": self.scanned,
+            "added": self.added,
+            "seconds": round(time.perf_counter() - t0, 3),
+            "resumed": resumed,
+            "cancelled": cancelled,
+        }
+
+    def _load_state(self) -> tuple[list[str], bool]:
+        try:
+            state = json.loads(self._state_file.read_text(encoding="utf-8"))
+            if state.get("roots") == self.roots and state.get("pending"):
+                return state["pending"], True
+        except (OSError, ValueError):
+            pass
+        return list(self.roots), False
+
+    def _worker(self, work):
+        while True:
+            folder = work.get()
+            if folder is None:
+                work.task_done()
+                return
+            try:
+                if not self._cancel.is_set():
+                    self._scan(folder, work)
+            finally:
+                with self._lock:
+                    if not self._cancel.is_set():
+                        self._pending.discard(folder)
+                work.task_done()
+
+    def _scan(self, folder: str, work):
+        subdirs: list[str] = []
+        has_meta = False
+        try:
+            with os.scandir(folder) as it:
+                for entry in it:
+                    if entry.name == "project.json":
+                        has_meta = True
+                    elif (entry.name[0] != "."
+                          and entry.name not in self._prune
+                          and entry.is_dir(follow_symlinks=False)):
+                        subdirs.append(entry.path)
+        except OSError:
+            return
+        project = self._read_project(folder) if has_meta else None
+        with self._lock:
+            self.scanned += 1
+            if project is not None:
+                if folder not in self._known:
+                    self._known.add(folder)
+                    self._found.append(project)
+            else:
+                # 프로젝트 폴더가 아니면 하위 폴더 계속 탐색
+                self._pending.update(subdirs)
+        if project is None:
+            for d in subdirs:
+                work.put(d)
+        if len(self._found) >= self.BATCH:
+            self._flush()
+
+    @staticmethod
+    def _read_project(folder: str) -> dict | None:
+        """project.json → 레지스트리 항목. 위치 / 이름은 실제 폴더 기준 (볼륨 마운트 경로가 바뀌었을 수 있음)"""
+        meta_file = Path(folder, "project.json")
+        try:
+            meta = json.loads(meta_file.read_text(encoding="utf-8"))
+            st = meta_file.stat()
+        except (OSError, ValueError):
+            return None
+        if not isinstance(meta, dict):
+            return None
+        path = Path(folder)
+        project = {k: v for k, v in meta.items() if k != "id"}
+        project["name"] = path.name
+        project["location"] = str(path.parent)
+        project.setdefault("type", "유튜브")
+        if not project.get("created_at"):
+            # project.json은 폴더 구성의 마지막에 기록됨 → 파일 생성(없으면 수정) 시각 ≈ 프로젝트 생성 시각
+            born = getattr(st, "st_birthtime", None) or st.st_mtime
+            project["created_at"] = datetime.fromtimestamp(born).isoformat()
+        return project
+
+    def _flush(self):
+        with self._flush_lock:
+            self._register()
+
+    def _register(self) -> bool:
+        with self._lock:
+            found, self._found = self._found, []
+        if not found:
+            return True
+        if self.register(found) is False:
+            with self._lock:
+                self._found[:0] = found
+            return False
+        with self._lock:
+            self.added += len(found)
+        return True
+
+    def _checkpoint(self):
+        """
+        재개 지점 저장. 폴더 목록을 먼저 떠 두고 등록 대기분을 기록한 뒤 파일에 씀
+        → 재개 지점보다 앞선 프로젝트는 항상 레지스트리에 들어가 있음.
+        """
+        with self._flush_lock:
+            with self._lock:
+                pending = sorted(self._pending)
+            if not self._register():
+                return   # 등록 못 한 프로젝트가 있으면 이전 재개 지점 유지
+            try:
+                atomic_write_text(self._state_file, json.dumps(
+                    {"roots": self.roots, "pending": pending}, ensure_ascii=False
+                ))
+            except OSError as e:
+                print(f"[ERROR] 스캔 진행 상태 기록 실패: {e}")
+        if self.progress:
+            self.progress(self.scanned, self.added)